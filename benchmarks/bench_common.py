@@ -0,0 +1,80 @@
+"""
+Fonctions communes aux scripts de benchmark (chargement des cas et exécution bornée).
+"""
+import glob
+import os
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from algo_x_knuth import AlgorithmX
+from level_loader import build_pieces, load_problem
+from piece_sets import CLASSIC_PIECES
+from plateau import Plateau
+from polyminos_generator import GridPolyminoGenerator
+
+# Répertoire des résultats de benchmark (dans le cache, ignoré par git).
+RESULTS_DIR = os.path.join(ROOT, ".cache", "results")
+
+
+def level_board(path):
+    """
+    Plateau 5x11, pièces classiques et pièces fixées d'un niveau JSON (voir level_loader.load_problem).
+    """
+    return load_problem(path, 5, 11, CLASSIC_PIECES)
+
+
+def bundled_levels():
+    """
+    Retourne la liste des (nom, chemin) des niveaux fournis dans levels/.
+    """
+    paths = sorted(glob.glob(os.path.join(ROOT, "levels", "*.json")))
+    return [(os.path.basename(path), path) for path in paths]
+
+
+def empty_board():
+    """
+    Plateau 5x11 vide avec les pièces classiques (aucune pièce fixée).
+    """
+    return load_problem(None, 5, 11, CLASSIC_PIECES)
+
+
+def generated_board(rows, cols, seed):
+    """
+    Génère un plateau vide et un jeu de polyominos aléatoires (graine fixée).
+    """
+    generator = GridPolyminoGenerator(rows, cols, seed=seed)
+    generator.generate()
+    pieces = build_pieces(generator.get_piece_definitions())
+    return Plateau(rows, cols), pieces, {}
+
+
+def exported_board(path):
+    """
+    Recharge un plateau généré exporté avec GridPolyminoGenerator.save() (plateau vide et ses pièces).
+    """
+    generator = GridPolyminoGenerator.load(path)
+    pieces = build_pieces(generator.get_piece_definitions())
+    return Plateau(generator.rows, generator.cols), pieces, {}
+
+
+def run(plateau, pieces, fixed_pieces, budget=None, heuristic="descender", **options):
+    """
+    Lance une résolution, éventuellement interrompue après `budget` secondes.
+
+    Paramètres:
+    - options: Paramètres supplémentaires d'AlgorithmX (engine, search, ...).
+
+    Retourne:
+    - dict: Statistiques finales de l'algorithme.
+    """
+    algo = AlgorithmX(plateau, pieces, heuristic, fixed_pieces, **options)
+    thread = threading.Thread(target=algo.solve, daemon=True)
+    thread.start()
+    thread.join(budget)
+    if thread.is_alive():
+        algo.request_stop()
+        thread.join()
+    return algo.get_stats()
@@ -0,0 +1,43 @@
+"""
+Benchmark de la sélection de colonne MRV du moteur "matrix":
+comparaison entre le recomptage complet à chaque noeud (avant) et
+les compteurs maintenus de façon incrémentale (après).
+
+Utilisation:
+    python benchmarks/bench_mrv.py [--budget SECONDES] [--seed N]
+
+- Les niveaux de levels/ sont résolus entièrement (temps total).
+- Des plateaux générés 60x5 et 60x6 sont explorés pendant un budget de temps
+  fixe (noeuds explorés par seconde), car leur résolution complète est trop longue.
+"""
+import argparse
+from functools import partial
+
+import bench_common
+import algo_x_knuth
+from matrix_engine import MatrixEngine
+
+algo_x_knuth.ENGINES["matrix-recount"] = partial(MatrixEngine, incremental_counts=False)
+VARIANTS = [("avant (recomptage)", "matrix-recount"), ("après (incrémental)", "matrix")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=10.0, help="Budget (s) par plateau généré.")
+    parser.add_argument("--seed", type=int, default=1, help="Graine des plateaux générés.")
+    args = parser.parse_args()
+
+    print(f"{'cas':<16}{'variante':<22}{'temps (s)':>10}{'noeuds':>10}{'noeuds/s':>12}")
+    cases = [(name, bench_common.level_board(path), None) for name, path in bench_common.bundled_levels()]
+    cases += [(f"{c}x{r} (seed {args.seed})", bench_common.generated_board(r, c, args.seed), args.budget)
+              for r, c in [(5, 60), (6, 60)]]
+    for name, (plateau, pieces, fixed_pieces), budget in cases:
+        for label, engine in VARIANTS:
+            stats = bench_common.run(plateau, pieces, fixed_pieces, budget, engine=engine)
+            nodes = stats["branches_explored"]
+            rate = nodes / stats["time"] if stats["time"] else 0
+            print(f"{name:<16}{label:<22}{stats['time']:>10.3f}{nodes:>10}{rate:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Benchmark du mode de parcours: récursif (algorithm_x) contre itératif à pile explicite
+(algorithm_x_iterative), pour chaque moteur de couverture exacte.
+
+Utilisation:
+    python benchmarks/bench_search.py [--budget SECONDES] [--seed N] [--engines dlx,bitset,matrix]
+
+- Les niveaux de levels/ sont résolus entièrement.
+- Des plateaux générés 12x12, 16x10 et 60x6 sont explorés pendant un budget de temps fixe.
+Le débit est mesuré en noeuds explorés par seconde.
+"""
+import argparse
+
+import bench_common
+
+MODES = ["recursive", "iterative"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=10.0, help="Budget (s) par plateau généré.")
+    parser.add_argument("--seed", type=int, default=1, help="Graine des plateaux générés.")
+    parser.add_argument("--engines", default="dlx,bitset,matrix", help="Moteurs à comparer.")
+    args = parser.parse_args()
+
+    print(f"{'cas':<16}{'moteur':<8}{'parcours':<11}{'temps (s)':>10}{'noeuds':>10}{'noeuds/s':>12}")
+    cases = [(name, bench_common.level_board(path), None) for name, path in bench_common.bundled_levels()]
+    cases += [(f"{c}x{r} (seed {args.seed})", bench_common.generated_board(r, c, args.seed), args.budget)
+              for r, c in [(12, 12), (10, 16), (6, 60)]]
+    for name, (plateau, pieces, fixed_pieces), budget in cases:
+        for engine in args.engines.split(","):
+            for search in MODES:
+                stats = bench_common.run(plateau, pieces, fixed_pieces, budget, engine=engine, search=search)
+                nodes = stats["branches_explored"]
+                rate = nodes / stats["time"] if stats["time"] else 0
+                print(f"{name:<16}{engine:<8}{search:<11}{stats['time']:>10.3f}{nodes:>10}{rate:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Suite de benchmark reproductible: chaque heuristique (calculate_piece_weights) et chaque
+moteur de couverture exacte sur un corpus fixe, avec comparaison à une référence.
+
+Utilisation:
+    python benchmarks/bench_suite.py [--budget SECONDES] [--seed N] [--output results.json]
+                                     [--engines dlx,bitset] [--heuristics descender,ascender]
+                                     [--cases lvl1.json,12x12] [--baseline baseline.json]
+                                     [--save-baseline baseline.json] [--tolerance 0.2]
+                                     [--boards dossier/] [--cache cold|warm]
+
+Corpus: les niveaux de levels/, le plateau 5x11 vide (pièces classiques) et des plateaux
+générés (GridPolyminoGenerator, graine fixée): 5x11, 12x12, 16x10 et 60x6 (voir GENERATED_BOARDS).
+--boards ajoute les plateaux exportés avec GridPolyminoGenerator.save() (*.json) d'un dossier,
+par exemple des cas lents à rejouer à l'identique.
+Chaque exécution est bornée par --budget secondes et a lieu dans un sous-processus neuf, ce qui
+permet de mesurer son pic de mémoire (RSS).
+
+Les caches sur disque du solveur (tables de pavage, tables des placements, voir disk_cache) ne
+sont jamais ceux du dépôt: chaque sous-processus reçoit son répertoire via IQ_SOLVER_CACHE_DIR.
+- --cache cold (par défaut): un répertoire vide et neuf pour chaque exécution, qui mesure donc
+  aussi le calcul des tables; les mesures ne dépendent pas de l'ordre des exécutions.
+- --cache warm: un répertoire commun, rempli d'abord par une passe de préchauffage non mesurée
+  (toutes les exécutions une fois), puis les mesures: toutes voient le même cache complet.
+Le mode et, en mode warm, les fichiers du cache préchauffé sont enregistrés dans le rapport.
+
+Mesures par exécution: statut (solved, unsolvable, stopped), noeuds explorés, noeuds/s, temps
+jusqu'à la première solution, taux de pruning (branches coupées / placements testés) et pic RSS.
+Elles sont écrites au format JSON dans --output (par défaut .cache/results/bench_results.json,
+ignoré par git).
+
+Avec --baseline, chaque exécution est comparée à la même exécution (cas, moteur, heuristique)
+de la référence; sont signalés comme régressions:
+- un cas résolu dans la référence et plus maintenant;
+- un temps jusqu'à la première solution ou un pic RSS plus grand de plus de --tolerance;
+- un débit (noeuds/s) plus faible de plus de --tolerance.
+Le code de sortie vaut alors 1 (utilisable en intégration continue). Les mesures de temps
+dépendent de la machine: la référence doit être produite sur la même machine (--save-baseline).
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import bench_common
+from algo_x_knuth import AlgorithmX, ENGINES, HEURISTICS
+
+try:
+    import resource
+except ImportError:  # Windows: pas de mesure du pic RSS
+    resource = None
+
+# Plateaux générés du corpus: (nom, lignes, colonnes).
+GENERATED_BOARDS = [("5x11", 5, 11), ("12x12", 12, 12), ("16x10", 10, 16), ("60x6", 6, 60)]
+
+# En dessous de cet écart (secondes), une différence de temps n'est pas une régression (bruit).
+TIME_NOISE_FLOOR = 0.05
+
+# État des caches sur disque pendant les mesures (voir --cache).
+CACHE_MODES = ("cold", "warm")
+
+
+def corpus(seed, boards_dir=None):
+    """
+    Retourne la liste des cas du corpus: dictionnaires {'case', 'kind', ...} sérialisables,
+    transmis aux sous-processus.
+    """
+    cases = [{"case": name, "kind": "level", "path": path} for name, path in bench_common.bundled_levels()]
+    cases.append({"case": "empty", "kind": "empty"})
+    cases += [
+        {"case": name, "kind": "generated", "rows": rows, "cols": cols, "seed": seed}
+        for name, rows, cols in GENERATED_BOARDS
+    ]
+    if boards_dir:
+        cases += [
+            {"case": os.path.basename(path), "kind": "exported", "path": path}
+            for path in sorted(glob.glob(os.path.join(boards_dir, "*.json")))
+        ]
+    return cases
+
+
+def build_case(case):
+    """
+    Construit (plateau, pièces, pièces fixées) d'un cas du corpus.
+    """
+    if case["kind"] == "level":
+        return bench_common.level_board(case["path"])
+    if case["kind"] == "empty":
+        return bench_common.empty_board()
+    if case["kind"] == "exported":
+        return bench_common.exported_board(case["path"])
+    return bench_common.generated_board(case["rows"], case["cols"], case["seed"])
+
+
+def peak_rss_kb():
+    """
+    Pic de mémoire résidente du processus courant, en Ko (None si non disponible).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS: octets, Linux: Ko
+
+
+def measure(spec):
+    """
+    Exécute une résolution bornée et retourne ses mesures (appelée dans le sous-processus).
+
+    Paramètres:
+    - spec (dict): {'case': cas du corpus, 'engine', 'heuristic', 'budget'}.
+    """
+    plateau, pieces, fixed_pieces = build_case(spec["case"])
+    algo = AlgorithmX(plateau, pieces, spec["heuristic"], fixed_pieces, spec["engine"])
+    solutions = algo.solve(timeout=spec["budget"])
+    stats = algo.get_stats()
+    if solutions:
+        status = "solved"
+    else:
+        status = "stopped" if algo.stop_requested else "unsolvable"
+    return {
+        "case": spec["case"]["case"],
+        "engine": spec["engine"],
+        "heuristic": spec["heuristic"],
+        "status": status,
+        "time": stats["time"],
+        "nodes": stats["branches_explored"],
+        "nodes_per_sec": stats["branches_explored"] / stats["time"] if stats["time"] else 0.0,
+        "time_to_first_solution": stats["time"] if solutions else None,
+        "pruning_rate": stats["branches_pruned"] / stats["placements_testes"] if stats["placements_testes"] else 0.0,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def run_isolated(spec, cache_dir):
+    """
+    Lance measure() dans un sous-processus neuf (pic RSS propre à l'exécution).
+
+    Paramètres:
+    - cache_dir (str): Répertoire des caches sur disque du sous-processus (IQ_SOLVER_CACHE_DIR).
+    """
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker"],
+        input=json.dumps(spec), capture_output=True, text=True, check=True,
+        env=dict(os.environ, IQ_SOLVER_CACHE_DIR=cache_dir)
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_cold(spec):
+    """
+    Lance une exécution avec un répertoire de cache vide, supprimé ensuite.
+    """
+    with tempfile.TemporaryDirectory(prefix="iq-bench-cache-") as cache_dir:
+        return run_isolated(spec, cache_dir)
+
+
+def cache_files(cache_dir):
+    """
+    Retourne {nom: taille en octets} des fichiers d'un répertoire de cache.
+    """
+    return {
+        name: os.path.getsize(os.path.join(cache_dir, name))
+        for name in sorted(os.listdir(cache_dir))
+    }
+
+
+def run_key(result):
+    return result["case"], result["engine"], result["heuristic"]
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    Compare les résultats à la référence.
+
+    Retourne:
+    - list: Messages décrivant chaque régression.
+    """
+    reference = {run_key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        ref = reference.get(run_key(result))
+        if ref is None:
+            continue
+        name = "/".join(run_key(result))
+        if ref["status"] == "solved" and result["status"] != "solved":
+            regressions.append(f"{name}: {result['status']} (solved in baseline)")
+            continue
+        before, after = ref["time_to_first_solution"], result["time_to_first_solution"]
+        if before is not None and after is not None \
+                and after > before * (1 + tolerance) and after - before > TIME_NOISE_FLOOR:
+            regressions.append(f"{name}: first solution {after:.3f}s (baseline {before:.3f}s)")
+        if result["nodes_per_sec"] < ref["nodes_per_sec"] * (1 - tolerance) and result["time"] > TIME_NOISE_FLOOR:
+            regressions.append(f"{name}: {result['nodes_per_sec']:.1f} nodes/s (baseline {ref['nodes_per_sec']:.1f})")
+        before, after = ref["peak_rss_kb"], result["peak_rss_kb"]
+        if before and after and after > before * (1 + tolerance):
+            regressions.append(f"{name}: peak RSS {after} KB (baseline {before} KB)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=5.0, help="Budget (s) par exécution.")
+    parser.add_argument("--seed", type=int, default=1, help="Graine des plateaux générés.")
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Moteurs à mesurer.")
+    parser.add_argument("--heuristics", default=",".join(HEURISTICS), help="Heuristiques à mesurer.")
+    parser.add_argument("--boards", default=None, help="Dossier de plateaux générés exportés à ajouter au corpus.")
+    parser.add_argument("--cases", default=None, help="Cas à mesurer (par défaut, tout le corpus).")
+    parser.add_argument("--output", default=os.path.join(bench_common.RESULTS_DIR, "bench_results.json"),
+                        help="Fichier des résultats (JSON).")
+    parser.add_argument("--baseline", default=None, help="Référence à laquelle comparer les résultats.")
+    parser.add_argument("--save-baseline", default=None, help="Enregistre aussi les résultats comme référence.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Écart relatif toléré (0.2 = 20%%).")
+    parser.add_argument("--cache", choices=CACHE_MODES, default="cold",
+                        help="Caches sur disque vides pour chaque exécution (cold) ou préchauffés (warm).")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(json.load(sys.stdin))))
+        return 0
+
+    cases = corpus(args.seed, args.boards)
+    if args.cases:
+        wanted = set(args.cases.split(","))
+        cases = [case for case in cases if case["case"] in wanted]
+
+    specs = [
+        {"case": case, "engine": engine, "heuristic": heuristic, "budget": args.budget}
+        for case in cases
+        for engine in args.engines.split(",")
+        for heuristic in args.heuristics.split(",")
+    ]
+    with tempfile.TemporaryDirectory(prefix="iq-bench-cache-") as warm_dir:
+        warm_cache = None
+        if args.cache == "warm":
+            print("Préchauffage des caches...")
+            for spec in specs:
+                run_isolated(spec, warm_dir)
+            warm_cache = cache_files(warm_dir)
+
+        print(f"{'cas':<12}{'moteur':<8}{'heuristique':<21}{'statut':<11}{'noeuds/s':>11}"
+              f"{'1re sol. (s)':>13}{'pruning':>9}{'RSS (Ko)':>10}")
+        results = []
+        for spec in specs:
+            result = run_isolated(spec, warm_dir) if args.cache == "warm" else run_cold(spec)
+            results.append(result)
+            first = result["time_to_first_solution"]
+            print(f"{result['case']:<12}{spec['engine']:<8}{spec['heuristic']:<21}{result['status']:<11}"
+                  f"{result['nodes_per_sec']:>11.1f}{first if first is not None else float('nan'):>13.3f}"
+                  f"{result['pruning_rate']:>9.2f}{result['peak_rss_kb'] or 0:>10}")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "budget": args.budget,
+        "seed": args.seed,
+        "cache": args.cache,
+        "cache_files": warm_cache,
+        "results": results,
+    }
+    for path in filter(None, [args.output, args.save_baseline]):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("cache", "cold") != args.cache:
+            print(f"Attention: référence mesurée avec --cache {baseline.get('cache', 'cold')}, "
+                  f"résultats avec --cache {args.cache}")
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for message in regressions:
+            print("REGRESSION", message)
+        if regressions:
+            return 1
+        print("Aucune régression par rapport à", args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,30 @@
-from algorithm_stats import AlgorithmStats
+from algorithm_stats import AlgorithmStats, DEFAULT_RECORD_CAPACITY
 from constraint_matrix_builder import ConstraintMatrixBuilder
-from zone_checker import ZoneChecker
+from zone_checker import ZoneChecker, ZoneCache
+from tiling_table import TilingTable
+from parity_pruner import ParityPruner
+from symmetry import BoardSymmetry
+from placement_table import PlacementTable
+from cancellation import CancellationToken, CHECK_INTERVAL
 from solution_validator import SolutionValidator
+from matrix_engine import MatrixEngine
+from dancing_links import DancingLinks
+from bitset_engine import BitsetEngine
 import numpy as np
 
+# Moteurs de couverture exacte disponibles (sélectionnables via le paramètre engine).
+ENGINES = {
+    "matrix": MatrixEngine,
+    "dlx": DancingLinks,
+    "bitset": BitsetEngine,
+}
+
+# Heuristiques d'ordre des pièces disponibles (voir calculate_piece_weights).
+HEURISTICS = (
+    "ascender", "descender", "compactness", "compactness_inverse",
+    "perimeter", "perimeter_inverse", "holes", "holes_inverse",
+)
+
 class AlgorithmX:
     """
     Implémentation de l'algorithme X de Knuth pour résoudre un problème de couverture exacte.
@@ -14,7 +35,14 @@ class AlgorithmX:
     - Séparation des responsabilités en plusieurs classes (pour la matrice, la validation, etc.).
     - Statistiques avancées (branches explorées, prunings, profondeur, temps).
     - Suppression de dépendances à une interface graphique.
-    - Possibilité de stopper l'algorithme via request_stop().
+    - Possibilité de stopper l'algorithme via request_stop(), un délai, une limite de noeuds
+      ou un signal partagé entre processus (voir cancellation).
+    - Moteur de couverture exacte interchangeable (Dancing Links par défaut).
+    - Parcours récursif ou itératif (pile explicite, reprise possible depuis une pile sauvegardée).
+    - Énumération paresseuse de toutes les solutions (solve_all) et comptage (count_solutions).
+    - Recherche parallèle sur plusieurs processus avec vol de travail (solve_parallel).
+    - Cassage des symétries du plateau (voir BoardSymmetry): chaque famille de solutions
+      symétriques n'est explorée qu'une fois; l'énumération reconstitue les autres.
 
     Paramètres:
     - plateau (Plateau): Plateau du puzzle.
@@ -22,17 +50,65 @@ class AlgorithmX:
     - heuristic_ascender (bool): Choix d'heuristique sur les poids des pièces.
       True: pièces plus "petites" prioritaires. False: pièces plus "grandes" prioritaires.
     - fixed_pieces (dict): Pièces déjà placées (variante et position), optionnel.
+    - engine (str): Moteur de couverture exacte, "dlx" (Dancing Links), "bitset" (masques de bits)
+      ou "matrix" (liste de dictionnaires).
+    - search (str): Mode de parcours, "recursive" ou "iterative" (pile explicite).
+    - record_steps (bool): Enregistre les étapes intermédiaires (désactivé par défaut).
+    - record_capacity (int): Nombre maximal d'étapes intermédiaires conservées.
+    - shape_pruning (bool): Teste la forme des petites zones vides (table de pavage
+      mise en cache sur disque), en plus de leur taille.
+    - parity_pruning (bool): Ajoute le pruning par coloriage (damier et bandes, voir ParityPruner).
+    - stop_signal (StopSignal): Signal d'arrêt partagé avec d'autres processus, optionnel:
+      la recherche s'arrête dès qu'il est levé.
+    - symmetry_breaking (bool): Restreint une pièce à une variante par classe de symétrie
+      du plateau (activé par défaut).
+    - placement_cache (bool): Construit la matrice à partir des placements précalculés
+      du plateau vide (table mise en cache sur disque, voir PlacementTable).
     """
-    def __init__(self, plateau, pieces, heuristic="ascender", fixed_pieces=None):
+    def __init__(self, plateau, pieces, heuristic="ascender", fixed_pieces=None, engine="dlx",
+                 search="recursive", record_steps=False, record_capacity=DEFAULT_RECORD_CAPACITY,
+                 shape_pruning=True, parity_pruning=True, stop_signal=None, symmetry_breaking=True,
+                 placement_cache=True):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if search not in ("recursive", "iterative"):
+            raise ValueError(f"Unknown search mode: {search}")
         self.plateau = plateau
         self.pieces = pieces
+        self.heuristic = heuristic
         self.fixed_pieces = fixed_pieces if fixed_pieces else {}
         self.solutions = []
-        self.zone_cache = {}
+        self.zone_cache = ZoneCache()  # Partagé entre les recherches (clé indépendante de la branche).
+        self.shape_pruning = shape_pruning
+        self.tiling_table = TilingTable.load(pieces) if shape_pruning else None
+        self.parity_pruning = parity_pruning
+        self.symmetry_breaking = symmetry_breaking
+        self.placement_cache = placement_cache
+        self.symmetry = None  # BoardSymmetry de la recherche courante (voir build_engine).
+        self.pruners = []  # Tests de coupure de la recherche courante (voir build_engine).
         self.invalid_placements = {}
         self.stop_requested = False
+        # Annulation coopérative: le jeton est interrogé tous les CHECK_INTERVAL noeuds
+        # (voir should_stop), check_countdown noeuds restant avant la prochaine interrogation.
+        self.stop_signal = stop_signal
+        self.cancel_token = CancellationToken(signal=stop_signal)
+        self.cancel_start_nodes = 0
+        self.check_countdown = CHECK_INTERVAL
+        self.progress = None  # ProgressPublisher, optionnel (voir should_stop).
+        self.engine = engine
+        self.search = search
+        self.search_stack = None  # Pile du dernier parcours itératif (voir save_search_state).
+        self.store_solutions = True  # False pendant solve_all()/count_solutions().
+        self.count_only = False  # True pendant count_solutions().
+        # Vol de travail (recherche parallèle): quand steal_requested est levé, le parcours
+        # itératif cède une partie de sa pile à donate() (voir split_search_stack).
+        self.steal_requested = False
+        self.donate = None
+        self.sizes_match_board = (
+            sum(int(np.count_nonzero(p.forme_base)) for p in pieces.values()) == plateau.lignes * plateau.colonnes
+        )
         self.piece_weights = self.calculate_piece_weights(heuristic)
-        self.stats = AlgorithmStats()
+        self.stats = AlgorithmStats(record_steps, record_capacity)
         self.stats.reset_stats()
         self.stats.start_timer()
 
@@ -40,8 +116,68 @@ class AlgorithmX:
         """
         Demande l'arrêt de l'algorithme (le stop sera pris en compte dans la prochaine itération).
         """
+        self.cancel_token.cancel("requested")
         self.stop_requested = True
 
+    def start_cancellation(self, timeout=None, node_limit=None, node_counter=None):
+        """
+        Arme les conditions d'arrêt d'une recherche (un arrêt déjà demandé est conservé).
+
+        Paramètres:
+        - timeout (float): Délai maximal en secondes, optionnel.
+        - node_limit (int): Nombre maximal de placements testés, optionnel.
+        - node_counter (multiprocessing.Value): Compteur partagé pour une limite globale
+          à plusieurs processus, optionnel.
+        """
+        if self.stop_requested:
+            return
+        self.cancel_token = CancellationToken(timeout, node_limit, self.stop_signal, node_counter)
+        self.cancel_start_nodes = self.stats.placements_testes
+        self.check_countdown = 1  # Première vérification dès le premier noeud
+
+    def should_stop(self):
+        """
+        Test d'arrêt appelé à chaque noeud: le jeton d'annulation n'est interrogé que tous
+        les CHECK_INTERVAL noeuds (au plus), le reste du temps seul stop_requested est lu.
+        La progression est publiée au même rythme (si un ProgressPublisher est attaché).
+        """
+        if self.stop_requested:
+            return True
+        if not self.cancel_token.active and self.progress is None:
+            return False
+        self.check_countdown -= 1
+        if self.check_countdown > 0:
+            return False
+        if self.progress is not None:
+            self.progress.tick(self.stats)
+        return self.poll_cancellation()
+
+    def poll_cancellation(self):
+        """
+        Interroge immédiatement le jeton d'annulation.
+
+        Retourne:
+        - bool: True si la recherche doit s'arrêter.
+        """
+        token = self.cancel_token
+        nodes = self.stats.placements_testes - self.cancel_start_nodes
+        if token.poll(nodes):
+            self.stop_requested = True
+            return True
+        self.check_countdown = CHECK_INTERVAL
+        if token.node_limit is not None and token.node_counter is None:
+            # Limite locale: la vérification tombe exactement sur la limite
+            self.check_countdown = max(1, min(CHECK_INTERVAL, token.node_limit - nodes))
+        return False
+
+    def finish_cancellation(self):
+        """
+        Enregistre dans les statistiques la raison et la latence d'un arrêt prématuré,
+        une fois la recherche effectivement arrêtée.
+        """
+        if self.stop_requested and self.cancel_token.is_cancelled():
+            self.stats.record_stop(self.cancel_token.reason, self.cancel_token.stop_latency())
+
     def get_stats(self):
         """
         Retourne les statistiques actuelles de l'algorithme.
@@ -54,11 +190,18 @@ class AlgorithmX:
 
     def get_current_solution_steps(self):
         """
-        Retourne les étapes de la dernière solution trouvée.
+        Retourne les étapes de la branche copiée à la dernière publication: dernière
+        solution trouvée, fin de la recherche ou dernier événement de progression.
         Chaque étape est un placement de pièce.
         """
         return self.stats.get_current_solution_steps()
 
+    def get_intermediate_steps(self):
+        """
+        Retourne les étapes intermédiaires enregistrées (si record_steps est actif).
+        """
+        return self.stats.get_intermediate_steps()
+
     def get_solutions(self):
         """
         Retourne la liste complète des solutions trouvées.
@@ -128,34 +271,226 @@ class AlgorithmX:
 
 
 
-    def solve(self):
+    def solve(self, resume_state=None, workers=None, timeout=None, node_limit=None):
         """
         Lance le processus de résolution en construisant la matrice de contraintes,
-        puis en appelant la méthode algorithm_x pour parcourir les possibilités.
+        puis en appelant la méthode algorithm_x (ou algorithm_x_iterative) pour parcourir
+        les possibilités avec le moteur de couverture exacte choisi.
+
+        Paramètres:
+        - resume_state (list): État retourné par save_search_state(), optionnel.
+          Le parcours reprend alors là où il s'était arrêté, toujours en mode itératif
+          (un état vide est celui d'un parcours terminé: aucune solution n'est trouvée).
+          Seul un parcours itératif peut être repris: pour interrompre une recherche
+          (timeout, node_limit, request_stop()) puis la reprendre, il faut créer
+          l'AlgorithmX avec search="iterative" (ou utiliser solve_all()/count_solutions(),
+          toujours itératifs).
+        - workers (int): Si fourni, la recherche est répartie sur ce nombre de processus
+          (voir solve_parallel).
+        - timeout (float): Délai maximal de la recherche en secondes, optionnel.
+        - node_limit (int): Nombre maximal de placements testés, optionnel.
 
         Retourne:
         - solutions (list): Liste des solutions complètes trouvées.
         """
-        builder = ConstraintMatrixBuilder(self.plateau, self.pieces, self.piece_weights, self.fixed_pieces)
-        matrix, header = builder.create_constraint_matrix()
+        if workers is not None:
+            return self.solve_parallel(workers, timeout=timeout, node_limit=node_limit)
+        if resume_state is not None:
+            self.stop_requested = False
+        self.start_cancellation(timeout, node_limit)
+        engine, matrix = self.build_engine()
         solution = []
-        self.algorithm_x(matrix, header, solution)
+        if resume_state is not None:
+            stack = self.restore_search_state(resume_state, engine, matrix, solution)
+            self.algorithm_x_iterative(engine, matrix, solution, stack)
+        elif self.search == "iterative":
+            self.algorithm_x_iterative(engine, matrix, solution)
+        else:
+            self.search_stack = None  # Parcours récursif: pas d'état à reprendre
+            self.algorithm_x(engine, matrix, solution)
+        self.stats.snapshot_current_solution_steps()
+        self.finish_cancellation()
+        self.save_tiling_table()
         return self.solutions
 
-    def algorithm_x(self, matrix, header, solution):
+    def solve_parallel(self, workers=None, split_depth=None, max_solutions=1, timeout=None, node_limit=None):
+        """
+        Recherche parallèle: l'arbre est développé jusqu'à split_depth, puis les sous-arbres
+        obtenus sont répartis entre des processus; un processus inoccupé récupère une partie
+        du travail restant d'un processus occupé (vol de travail). Les statistiques de tous
+        les processus sont cumulées dans celles de l'algorithme.
+
+        Paramètres:
+        - workers (int): Nombre de processus (par défaut, le nombre de coeurs).
+        - split_depth (int): Profondeur de découpage initial (voir parallel_search).
+        - max_solutions (int): Nombre de solutions à trouver (1: première solution,
+          None: toutes les solutions).
+        - timeout (float): Délai maximal de la recherche en secondes, optionnel.
+        - node_limit (int): Nombre maximal de placements testés, tous processus confondus.
+
+        Retourne:
+        - solutions (list): Liste des solutions trouvées.
+        """
+        # Import local: parallel_search importe ce module (processus de résolution)
+        from parallel_search import ParallelSearch, DEFAULT_SPLIT_DEPTH
+        if split_depth is None:
+            split_depth = DEFAULT_SPLIT_DEPTH
+        ParallelSearch(self, workers, split_depth, max_solutions, timeout=timeout, node_limit=node_limit).run()
+        if max_solutions != 1 and self.symmetry is not None and self.symmetry.order > 1:
+            # Énumération: les solutions symétriques des solutions trouvées sont reconstituées
+            expanded = []
+            for solution in self.solutions:
+                expanded.append(solution)
+                expanded.extend(self.symmetry.images(solution))
+            self.solutions = expanded[:max_solutions] if max_solutions is not None else expanded
+        return self.solutions
+
+    def worker_options(self):
+        """
+        Paramètres d'AlgorithmX à transmettre aux processus d'une recherche parallèle.
+        """
+        return {
+            "engine": self.engine,
+            "shape_pruning": self.shape_pruning,
+            "parity_pruning": self.parity_pruning,
+            "symmetry_breaking": self.symmetry_breaking,
+            "placement_cache": self.placement_cache,
+        }
+
+    def solve_all(self, max_solutions=None, timeout=None, node_limit=None):
+        """
+        Générateur énumérant toutes les solutions, de façon paresseuse:
+        chaque solution est produite dès qu'elle est trouvée, puis la recherche reprend
+        là où elle s'était arrêtée. Les solutions ne sont pas accumulées dans self.solutions.
+
+        Paramètres:
+        - max_solutions (int): Nombre maximal de solutions à produire (None = toutes).
+        - timeout (float), node_limit (int): Limites de la recherche, optionnelles (voir solve).
+
+        Produit:
+        - list: Une solution complète (liste de placements).
+        """
+        for solution in self.iterate_solutions(max_solutions, False, timeout, node_limit):
+            yield solution.copy()
+
+    def count_solutions(self, max_solutions=None, timeout=None, node_limit=None):
+        """
+        Compte les solutions sans construire d'objet par solution
+        (ni copie, ni validation complète: une branche complète utilisant toutes les pièces
+        sans chevauchement est forcément une solution si les tailles concordent).
+
+        Paramètres:
+        - max_solutions (int): Arrête le comptage à cette valeur (None = toutes).
+        - timeout (float), node_limit (int): Limites de la recherche, optionnelles (voir solve).
+
+        Retourne:
+        - int: Nombre de solutions trouvées.
+        """
+        count = 0
+        for _ in self.iterate_solutions(max_solutions, True, timeout, node_limit):
+            count += 1
+        return count
+
+    def iterate_solutions(self, max_solutions=None, count_only=False, timeout=None, node_limit=None):
+        """
+        Parcourt l'arbre de recherche avec algorithm_x_iterative en reprenant la pile
+        après chaque solution. Produit la liste `solution` courante (non copiée), puis
+        ses images par les symétries du plateau (voir BoardSymmetry.images); en mode
+        comptage, les images ne sont pas construites.
+        """
+        self.start_cancellation(timeout, node_limit)
+        engine, matrix = self.build_engine()
+        solution = []
+        stack = None
+        found = 0
+        self.store_solutions = False
+        self.count_only = count_only
+        try:
+            while max_solutions is None or found < max_solutions:
+                if not self.algorithm_x_iterative(engine, matrix, solution, stack):
+                    break
+                found += 1
+                yield solution
+                if self.symmetry is not None and self.symmetry.order > 1:
+                    images = [solution] * (self.symmetry.order - 1) if count_only else self.symmetry.images(solution)
+                    for image in images:
+                        if max_solutions is not None and found >= max_solutions:
+                            break
+                        found += 1
+                        yield image
+                stack = self.search_stack
+        finally:
+            self.store_solutions = True
+            self.count_only = False
+            self.stats.snapshot_current_solution_steps()
+            self.finish_cancellation()
+            self.stats.stop_timer()
+            self.save_tiling_table()
+
+    def build_engine(self):
+        """
+        Construit la matrice de contraintes, le moteur de couverture exacte
+        et le vérificateur de zones de la recherche.
+
+        Retourne:
+        - engine: Moteur de couverture exacte prêt pour la recherche.
+        - matrix (list): Liste des placements, indexée par 'id'.
+        """
+        allowed_variants = None
+        if self.symmetry_breaking:
+            self.symmetry = BoardSymmetry(self.plateau, self.pieces, self.fixed_pieces)
+            allowed_variants = self.symmetry.allowed_variants
+        placement_table = None
+        if self.placement_cache:
+            placement_table = PlacementTable.load(self.plateau.lignes, self.plateau.colonnes, self.pieces)
+        builder = ConstraintMatrixBuilder(self.plateau, self.pieces, self.piece_weights, self.fixed_pieces,
+                                          allowed_variants, placement_table)
+        matrix, header = builder.create_constraint_matrix()
+        self.zone_checker = ZoneChecker(self.plateau, self.pieces, self.zone_cache, self.stats,
+                                        self.tiling_table)
+        # Pruners: mis à jour à chaque placement (push/pop) et interrogés via should_prune(),
+        # du moins coûteux au plus coûteux
+        self.pruners = []
+        if self.parity_pruning:
+            self.pruners.append(ParityPruner(self.plateau, self.pieces, self.fixed_pieces,
+                                            builder.arrays))
+        self.pruners.append(self.zone_checker)
+        return self.create_engine(matrix, builder.index), matrix
+
+    def save_tiling_table(self):
+        """
+        Enregistre sur disque les formes de zones calculées pendant la recherche.
+        """
+        if self.tiling_table is not None:
+            self.tiling_table.save()
+
+    def create_engine(self, matrix, index):
+        """
+        Instancie le moteur de couverture exacte demandé (voir ENGINES).
+
+        Paramètres:
+        - matrix (list): Liste des placements possibles.
+        - index (SparseIndex): Index creux de la matrice (colonne -> lignes, ligne -> colonnes).
+
+        Retourne:
+        - Moteur exposant select_min_column(), rows_for_column(), select_row() et deselect_row().
+        """
+        return ENGINES[self.engine](matrix, index)
+
+    def algorithm_x(self, engine, matrix, solution):
         """
         Méthode récursive qui implémente l'algorithme X:
-        1. Si la matrice est vide, on valide la solution. Si valide, on la stocke.
+        1. Si toutes les contraintes sont satisfaites, on valide la solution. Si valide, on la stocke.
         2. Sinon, on choisit la colonne la plus contraignante (peu d'options).
         3. Pour chaque ligne (placement) qui couvre cette colonne, on sélectionne
-           ce placement, on met à jour la matrice (on "couvre" les colonnes correspondantes),
+           ce placement, le moteur "couvre" les colonnes correspondantes,
            puis on appelle récursivement algorithm_x.
         4. Si l'on trouve une solution complète, on peut s'arrêter ou continuer
            pour trouver toutes les solutions (selon les besoins).
 
         Paramètres:
-        - matrix (list): Matrice actuelle de contraintes.
-        - header (list): En-tête de la matrice (nom des colonnes).
+        - engine: Moteur de couverture exacte (état courant de la matrice).
+        - matrix (list): Liste complète des placements, indexée par 'id'.
         - solution (list): Liste des placements choisis jusqu'ici.
 
         Retourne:
@@ -166,29 +501,18 @@ class AlgorithmX:
         self.stats.increment_branches_explored()
         self.stats.increment_depth()
 
-        if not matrix:
-            validator = SolutionValidator(self.pieces, self.plateau)
-            if validator.validate_solution(solution):
-                self.solutions.append(solution.copy())
-                self.stats.add_solution(solution)
-                self.stats.decrement_depth()
-                self.stats.stop_timer()
-                return True
-            self.stats.decrement_depth()
-            return False
-
-        column = self.select_min_column(matrix, header)
+        column = engine.select_min_column()
         if column is None:
             self.stats.decrement_depth()
-            return False
+            return self.accept_solution(solution)
 
-        rows_to_cover = [row for row in matrix if row['row'][column] == 1]
+        rows_to_cover = [matrix[row_id] for row_id in engine.rows_for_column(column)]
         rows_to_cover = self.prioritize_rows(rows_to_cover)
 
-        checker = ZoneChecker(self.plateau, self.pieces, self.zone_cache)
+        pruners = self.pruners
 
         for row in rows_to_cover:
-            if self.stop_requested:
+            if self.should_stop():
                 self.stats.decrement_depth()
                 return False
 
@@ -197,47 +521,235 @@ class AlgorithmX:
             self.stats.record_intermediate_steps(solution)
             self.stats.increment_placements_testes()
 
-            columns_to_remove = [idx for idx, val in enumerate(row['row']) if val == 1]
-            new_matrix = self.cover_columns(matrix, columns_to_remove, row)
+            engine.select_row(row.id)
+            for pruner in pruners:
+                pruner.push(row)
 
-            # Vérification des zones vides résiduelles (pruning)
-            if not checker.has_unfillable_voids(solution):
-                if self.algorithm_x(new_matrix, header, solution):
+            # Vérification des zones vides résiduelles et du coloriage (pruning)
+            if not self.is_dead_end(solution):
+                if self.algorithm_x(engine, matrix, solution):
                     self.stats.decrement_depth()
                     return True
+                if self.stop_requested:
+                    # Recherche abandonnée: le moteur n'est pas restauré (il n'est plus utilisé),
+                    # ce qui évite un dépilement coûteux après l'arrêt
+                    self.stats.decrement_depth()
+                    return False
             else:
                 self.stats.increment_branches_pruned()
 
+            for pruner in reversed(pruners):
+                pruner.pop(row)
+            engine.deselect_row(row.id)
             solution.pop()
             self.stats.increment_calculs()
 
         self.stats.decrement_depth()
         return False
 
-    def select_min_column(self, matrix, header):
+    def algorithm_x_iterative(self, engine, matrix, solution, stack=None):
         """
-        Sélectionne la colonne avec le moins d'options (heuristique MRV - Minimum Remaining Values).
-        On compte pour chaque colonne le nombre de lignes (placements) qui la couvrent.
-        La colonne avec le moins d'options est choisie car plus contraignante,
-        réduisant l'espace de recherche.
+        Version itérative de algorithm_x, avec une pile explicite à la place de la récursion.
+        L'ordre de parcours, le pruning, les statistiques, la prise en compte de request_stop()
+        et l'arrêt à la première solution sont identiques à la version récursive.
+
+        Chaque élément de la pile est une liste [candidats, indice_suivant, placement_courant]:
+        - candidats (list): Lignes triées couvrant la colonne choisie à ce niveau.
+        - indice_suivant (int): Indice du prochain candidat à essayer.
+        - placement_courant (dict ou None): Candidat actuellement sélectionné dans le moteur.
+
+        La pile reste dans self.search_stack après un arrêt (ou une solution), ce qui permet
+        de reprendre le parcours (voir save_search_state).
 
         Paramètres:
-        - matrix (list): Matrice de contraintes
-        - header (list): Noms des colonnes (non utilisé directement ici)
+        - engine: Moteur de couverture exacte (état courant de la matrice).
+        - matrix (list): Liste complète des placements, indexée par 'id'.
+        - solution (list): Liste des placements choisis jusqu'ici.
+        - stack (list): Pile à reprendre, optionnelle (le moteur doit être dans l'état correspondant).
+
+        Retourne:
+        - bool: True si une solution a été trouvée, False sinon.
+        """
+        pruners = self.pruners
+        if stack is None:
+            if self.stop_requested:
+                return False
+            stack = []
+            if self.enter_node(engine, matrix, solution, stack):
+                return True
+        else:
+            for _ in stack:
+                self.stats.increment_depth()
+        self.search_stack = stack
+
+        while stack:
+            frame = stack[-1]
+            if frame[2] is not None:
+                # Retour d'un sous-arbre (ou placement coupé): on annule le placement courant.
+                for pruner in reversed(pruners):
+                    pruner.pop(frame[2])
+                engine.deselect_row(frame[2].id)
+                solution.pop()
+                self.stats.increment_calculs()
+                frame[2] = None
+
+            if self.should_stop():
+                for _ in stack:
+                    self.stats.decrement_depth()
+                return False
+
+            if self.steal_requested:
+                self.steal_requested = False
+                state = self.split_search_stack(stack)
+                if state is not None:
+                    self.donate(state)
+
+            candidates = frame[0]
+            if frame[1] == len(candidates):
+                stack.pop()
+                self.stats.decrement_depth()
+                continue
+
+            row = candidates[frame[1]]
+            frame[1] += 1
+            frame[2] = row
+
+            solution.append(row)
+            self.stats.set_current_solution_steps(solution)
+            self.stats.record_intermediate_steps(solution)
+            self.stats.increment_placements_testes()
+
+            engine.select_row(row.id)
+            for pruner in pruners:
+                pruner.push(row)
+
+            # Vérification des zones vides résiduelles et du coloriage (pruning)
+            if self.is_dead_end(solution):
+                self.stats.increment_branches_pruned()
+                continue
+
+            if self.enter_node(engine, matrix, solution, stack):
+                for _ in stack:
+                    self.stats.decrement_depth()
+                return True
+        return False
+
+    def is_dead_end(self, solution):
+        """
+        Interroge les pruners (dans l'ordre): True si l'un d'eux coupe la branche courante.
+        """
+        for pruner in self.pruners:
+            if pruner.should_prune(solution):
+                return True
+        return False
+
+    def enter_node(self, engine, matrix, solution, stack):
+        """
+        Entrée dans un noeud du parcours itératif: mise à jour des statistiques,
+        puis soit validation de la solution (plus aucune colonne), soit empilement
+        des candidats de la colonne la plus contrainte.
+
+        Retourne:
+        - bool: True si le noeud est une solution valide, False sinon.
+        """
+        self.stats.increment_branches_explored()
+        self.stats.increment_depth()
+
+        column = engine.select_min_column()
+        if column is None:
+            self.stats.decrement_depth()
+            return self.accept_solution(solution)
+
+        rows_to_cover = [matrix[row_id] for row_id in engine.rows_for_column(column)]
+        stack.append([self.prioritize_rows(rows_to_cover), 0, None])
+        return False
+
+    def accept_solution(self, solution):
+        """
+        Valide une branche complète et l'enregistre si c'est une solution.
+        En mode comptage, la validation se réduit à vérifier que toutes les pièces
+        sont posées (les placements choisis ne se chevauchent jamais) et que leurs
+        tailles couvrent exactement le plateau; aucune copie n'est faite.
+
+        Retourne:
+        - bool: True si la solution est valide, False sinon.
+        """
+        if self.count_only:
+            if len(solution) != len(self.pieces) or not self.sizes_match_board:
+                return False
+            self.stats.increment_solutions_found()
+        else:
+            validator = SolutionValidator(self.pieces, self.plateau)
+            if not validator.validate_solution(solution):
+                return False
+            if self.store_solutions:
+                self.solutions.append(solution.copy())
+            self.stats.add_solution(solution)
+            self.stats.snapshot_current_solution_steps()
+            if self.progress is not None:
+                self.progress.publish("solution", self.stats.get_stats(), solution.copy(),
+                                      self.stats.get_best_partial_steps())
+        self.stats.stop_timer()
+        return True
+
+    def save_search_state(self):
+        """
+        Retourne un état sérialisable du parcours itératif (après un arrêt ou une solution):
+        pour chaque niveau de la pile, (identifiants des candidats, indice suivant,
+        identifiant du placement courant ou None).
+        Cet état peut être passé à solve(resume_state=...) sur un AlgorithmX construit
+        avec les mêmes plateau, pièces, heuristique et pièces fixées.
+
+        Lève:
+        - RuntimeError: Aucun parcours itératif n'a eu lieu (pas encore de recherche, ou
+          dernière recherche en mode récursif): il n'y a pas d'état à sauvegarder.
+        """
+        if self.search_stack is None:
+            raise RuntimeError("No iterative search to save: use search=\"iterative\" to resume a search")
+        return [
+            ([row.id for row in candidates], next_index, current.id if current else None)
+            for candidates, next_index, current in self.search_stack
+        ]
+
+    def split_search_stack(self, stack):
+        """
+        Cède une partie du travail restant du parcours itératif (vol de travail):
+        la seconde moitié des candidats non essayés du niveau le moins profond qui en a
+        encore (ceux dont les sous-arbres sont les plus gros) est retirée de la pile.
 
         Retourne:
-        - int ou None: L'indice de colonne choisie, ou None si aucune (matrice vide).
-        """
-        counts = [0] * len(header)
-        for row in matrix:
-            for idx, val in enumerate(row['row']):
-                if val == 1:
-                    counts[idx] += 1
-        counts = [c if c > 0 else float('inf') for c in counts]
-        m = min(counts)
-        if m == float('inf'):
-            return None
-        return counts.index(m)
+        - list ou None: État au format de save_search_state() décrivant le travail cédé
+          (placements menant à ce niveau, puis les candidats cédés), ou None si rien à céder.
+        """
+        for depth, frame in enumerate(stack):
+            candidates, next_index = frame[0], frame[1]
+            remaining = len(candidates) - next_index
+            # Au sommet de la pile, céder l'unique candidat restant n'apporte rien
+            if remaining >= 2 or (remaining == 1 and depth < len(stack) - 1):
+                keep = next_index + remaining // 2
+                frame[0] = candidates[:keep]
+                prefix = [([current.id], 1, current.id) for _, _, current in stack[:depth]]
+                return prefix + [([row.id for row in candidates[keep:]], 0, None)]
+        return None
+
+    def restore_search_state(self, state, engine, matrix, solution):
+        """
+        Reconstruit la pile du parcours itératif à partir de save_search_state(),
+        en réappliquant dans le moteur les placements courants de chaque niveau.
+
+        Retourne:
+        - stack (list): Pile prête à être reprise par algorithm_x_iterative.
+        """
+        stack = []
+        for candidate_ids, next_index, current_id in state:
+            current = matrix[current_id] if current_id is not None else None
+            if current is not None:
+                engine.select_row(current_id)
+                for pruner in self.pruners:
+                    pruner.push(current)
+                solution.append(current)
+            stack.append([[matrix[row_id] for row_id in candidate_ids], next_index, current])
+        return stack
 
     def prioritize_rows(self, rows):
         """
@@ -251,26 +763,5 @@ class AlgorithmX:
         Retourne:
         - rows (list): Lignes triées selon la priorité.
         """
-        rows.sort(key=lambda r: -self.piece_weights[r['piece'].nom])
+        rows.sort(key=lambda r: -self.piece_weights[r.piece.nom])
         return rows
-
-    def cover_columns(self, matrix, columns_to_remove, selected_row):
-        """
-        Met à jour la matrice après avoir sélectionné un placement.
-        On retire toutes les lignes qui couvrent les mêmes colonnes pour maintenir la cohérence.
-
-        Paramètres:
-        - matrix (list): Matrice de contraintes actuelle
-        - columns_to_remove (list): Liste des indices de colonnes couvertes par le placement choisi
-        - selected_row (dict): Le placement choisi
-
-        Retourne:
-        - new_matrix (list): Nouvelle matrice réduite.
-        """
-        new_matrix = []
-        for r in matrix:
-            if r == selected_row:
-                continue
-            if all(r['row'][idx] == 0 for idx in columns_to_remove):
-                new_matrix.append(r)
-        return new_matrix
@@ -1,4 +1,8 @@
 import time
+from collections import deque
+
+# Nombre d'étapes intermédiaires conservées par défaut lorsque l'enregistrement est actif.
+DEFAULT_RECORD_CAPACITY = 10000
 
 class AlgorithmStats:
     """
@@ -7,17 +11,27 @@ class AlgorithmStats:
     du nombre de calculs, de placements testés, du nombre de branches explorées et coupées,
     de la profondeur de récursion, du nombre de solutions trouvées, etc.
 
+    L'enregistrement des étapes intermédiaires (pour la relecture dans l'interface)
+    est désactivé par défaut. Une fois activé, il utilise un tampon circulaire de
+    capacité fixe: seules les `record_capacity` dernières étapes sont conservées,
+    la mémoire reste donc bornée quelle que soit la durée de la recherche.
+
     Paramètres:
-    - Aucun paramètre particulier, la classe est autonome.
+    - record_steps (bool): Active l'enregistrement des étapes intermédiaires.
+    - record_capacity (int): Nombre maximal d'étapes intermédiaires conservées.
 
     Exemples d'utilisation:
     stats = AlgorithmStats()
     stats.increment_calculs()
     stats.get_stats() # Retourne un dictionnaire récapitulatif des statistiques
     """
-    def __init__(self):
+    def __init__(self, record_steps=False, record_capacity=DEFAULT_RECORD_CAPACITY):
+        self.record_steps = record_steps
         self.reset_stats()
-        self.intermediate_steps_record = []
+        self.intermediate_steps_record = deque(maxlen=record_capacity)
+        self.live_solution_steps = []  # Branche en cours (liste modifiée par la recherche)
+        self.current_solution_steps = []  # Copie de la branche prise à la dernière publication
+        self.best_partial_steps = []
 
     def reset_stats(self):
         """
@@ -33,6 +47,10 @@ class AlgorithmStats:
         self.max_recursion_depth = 0  # Profondeur maximale de récursion atteinte par l'algorithme.
         self.current_recursion_depth = 0  # Profondeur actuelle de récursion.
         self.solutions_found = 0  # Nombre de solutions complètes trouvées.
+        self.zone_cache_hits = 0  # Tests de remplissage de zone résolus par le cache.
+        self.zone_cache_misses = 0  # Tests de remplissage de zone calculés (absents du cache).
+        self.stop_reason = None  # Raison de l'arrêt prématuré (voir cancellation.STOP_REASONS).
+        self.stop_latency = None  # Secondes entre le déclenchement de l'arrêt et l'arrêt effectif.
 
     def increment_calculs(self):
         self.calculs += 1
@@ -46,6 +64,12 @@ class AlgorithmStats:
     def increment_branches_pruned(self):
         self.branches_pruned += 1
 
+    def increment_zone_cache_hits(self):
+        self.zone_cache_hits += 1
+
+    def increment_zone_cache_misses(self):
+        self.zone_cache_misses += 1
+
     def update_max_depth(self):
         if self.current_recursion_depth > self.max_recursion_depth:
             self.max_recursion_depth = self.current_recursion_depth
@@ -73,6 +97,37 @@ class AlgorithmStats:
         self.solution_steps = solution.copy()
         self.solutions_found += 1
 
+    def increment_solutions_found(self):
+        """
+        Compte une solution sans en conserver les étapes (mode comptage).
+        """
+        self.solutions_found += 1
+
+    def record_stop(self, reason, latency):
+        """
+        Enregistre un arrêt prématuré de la recherche.
+
+        Paramètres:
+        - reason (str): Raison de l'arrêt ("requested", "timeout", "node_limit", "solution").
+        - latency (float): Temps écoulé entre le déclenchement de l'arrêt et l'arrêt effectif.
+        """
+        self.stop_reason = reason
+        self.stop_latency = latency
+
+    def merge(self, stats):
+        """
+        Cumule les compteurs d'une autre recherche (dictionnaire issu de get_stats()),
+        par exemple ceux d'un processus d'une recherche parallèle. Les solutions ne sont
+        pas comptées ici: elles sont ajoutées via add_solution().
+        """
+        self.calculs += stats["calculs"]
+        self.placements_testes += stats["placements_testes"]
+        self.branches_explored += stats["branches_explored"]
+        self.branches_pruned += stats["branches_pruned"]
+        self.zone_cache_hits += stats["zone_cache_hits"]
+        self.zone_cache_misses += stats["zone_cache_misses"]
+        self.max_recursion_depth = max(self.max_recursion_depth, stats["max_recursion_depth"])
+
     def start_timer(self):
         """
         Démarre le chronomètre pour mesurer la durée de l'algorithme.
@@ -105,7 +160,8 @@ class AlgorithmStats:
 
         Retourne:
         - dict: contenant 'time', 'calculs', 'placements_testes', 'branches_explored',
-                'branches_pruned', 'max_recursion_depth', 'solutions_found'
+                'branches_pruned', 'max_recursion_depth', 'solutions_found',
+                'zone_cache_hits', 'zone_cache_misses', 'stop_reason', 'stop_latency', 'current_depth'
         """
         return {
             "time": self.get_time_elapsed(),
@@ -114,18 +170,59 @@ class AlgorithmStats:
             "branches_explored": self.branches_explored,
             "branches_pruned": self.branches_pruned,
             "max_recursion_depth": self.max_recursion_depth,
-            "solutions_found": self.solutions_found
+            "solutions_found": self.solutions_found,
+            "zone_cache_hits": self.zone_cache_hits,
+            "zone_cache_misses": self.zone_cache_misses,
+            "stop_reason": self.stop_reason,
+            "stop_latency": self.stop_latency,
+            "current_depth": self.current_recursion_depth
         }
 
     def get_current_solution_steps(self):
         """
-        Retourne une copie des étapes de la dernière solution trouvée.
+        Retourne une copie des étapes de la branche prise par le dernier appel à
+        snapshot_current_solution_steps() (dernière publication de la progression,
+        dernière solution trouvée ou fin de la recherche).
         Chaque étape correspond à un placement d'une pièce sur le plateau.
         """
         return self.current_solution_steps.copy()
 
     def set_current_solution_steps(self, steps):
-        self.current_solution_steps = [s for s in steps]
-        
+        """
+        Mémorise la liste (vivante) des placements en cours, sans la copier: appelée à
+        chaque noeud, elle doit rester peu coûteuse. La recherche continue de modifier
+        cette liste; snapshot_current_solution_steps() en prend une copie lorsqu'elle
+        doit être publiée. Une copie est aussi faite lorsque la branche dépasse la plus
+        profonde atteinte.
+        """
+        self.live_solution_steps = steps
+        if len(steps) > len(self.best_partial_steps):
+            self.best_partial_steps = list(steps)
+
+    def snapshot_current_solution_steps(self):
+        """
+        Copie la branche en cours (voir set_current_solution_steps()): appelée par la
+        recherche à chaque publication (progression limitée en fréquence, solution, fin).
+        """
+        self.current_solution_steps = list(self.live_solution_steps)
+
+    def get_best_partial_steps(self):
+        """
+        Retourne une copie des placements de la branche la plus profonde atteinte.
+        """
+        return list(self.best_partial_steps)
+
     def record_intermediate_steps(self, steps):
-        self.intermediate_steps_record.append([s for s in steps])
+        """
+        Enregistre un instantané des placements en cours, si l'enregistrement est actif.
+        Au-delà de la capacité, les étapes les plus anciennes sont écartées.
+        """
+        if self.record_steps:
+            self.intermediate_steps_record.append(tuple(steps))
+
+    def get_intermediate_steps(self):
+        """
+        Retourne la liste des étapes intermédiaires enregistrées (les plus récentes).
+        Chaque étape est une séquence de placements.
+        """
+        return list(self.intermediate_steps_record)
@@ -0,0 +1,98 @@
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(x):
+        return bin(x).count("1")
+
+
+class BitsetEngine:
+    """
+    Moteur de couverture exacte basé sur des masques de bits (entiers Python).
+    - Chaque placement (ligne) est un masque sur les colonnes (cellules + bit de pièce).
+    - Chaque colonne est un masque sur les lignes qui la couvrent.
+    - L'état courant se résume à deux entiers: les lignes encore actives et
+      les colonnes encore à couvrir.
+
+    Le comptage d'une colonne (MRV) devient un ET suivi d'un popcount, et
+    la sélection d'une ligne retire en une opération toutes les lignes en conflit.
+    La désélection restaure simplement l'état précédent (pile d'entiers).
+
+    Paramètres:
+    - matrix (list): Liste des placements (Placement, indexés par id).
+    - index (SparseIndex): Index creux de la matrice.
+    """
+    def __init__(self, matrix, index):
+        num_columns = index.num_columns
+        self.num_columns = num_columns
+        self.row_masks = []
+        self.row_columns = []
+        for row_id in range(index.num_rows):
+            columns = list(index.columns_of(row_id))
+            mask = 0
+            for column in columns:
+                mask |= 1 << column
+            self.row_masks.append(mask)
+            self.row_columns.append(columns)
+        self.column_rows = []
+        for column in range(num_columns):
+            bits = bytearray((index.num_rows + 7) // 8)
+            for row_id in index.rows_of(column):
+                bits[row_id >> 3] |= 1 << (row_id & 7)
+            self.column_rows.append(int.from_bytes(bits, "little"))
+
+        self.live_rows = (1 << index.num_rows) - 1
+        self.uncovered = (1 << num_columns) - 1
+        self.history = []
+
+    def select_min_column(self):
+        """
+        Sélectionne la colonne non couverte ayant le moins de lignes actives (heuristique MRV).
+        En cas d'égalité, la colonne de plus petit indice est choisie.
+
+        Retourne:
+        - int ou None: L'indice de colonne choisie, ou None si toutes les colonnes sont couvertes.
+        """
+        remaining = self.uncovered
+        if not remaining:
+            return None
+        live, column_rows = self.live_rows, self.column_rows
+        best, best_count = None, None
+        while remaining:
+            low = remaining & -remaining
+            column = low.bit_length() - 1
+            count = _popcount(column_rows[column] & live)
+            if best_count is None or count < best_count:
+                best, best_count = column, count
+                if count == 0:
+                    break
+            remaining ^= low
+        return best
+
+    def rows_for_column(self, column):
+        """
+        Retourne les identifiants des lignes actives couvrant la colonne, par ordre croissant.
+        """
+        rows = []
+        candidates = self.column_rows[column] & self.live_rows
+        while candidates:
+            low = candidates & -candidates
+            rows.append(low.bit_length() - 1)
+            candidates ^= low
+        return rows
+
+    def select_row(self, row_id):
+        """
+        Sélectionne une ligne: ses colonnes sont couvertes et les lignes en conflit désactivées.
+        """
+        self.history.append((self.live_rows, self.uncovered))
+        conflicts = 0
+        for column in self.row_columns[row_id]:
+            conflicts |= self.column_rows[column]
+        self.live_rows &= ~conflicts
+        self.uncovered &= ~self.row_masks[row_id]
+
+    def deselect_row(self, row_id):
+        """
+        Annule le dernier select_row() en restaurant l'état précédent.
+        """
+        self.live_rows, self.uncovered = self.history.pop()
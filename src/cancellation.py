@@ -0,0 +1,134 @@
+import time
+import multiprocessing
+
+# Nombre de placements testés entre deux vérifications des limites (délai, nombre de noeuds,
+# signal partagé): un arrêt est pris en compte au plus CHECK_INTERVAL noeuds après son déclenchement.
+CHECK_INTERVAL = 16
+
+# Raisons d'arrêt possibles (stats "stop_reason").
+STOP_REASONS = ("requested", "timeout", "node_limit", "solution")
+
+
+class StopSignal:
+    """
+    Signal d'arrêt partagé entre processus: un événement, la date (time.time()) à laquelle
+    il a été levé et la raison de l'arrêt. La date permet à chaque processus de mesurer
+    sa latence d'arrêt; seule la première levée est retenue.
+
+    Paramètres:
+    - context: Contexte multiprocessing (par défaut "spawn").
+    """
+    def __init__(self, context=None):
+        context = context if context is not None else multiprocessing.get_context("spawn")
+        self.event = context.Event()
+        self.time = context.Value('d', 0.0)
+        self.reason = context.Value('i', -1)
+
+    def set(self, reason="requested", at=None):
+        """
+        Lève le signal.
+
+        Paramètres:
+        - reason (str): Raison de l'arrêt (voir STOP_REASONS).
+        - at (float): Date du déclenchement (par défaut, maintenant).
+        """
+        with self.time.get_lock():
+            if self.reason.value < 0:
+                self.time.value = at if at is not None else time.time()
+                self.reason.value = STOP_REASONS.index(reason)
+        self.event.set()
+
+    def is_set(self):
+        return self.event.is_set()
+
+    def get_reason(self):
+        return STOP_REASONS[self.reason.value] if self.reason.value >= 0 else None
+
+    def get_time(self):
+        return self.time.value if self.reason.value >= 0 else None
+
+
+class CancellationToken:
+    """
+    Jeton d'annulation coopérative d'une recherche. L'arrêt est demandé explicitement
+    (cancel()), ou déclenché par un délai, une limite de noeuds (placements testés) ou un
+    StopSignal partagé avec d'autres processus. La recherche interroge poll() tous les
+    CHECK_INTERVAL noeuds: un arrêt est donc pris en compte en un nombre borné de noeuds.
+
+    Le jeton retient la raison et la date du déclenchement, d'où la latence d'arrêt
+    (temps écoulé jusqu'à ce que la recherche ait effectivement rendu la main).
+
+    Paramètres:
+    - timeout (float): Délai maximal en secondes, optionnel.
+    - node_limit (int): Nombre maximal de noeuds, optionnel.
+    - signal (StopSignal): Signal partagé, optionnel: la recherche s'arrête dès qu'il est levé
+      (un arrêt local, par exemple un délai, ne le lève pas).
+    - node_counter (multiprocessing.Value): Compteur de noeuds partagé, optionnel: la limite
+      porte alors sur le total de tous les processus.
+    """
+    def __init__(self, timeout=None, node_limit=None, signal=None, node_counter=None):
+        self.deadline = time.time() + timeout if timeout is not None else None
+        self.node_limit = node_limit
+        self.signal = signal
+        self.node_counter = node_counter
+        self.nodes_seen = 0
+        self.reason = None
+        self.cancel_time = None
+        # Sans limite ni signal, seul cancel() peut arrêter la recherche: poll() est inutile
+        self.active = timeout is not None or node_limit is not None or signal is not None
+
+    def cancel(self, reason="requested", at=None):
+        """
+        Déclenche l'arrêt (sans effet si l'arrêt est déjà déclenché).
+        """
+        if self.reason is not None:
+            return
+        self.reason = reason
+        self.cancel_time = at if at is not None else time.time()
+
+    def is_cancelled(self):
+        return self.reason is not None
+
+    def poll(self, nodes):
+        """
+        Vérifie les conditions d'arrêt.
+
+        Paramètres:
+        - nodes (int): Nombre de noeuds explorés depuis la création du jeton.
+
+        Retourne:
+        - bool: True si la recherche doit s'arrêter.
+        """
+        if self.reason is not None:
+            return True
+        signal = self.signal
+        if signal is not None and signal.is_set():
+            self.reason = signal.get_reason()
+            self.cancel_time = signal.get_time()
+            return True
+        if self.deadline is not None and time.time() >= self.deadline:
+            self.cancel("timeout", self.deadline)
+            return True
+        if self.node_limit is not None:
+            total = nodes
+            if self.node_counter is not None:
+                with self.node_counter.get_lock():
+                    self.node_counter.value += nodes - self.nodes_seen
+                    total = self.node_counter.value
+                self.nodes_seen = nodes
+            if total >= self.node_limit:
+                self.cancel("node_limit")
+                return True
+        return False
+
+    def remaining_time(self):
+        """
+        Temps restant avant le délai (None sans délai).
+        """
+        return max(0.0, self.deadline - time.time()) if self.deadline is not None else None
+
+    def stop_latency(self):
+        """
+        Temps écoulé depuis le déclenchement de l'arrêt (None si aucun arrêt).
+        """
+        return time.time() - self.cancel_time if self.cancel_time is not None else None
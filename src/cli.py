@@ -0,0 +1,209 @@
+"""
+Point d'entrée en ligne de commande, sans interface graphique: résout un lot de niveaux
+(fichiers JSON au format de levels/) en parallèle sur plusieurs processus et écrit un
+résultat par niveau au format JSON Lines.
+
+Exemples:
+python src/cli.py levels/                              # Tous les niveaux du dossier
+python src/cli.py levels/lvl1.json levels/lvl3.json --heuristic ascender --jobs 2
+python src/cli.py --rows 6 --cols 10 --pieces generated --seed 3 -o results.jsonl
+python src/cli.py generated.iqls --count --store solutions.iqls -o /dev/null
+
+Les niveaux peuvent aussi être lus dans un fichier binaire LevelStore (extension .iqls):
+chaque niveau du fichier est résolu, et désigné par "fichier.iqls#indice" dans la sortie.
+Avec --store, la solution de chaque niveau (et son nombre de solutions, si connu) est
+écrite dans un LevelStore, dans l'ordre des niveaux.
+
+Chaque ligne de sortie contient:
+- level (str): Fichier du niveau (null pour le plateau vide).
+- status (str): "solved", "unsolvable" (recherche épuisée), "stopped" (délai ou limite
+  de noeuds atteint) ou "error" (niveau invalide).
+- solution (dict): Placements de la solution au format "placed_pieces" (rechargeable comme niveau).
+- stats (dict): Statistiques de la recherche (AlgorithmStats.get_stats()).
+- solution_count (int): Nombre de solutions (avec --count; minorant si "stopped").
+- error (str): Message d'erreur (statut "error").
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from algo_x_knuth import AlgorithmX, ENGINES, HEURISTICS
+from level_loader import load_piece_definitions, load_problem, solution_to_placed_pieces
+from level_store import LevelStore, STORE_EXTENSION
+
+# Nombre de résultats écrits d'un coup dans le LevelStore de sortie (--store).
+STORE_BATCH = 1024
+
+
+def expand_level_paths(paths):
+    """
+    Développe les arguments en liste de niveaux: chemins de fichiers JSON (un dossier donne
+    ses *.json, triés) et couples (fichier LevelStore, indice) pour les fichiers .iqls.
+    """
+    levels = []
+    for path in paths:
+        if os.path.isdir(path):
+            levels.extend(sorted(glob.glob(os.path.join(path, "*.json"))))
+        elif path.endswith(STORE_EXTENSION):
+            levels.extend((path, index) for index in range(len(LevelStore(path))))
+        else:
+            levels.append(path)
+    return levels
+
+
+def solve_level(task):
+    """
+    Résout un niveau (fonction exécutée par les processus du pool).
+
+    Paramètres:
+    - task (dict): {'level', 'rows', 'cols', 'pieces', 'heuristic', 'engine', 'timeout', 'node_limit',
+      'count', 'placed_pieces'}, 'pieces' étant la liste des définitions [(nom, forme)] et
+      'placed_pieces' les pièces du niveau déjà lues (None: lues dans le fichier 'level').
+
+    Retourne:
+    - dict: Résultat du niveau (voir la documentation du module).
+    """
+    result = {
+        "level": task['level'],
+        "rows": task['rows'],
+        "cols": task['cols'],
+        "heuristic": task['heuristic'],
+        "engine": task['engine'],
+    }
+    start = time.time()
+    try:
+        plateau, pieces, fixed_pieces = load_problem(task['level'], task['rows'], task['cols'], task['pieces'],
+                                                     task['placed_pieces'])
+        algo = AlgorithmX(plateau, pieces, task['heuristic'], fixed_pieces, task['engine'])
+        if task['count']:
+            # Comptage sans copie des solutions: seule la première est conservée (exemple)
+            count = 0
+            solutions = []
+            for solution in algo.iterate_solutions(count_only=True, timeout=task['timeout'],
+                                                   node_limit=task['node_limit']):
+                if not solutions:
+                    solutions.append(list(solution))
+                count += 1
+            result["solution_count"] = count
+        else:
+            solutions = algo.solve(timeout=task['timeout'], node_limit=task['node_limit'])
+    except (OSError, ValueError, KeyError) as e:
+        result.update(status="error", error=str(e), wall_time=time.time() - start)
+        return result
+
+    status = "solved" if solutions else "unsolvable"
+    if algo.stop_requested and (task['count'] or not solutions):
+        # Comptage interrompu: la solution éventuelle est conservée, le nombre est un minorant
+        status = "stopped"
+    result.update(status=status, solution=solution_to_placed_pieces(solutions[0]) if solutions else None)
+    result.update(stats=algo.get_stats(), wall_time=time.time() - start)
+    return result
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Headless batch solver for IQ Puzzler Pro levels (JSON Lines output).")
+    parser.add_argument("levels", nargs="*",
+                        help="Level JSON files, directories of levels or level stores (.iqls) "
+                             "(none: solve the empty board).")
+    parser.add_argument("--rows", type=int, default=5, help="Board rows (default: 5).")
+    parser.add_argument("--cols", type=int, default=11, help="Board columns (default: 11).")
+    parser.add_argument("--pieces", default="classic",
+                        help="Piece set: 'classic', 'generated' or a JSON file of [name, shape] pairs.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for --pieces generated.")
+    parser.add_argument("--heuristic", default="descender", choices=HEURISTICS)
+    parser.add_argument("--engine", default="dlx", choices=sorted(ENGINES))
+    parser.add_argument("--timeout", type=float, default=None, help="Time limit per level, in seconds.")
+    parser.add_argument("--node-limit", type=int, default=None, help="Placement limit per level.")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: number of cores).")
+    parser.add_argument("--count", action="store_true", help="Count all solutions of each level.")
+    parser.add_argument("--output", "-o", default=None, help="Output file (default: standard output).")
+    parser.add_argument("--store", default=None, help="Also write the solutions to a level store (.iqls).")
+    return parser
+
+
+def main(argv=None):
+    """
+    Résout les niveaux demandés et écrit les résultats, dans l'ordre des niveaux.
+
+    Retourne:
+    - int: Code de sortie (1 si au moins un niveau est invalide, 0 sinon).
+    """
+    args = build_parser().parse_args(argv)
+    piece_definitions = load_piece_definitions(args.pieces, args.rows, args.cols, args.seed)
+    # Les formes sont converties en listes: les tâches sont transmises aux processus
+    piece_definitions = [(nom, [list(map(int, row)) for row in forme]) for nom, forme in piece_definitions]
+    levels = expand_level_paths(args.levels) or [None]
+    stores = {}
+
+    def make_task(level):
+        placed_pieces = None
+        if isinstance(level, tuple):
+            path, index = level
+            if path not in stores:
+                stores[path] = LevelStore(path)
+            placed_pieces = stores[path].get(index)
+            level = f"{path}#{index}"
+        return {
+            'level': level, 'rows': args.rows, 'cols': args.cols, 'pieces': piece_definitions,
+            'heuristic': args.heuristic, 'engine': args.engine,
+            'timeout': args.timeout, 'node_limit': args.node_limit,
+            'count': args.count, 'placed_pieces': placed_pieces,
+        }
+
+    # Tâches créées à la demande: un LevelStore peut contenir des millions de niveaux
+    tasks = map(make_task, levels)
+    store = None
+    if args.store:
+        store = LevelStore.create(args.store, args.rows, args.cols, [nom for nom, _ in piece_definitions])
+    pending = []
+    out = open(args.output, 'w') if args.output else sys.stdout
+    errors = 0
+    try:
+        if args.jobs <= 1 or len(levels) == 1:
+            results = map(solve_level, tasks)
+            pool = None
+        else:
+            processes = min(args.jobs, len(levels))
+            pool = multiprocessing.get_context("spawn").Pool(processes)
+            # Lots de quelques niveaux par envoi: moins d'échanges pour des milliers de petits niveaux
+            results = pool.imap(solve_level, tasks, chunksize=max(1, len(levels) // (processes * 8)))
+        for result in results:
+            errors += result["status"] == "error"
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            if store is not None:
+                pending.append(store_record(result))
+                if len(pending) >= STORE_BATCH:
+                    store.extend(pending)
+                    pending = []
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        if store is not None:
+            store.extend(pending)
+            store.close()
+        if out is not sys.stdout:
+            out.close()
+    return 1 if errors else 0
+
+
+def store_record(result):
+    """
+    Enregistrement LevelStore d'un résultat: (placements de la solution, nombre de solutions),
+    le nombre valant -1 s'il est inconnu (pas de comptage, recherche interrompue ou erreur).
+    """
+    placed_pieces = result.get("solution") or {}
+    if result["status"] == "unsolvable":
+        return placed_pieces, 0
+    if result["status"] == "solved" and "solution_count" in result:
+        return placed_pieces, result["solution_count"]
+    return placed_pieces, -1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,88 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from array import array
+from itertools import chain
+from placement import Placement, PlacementArrays
+
+
+class SparseIndex:
+    """
+    Index creux de la matrice de contraintes, stocké dans des tableaux d'entiers compacts:
+    - ligne -> colonnes (format CSR): row_offsets / row_columns
+    - colonne -> lignes (format CSC): column_offsets / column_rows
+
+    Les colonnes d'une ligne r sont row_columns[row_offsets[r]:row_offsets[r + 1]],
+    et les lignes d'une colonne c sont column_rows[column_offsets[c]:column_offsets[c + 1]],
+    par ordre croissant d'identifiant.
+
+    Paramètres:
+    - rows_columns (list): Pour chaque ligne (par identifiant), la liste de ses colonnes.
+    - num_columns (int): Nombre total de colonnes (cellules + pièces).
+    """
+    def __init__(self, rows_columns, num_columns):
+        lengths = np.fromiter((len(columns) for columns in rows_columns), dtype=np.intc, count=len(rows_columns))
+        flat = np.fromiter(chain.from_iterable(rows_columns), dtype=np.intc, count=int(lengths.sum()))
+        self._build(lengths, flat, num_columns)
+
+    @classmethod
+    def from_placements(cls, placements, first_piece_column, num_columns):
+        """
+        Construit l'index à partir des lignes rangées en colonnes, sans passer par les
+        colonnes de chaque Placement: mêmes tableaux que SparseIndex([row.columns ...]).
+
+        Paramètres:
+        - placements (PlacementArrays): Lignes de la matrice.
+        - first_piece_column (int): Colonne de la pièce d'indice 0 (nombre de cellules).
+        - num_columns (int): Nombre total de colonnes (cellules + pièces).
+        """
+        # Chaque ligne: ses cellules, puis la colonne de sa pièce
+        lengths = np.diff(placements.cell_offsets) + 1
+        piece_slots = np.cumsum(lengths) - 1
+        flat = np.empty(int(lengths.sum()), dtype=np.intc)
+        cell_slots = np.ones(len(flat), dtype=bool)
+        cell_slots[piece_slots] = False
+        flat[cell_slots] = placements.cells
+        flat[piece_slots] = placements.piece + first_piece_column
+        index = cls.__new__(cls)
+        index._build(lengths, flat, num_columns)
+        return index
+
+    def _build(self, lengths, flat, num_columns):
+        """
+        Remplit les tableaux CSR/CSC à partir des longueurs des lignes et de leurs colonnes
+        mises bout à bout.
+        """
+        self.num_rows = len(lengths)
+        self.num_columns = num_columns
+        row_ids = np.repeat(np.arange(self.num_rows, dtype=np.intc), lengths)
+        # Tri stable par colonne: les lignes de chaque colonne restent par identifiant croissant
+        order = np.argsort(flat, kind='stable')
+        column_sizes = np.bincount(flat, minlength=num_columns)
+
+        self.row_offsets = self._to_array(np.concatenate(([0], np.cumsum(lengths))))
+        self.row_columns = self._to_array(flat)
+        self.column_offsets = self._to_array(np.concatenate(([0], np.cumsum(column_sizes))))
+        self.column_rows = self._to_array(row_ids[order])
+
+    @staticmethod
+    def _to_array(values):
+        """
+        Convertit un tableau NumPy en array('i') (plus rapide à parcourir en Python).
+        """
+        return array('i', np.ascontiguousarray(values, dtype=np.intc).tobytes())
+
+    def columns_of(self, row_id):
+        """
+        Retourne les colonnes couvertes par la ligne row_id.
+        """
+        return self.row_columns[self.row_offsets[row_id]:self.row_offsets[row_id + 1]]
+
+    def rows_of(self, column):
+        """
+        Retourne les lignes couvrant la colonne donnée.
+        """
+        return self.column_rows[self.column_offsets[column]:self.column_offsets[column + 1]]
+
 
 class ConstraintMatrixBuilder:
     """
@@ -11,15 +95,28 @@ class ConstraintMatrixBuilder:
     - pieces (dict): Dictionnaire {nom: piece}, chaque pièce contenant ses variantes et sa forme.
     - piece_weights (dict): Poids associés aux pièces pour guider l'heuristique.
     - fixed_pieces (dict): Pièces fixées à des positions et variantes précises.
+    - allowed_variants (dict): {nom: indices de variantes} limitant les variantes proposées
+      pour certaines pièces (cassage de symétrie, voir BoardSymmetry), optionnel.
+    - placement_table (PlacementTable): Placements précalculés sur le plateau vide, optionnel:
+      les lignes sont alors obtenues en filtrant la table (même matrice, sans recherche
+      des positions de chaque variante).
 
-    La matrice de contraintes est un tableau de dictionnaires.
-    Chaque entrée représente un placement potentiel d'une pièce sur le plateau.
+    La matrice de contraintes est une liste de Placement.
+    Chaque entrée représente un placement potentiel d'une pièce sur le plateau,
+    identifié par id (son indice dans la matrice).
+    Après construction, self.arrays contient les mêmes lignes rangées en colonnes
+    (PlacementArrays) et self.index l'index creux (SparseIndex) de la matrice, déduit de
+    self.arrays.
     """
-    def __init__(self, plateau, pieces, piece_weights, fixed_pieces):
+    def __init__(self, plateau, pieces, piece_weights, fixed_pieces, allowed_variants=None, placement_table=None):
         self.plateau = plateau
         self.pieces = pieces
         self.piece_weights = piece_weights
         self.fixed_pieces = fixed_pieces
+        self.allowed_variants = allowed_variants if allowed_variants else {}
+        self.placement_table = placement_table
+        self.arrays = None
+        self.index = None
 
     def create_constraint_matrix(self):
         """
@@ -27,14 +124,30 @@ class ConstraintMatrixBuilder:
         On distingue les colonnes correspondant aux cellules du plateau et
         les colonnes correspondant aux pièces.
 
+        Chaque ligne contient les indices triés de ses cellules (Placement.cells).
+        Les lignes rangées en colonnes et l'index creux colonne -> lignes et ligne -> colonnes
+        sont construits en même temps et disponibles dans self.arrays et self.index.
+
         Retourne:
         - matrix (list): La liste des placements possibles.
         - header (list): Liste des noms de colonnes (cellules + pièces).
         """
         num_cells = self.plateau.lignes * self.plateau.colonnes
         header = ['C{}'.format(i) for i in range(num_cells)] + [p.nom for p in self.pieces.values()]
+        # Colonne de chaque pièce, calculée une seule fois
+        self.piece_columns = {nom: num_cells + idx for idx, nom in enumerate(self.pieces.keys())}
+        # Masque des cellules déjà occupées (pièces fixées)
+        self.occupied = (np.asarray(self.plateau.plateau) != 0).astype(np.int32)
+        # Blocs de lignes consécutives de PlacementArrays, ajoutés avec les Placement
+        self.blocks = []
 
+        # Identifiant de chaque ligne = son indice dans la matrice (utilisé par les moteurs)
         matrix = []
+        # Placements des pièces déjà fixées en tête de matrice (la dernière fixée en premier)
+        for piece_name, info in reversed(list(self.fixed_pieces.items())):
+            piece = self.pieces[piece_name]
+            self.add_fixed_piece_to_matrix(piece, info, matrix)
+
         used_pieces = set(self.fixed_pieces.keys())
         pieces_non_fixees = [p for p in self.pieces.values() if p.nom not in used_pieces]
         # Tri selon l'heuristique (par défaut décroissant sur le poids)
@@ -42,92 +155,108 @@ class ConstraintMatrixBuilder:
 
         # Ajout des placements possibles pour les pièces non fixées
         for piece in pieces_non_fixees:
-            self.add_piece_to_matrix(piece, matrix, num_cells)
-
-        # Ajout des placements des pièces déjà fixées en tête de matrice
-        for piece_name, info in self.fixed_pieces.items():
-            piece = self.pieces[piece_name]
-            self.add_fixed_piece_to_matrix(piece, info, matrix, num_cells)
+            if self.placement_table is not None:
+                self.add_piece_from_table(piece, matrix)
+            else:
+                self.add_piece_to_matrix(piece, matrix)
 
+        self.arrays = PlacementArrays.from_blocks(self.blocks, list(self.pieces.keys()))
+        self.blocks = None
+        self.index = SparseIndex.from_placements(self.arrays, num_cells, len(header))
         return matrix, header
 
-    def add_piece_to_matrix(self, piece, matrix, num_cells):
+    def add_piece_to_matrix(self, piece, matrix):
         """
         Génère toutes les lignes de la matrice correspondant aux placements possibles d'une pièce non fixée.
 
         Paramètres:
         - piece (Piece): La pièce à ajouter
         - matrix (list): La matrice en cours de construction
-        - num_cells (int): Nombre total de cellules du plateau (pour indexer les colonnes)
-
-        Pour chaque variante de la pièce, on tente de la placer à chaque position possible du plateau.
-        Si elle rentre sans collision et dans les limites, on crée une ligne de la matrice.
-        """
-        for variante_index, variante in enumerate(piece.variantes):
-            for i in range(self.plateau.lignes):
-                for j in range(self.plateau.colonnes):
-                    if self.plateau.peut_placer(variante, (i, j)):
-                        row, cells_covered = self.create_row_for_placement(piece, variante, (i, j), num_cells)
-                        piece_index = num_cells + list(self.pieces.keys()).index(piece.nom)
-                        row[piece_index] = 1
-                        matrix.append({
-                            'row': row,
-                            'piece': piece,
-                            'variante_index': variante_index,
-                            'position': (i, j),
-                            'cells_covered': cells_covered
-                        })
-
-    def add_fixed_piece_to_matrix(self, piece, info, matrix, num_cells):
-        """
-        Ajoute une pièce déjà fixée à la matrice. Cette ligne sera prioritaire et mise en tête.
+
+        Pour chaque variante de la pièce, on calcule en une seule opération NumPy le nombre
+        de collisions de la variante à chaque position (somme du masque des cellules occupées
+        sous les cellules de la variante, via une vue en fenêtres glissantes).
+        Les positions sans collision et dans les limites donnent une ligne de la matrice,
+        dans le même ordre (ligne par ligne) qu'un parcours des positions.
+        """
+        lignes, colonnes = self.plateau.lignes, self.plateau.colonnes
+        piece_column = self.piece_columns[piece.nom]
+        allowed = self.allowed_variants.get(piece.nom)
+        for variante_index, variant in enumerate(piece.variants):
+            if allowed is not None and variante_index not in allowed:
+                continue
+            height, width = variant.height, variant.width
+            if height > lignes or width > colonnes:
+                continue
+            # Somme des cellules occupées sous chaque cellule de la variante
+            windows = sliding_window_view(self.occupied, (height, width))
+            collisions = windows[:, :, variant.rows, variant.cols].sum(axis=2)
+            anchors = np.argwhere(collisions == 0)
+            if len(anchors) == 0:
+                continue
+
+            cell_ids = (anchors[:, :1] + variant.rows) * colonnes + anchors[:, 1:] + variant.cols
+            self.add_block(piece, np.full(len(anchors), variante_index), anchors, cell_ids)
+            row_id = len(matrix)
+            for (i, j), cells in zip(anchors.tolist(), cell_ids.tolist()):
+                matrix.append(Placement(row_id, piece, variante_index, (i, j), tuple(cells), piece_column, colonnes))
+                row_id += 1
+
+    def add_piece_from_table(self, piece, matrix):
+        """
+        Variante de add_piece_to_matrix utilisant la table des placements précalculés:
+        seuls les placements ne touchant aucune cellule occupée sont retenus (mêmes lignes,
+        dans le même ordre).
+
+        Paramètres:
+        - piece (Piece): La pièce à ajouter
+        - matrix (list): La matrice en cours de construction
+        """
+        colonnes = self.plateau.colonnes
+        piece_column = self.piece_columns[piece.nom]
+        variants, positions, cell_ids = self.placement_table.placements(
+            piece.nom, self.occupied.ravel().astype(bool), self.allowed_variants.get(piece.nom))
+        self.add_block(piece, variants, positions, cell_ids)
+        row_id = len(matrix)
+        for variante_index, (i, j), cells in zip(variants.tolist(), positions.tolist(), cell_ids.tolist()):
+            matrix.append(Placement(row_id, piece, variante_index, (i, j), tuple(cells), piece_column, colonnes))
+            row_id += 1
+
+    def add_fixed_piece_to_matrix(self, piece, info, matrix):
+        """
+        Ajoute une pièce déjà fixée à la matrice. Cette ligne sera prioritaire et mise en tête
+        (les pièces fixées sont ajoutées avant les autres).
 
         Paramètres:
         - piece (Piece): La pièce fixée
         - info (dict): Informations sur la variante et la position {'variante_index':..., 'position':...}
         - matrix (list): La matrice à mettre à jour
-        - num_cells (int): Nombre total de cellules du plateau
         """
         variante_index = info['variante_index']
-        position = info['position']
-        variante = piece.variantes[variante_index]
-        row, cells_covered = self.create_row_for_placement(piece, variante, position, num_cells)
-        piece_index = num_cells + list(self.pieces.keys()).index(piece.nom)
-        row[piece_index] = 1
-        matrix.insert(0, {
-            'row': row,
-            'piece': piece,
-            'variante_index': variante_index,
-            'position': position,
-            'cells_covered': cells_covered,
-            'fixed': True
-        })
-
-    def create_row_for_placement(self, piece, variante, position, num_cells):
-        """
-        Crée une ligne de la matrice représentant un placement donné:
-        - Les colonnes de cellules couvertes par la pièce sont mises à 1
-        - La colonne correspondante à la pièce est mise à 1
+        position = tuple(info['position'])
+        cells = self.create_row_for_placement(piece.variants[variante_index], position)
+        self.add_block(piece, [variante_index], [position], [cells], True)
+        matrix.append(Placement(len(matrix), piece, variante_index, position, cells,
+                                self.piece_columns[piece.nom], self.plateau.colonnes, True))
+
+    def add_block(self, piece, variants, positions, cell_ids, fixed=False):
+        """
+        Ajoute un bloc de lignes d'une même pièce à self.arrays (voir PlacementArrays.from_blocks),
+        dans l'ordre des Placement correspondants.
+        """
+        self.blocks.append((self.piece_columns[piece.nom] - len(self.occupied.flat), variants, positions,
+                            cell_ids, fixed))
+
+    def create_row_for_placement(self, variant, position):
+        """
+        Calcule les cellules couvertes par un placement donné
+        (la colonne de la pièce est ajoutée par l'appelant).
 
         Paramètres:
-        - piece (Piece): Pièce à placer
-        - variante (np.ndarray): Variante de la pièce (matrice 2D avec 1 pour cellule occupée)
+        - variant (Variant): Variante de la pièce (voir Piece.variants)
         - position (tuple): (i, j) position de placement dans le plateau
-        - num_cells (int): Nombre total de cellules du plateau
 
         Retourne:
-        - row (list): Ligne de la matrice de contraintes (liste de 0/1)
-        - cells_covered (list): Liste des cellules (i,j) couvertes par ce placement
-        """
-        total_columns = num_cells + len(self.pieces)
-        row = [0] * total_columns
-        cells_covered = []
-        for vi in range(variante.shape[0]):
-            for vj in range(variante.shape[1]):
-                if variante[vi, vj] == 1:
-                    cell_row = position[0] + vi
-                    cell_col = position[1] + vj
-                    cell_index = cell_row * self.plateau.colonnes + cell_col
-                    row[cell_index] = 1
-                    cells_covered.append((cell_row, cell_col))
-        return row, cells_covered
\ No newline at end of file
+        - cells (tuple): Indices (triés) des cellules couvertes (ligne * colonnes + colonne)
+        """
+        return variant.cells(position, self.plateau.colonnes)
@@ -0,0 +1,153 @@
+class DancingLinks:
+    """
+    Implémentation des "Dancing Links" (DLX) de Knuth pour l'algorithme X.
+    La matrice de contraintes est représentée par une structure toroïdale
+    doublement chaînée: chaque 1 de la matrice est un noeud relié à ses voisins
+    gauche/droite (même ligne) et haut/bas (même colonne).
+    Couvrir ou découvrir une colonne se fait en place, sans copier la matrice:
+    le coût d'une branche est proportionnel au nombre de noeuds touchés.
+
+    Pour limiter le coût des objets Python, les liens sont stockés dans des listes
+    d'entiers (L, R, U, D, C) indexées par le numéro de noeud:
+    - Les noeuds 0..num_columns-1 sont les en-têtes de colonnes.
+    - Le noeud num_columns est la racine.
+    - Les noeuds suivants sont les 1 de la matrice, ligne par ligne.
+
+    Paramètres:
+    - matrix (list): Liste des placements (Placement, indexés par id).
+    - index (SparseIndex): Index creux de la matrice (colonnes de chaque ligne).
+    """
+    def __init__(self, matrix, index):
+        num_columns = index.num_columns
+        self.num_columns = num_columns
+        self.root = num_columns
+        count = num_columns + 1
+
+        # En-têtes: chaînés circulairement autour de la racine.
+        self.L = [i - 1 for i in range(count)]
+        self.R = [i + 1 for i in range(count)]
+        self.L[0] = self.root
+        self.R[self.root] = 0
+        self.U = list(range(count))
+        self.D = list(range(count))
+        self.C = list(range(count))
+        self.S = [0] * num_columns  # Nombre de lignes actives par colonne.
+        self.row_of = [-1] * count  # Identifiant de ligne de chaque noeud.
+        self.row_start = []  # Premier noeud de chaque ligne.
+
+        for row_id in range(index.num_rows):
+            self.add_row(row_id, index.columns_of(row_id))
+
+    def add_row(self, row_id, columns):
+        """
+        Ajoute une ligne à la structure, en bas de chacune de ses colonnes.
+        Les lignes doivent être ajoutées dans l'ordre de leurs identifiants.
+
+        Paramètres:
+        - row_id (int): Identifiant de la ligne (indice dans la matrice).
+        - columns (list): Indices des colonnes couvertes par la ligne.
+        """
+        L, R, U, D, C = self.L, self.R, self.U, self.D, self.C
+        first = len(L)
+        for offset, column in enumerate(columns):
+            node = first + offset
+            # Chaînage horizontal (circulaire sur la ligne)
+            L.append(node - 1 if offset > 0 else first + len(columns) - 1)
+            R.append(node + 1 if offset < len(columns) - 1 else first)
+            # Chaînage vertical: insertion en bas de la colonne
+            U.append(U[column])
+            D.append(column)
+            D[U[column]] = node
+            U[column] = node
+            C.append(column)
+            self.row_of.append(row_id)
+            self.S[column] += 1
+        self.row_start.append(first)
+
+    def cover(self, column):
+        """
+        Couvre une colonne: elle est retirée de l'en-tête et toutes les lignes
+        qui la couvrent sont retirées des autres colonnes.
+        """
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[column]] = R[column]
+        L[R[column]] = L[column]
+        i = D[column]
+        while i != column:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, column):
+        """
+        Opération inverse de cover(), effectuée dans l'ordre inverse.
+        """
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[column]
+        while i != column:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[column]] = column
+        L[R[column]] = column
+
+    def select_min_column(self):
+        """
+        Sélectionne la colonne active ayant le moins de lignes (heuristique MRV).
+        En cas d'égalité, la colonne de plus petit indice est choisie.
+
+        Retourne:
+        - int ou None: L'indice de colonne choisie, ou None si toutes les colonnes sont couvertes.
+        """
+        R, S = self.R, self.S
+        column = R[self.root]
+        if column == self.root:
+            return None
+        best, best_size = column, S[column]
+        column = R[column]
+        while column != self.root and best_size > 0:
+            if S[column] < best_size:
+                best, best_size = column, S[column]
+            column = R[column]
+        return best
+
+    def rows_for_column(self, column):
+        """
+        Retourne les identifiants des lignes actives couvrant la colonne donnée.
+        """
+        rows = []
+        i = self.D[column]
+        while i != column:
+            rows.append(self.row_of[i])
+            i = self.D[i]
+        return rows
+
+    def select_row(self, row_id):
+        """
+        Sélectionne une ligne: toutes ses colonnes sont couvertes.
+        """
+        start = self.row_start[row_id]
+        self.cover(self.C[start])
+        j = self.R[start]
+        while j != start:
+            self.cover(self.C[j])
+            j = self.R[j]
+
+    def deselect_row(self, row_id):
+        """
+        Annule select_row() en découvrant les colonnes dans l'ordre inverse.
+        """
+        start = self.row_start[row_id]
+        j = self.L[start]
+        while j != start:
+            self.uncover(self.C[j])
+            j = self.L[j]
+        self.uncover(self.C[start])
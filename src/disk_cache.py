@@ -0,0 +1,93 @@
+import os
+import json
+import tempfile
+import numpy as np
+
+# Répertoire du cache sur disque (ignoré par git). Peut être changé via la variable
+# d'environnement IQ_SOLVER_CACHE_DIR.
+CACHE_DIR = os.environ.get(
+    "IQ_SOLVER_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".cache")
+)
+
+
+def cache_path(name):
+    """
+    Retourne le chemin d'un fichier du cache.
+
+    Paramètres:
+    - name (str): Nom du fichier dans le répertoire de cache.
+    """
+    return os.path.join(CACHE_DIR, name)
+
+
+def load_json(name):
+    """
+    Charge un fichier JSON du cache.
+
+    Retourne:
+    - L'objet lu, ou None si le fichier est absent ou illisible.
+    """
+    try:
+        with open(cache_path(name), "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(name, data):
+    """
+    Écrit un fichier JSON dans le cache. L'écriture passe par un fichier temporaire
+    renommé ensuite, pour qu'un lecteur concurrent ne voie jamais un fichier partiel.
+    Le cache étant facultatif, une erreur d'écriture est ignorée.
+
+    Retourne:
+    - bool: True si le fichier a été écrit.
+    """
+    return _write_atomic(name, "w", lambda file: json.dump(data, file))
+
+
+def load_arrays(name):
+    """
+    Charge un fichier de tableaux NumPy (format .npz) du cache.
+
+    Retourne:
+    - dict: {nom: np.ndarray}, ou None si le fichier est absent ou illisible.
+    """
+    try:
+        with np.load(cache_path(name), allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+    except (OSError, ValueError):
+        return None
+
+
+def save_arrays(name, arrays):
+    """
+    Écrit des tableaux NumPy dans un fichier binaire du cache (format .npz, voir save_json()).
+
+    Paramètres:
+    - arrays (dict): {nom: np.ndarray}.
+
+    Retourne:
+    - bool: True si le fichier a été écrit.
+    """
+    return _write_atomic(name, "wb", lambda file: np.savez(file, **arrays))
+
+
+def _write_atomic(name, mode, write):
+    """
+    Écrit un fichier du cache via un fichier temporaire renommé (les erreurs sont ignorées).
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode) as file:
+                write(file)
+            os.replace(temp_path, cache_path(name))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        return False
+    return True
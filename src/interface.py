@@ -11,6 +11,7 @@ from solve_manager import SolverManager
 from multi_solver_manager import MultiHeuristicManager
 import threading
 from polyminos_generator import GridPolyminoGenerator
+from piece_sets import CLASSIC_PIECES
 
 PIECE_COLORS = {
         "red": "red", "orange": "orange", "yellow": "yellow", "lime": "lime",
@@ -42,9 +43,9 @@ class IQPuzzlerInterface:
 
     La logique d'interaction avec l'algorithme a été modifiée pour:
     - Utiliser un SolverManager au lieu d'un callback.
-    - L'interface lance l'algo (run()), puis dans une boucle (ou via un timer),
-      elle appelle get_stats(), get_current_solution_steps() pour rafraîchir l'affichage.
-    - Une fois l'algo terminé, on affiche la solution finale.
+    - L'interface lance l'algo (run()), puis via un timer, elle récupère les événements
+      de progression publiés par la recherche (get_events()) pour rafraîchir l'affichage.
+    - Une fois l'algo terminé (événement "done"), on affiche la solution finale.
     """
     def __init__(self, root):
         self.root = root
@@ -103,6 +104,7 @@ class IQPuzzlerInterface:
 
         # Chargement des pièces
         self.pieces = {}
+        self.generator = None  # Générateur des pièces (plateaux autres que 5x11)
         self.load_pieces()
 
         # Cadre des contrôles
@@ -164,6 +166,10 @@ class IQPuzzlerInterface:
         self.review_button = ttk.Button(self.controls_frame, text="Rewind all steps", command=self.review_intermediate_steps, bootstyle="primary")
         self.review_button.grid(row=4, column=2, columnspan=3, pady=5)
 
+        self.record_steps = tk.BooleanVar(value=False)
+        self.record_steps_check = ttk.Checkbutton(self.controls_frame, text="Record steps", variable=self.record_steps)
+        self.record_steps_check.grid(row=5, column=0, columnspan=3, pady=5)
+
         self.step_cursor_label = tk.Label(self.controls_frame, text="Steps to Skip:")
         self.step_cursor_label.grid(row=6, column=0, pady=5)
 
@@ -217,7 +223,7 @@ class IQPuzzlerInterface:
         Démarre une animation pour visualiser toutes les étapes intermédiaires enregistrées.
         """
         if self.manager and self.manager.algo:
-            all_intermediate = self.manager.algo.stats.intermediate_steps_record
+            all_intermediate = self.manager.get_intermediate_steps()
             if all_intermediate:
                 self.solution_steps = all_intermediate
                 self.current_step = -1 
@@ -226,6 +232,8 @@ class IQPuzzlerInterface:
                 self.stop_button.config(state="normal") 
                 self.stepsskipped = int(self.step_cursor.get())
                 self.animate_intermediate_steps()
+            elif not self.manager.record_steps:
+                messagebox.showinfo("Info", "Activez \"Record steps\" avant la résolution pour enregistrer les étapes.")
             else:
                 messagebox.showinfo("Info", "Aucune étape intermédiaire enregistrée.")
         else:
@@ -252,9 +260,9 @@ class IQPuzzlerInterface:
             self.reset_board_visuellement()
 
             for placement in step:
-                piece = placement['piece']
+                piece = placement.piece
                 color = PIECE_COLORS.get(piece.nom, "gray")
-                for cell in placement['cells_covered']:
+                for cell in placement.cells_covered:
                     i, j = cell
                     self.cases[i][j].configure(bg=color)
 
@@ -269,10 +277,13 @@ class IQPuzzlerInterface:
 
             
 
-    def update_grid_size(self):
+    def update_grid_size(self, generator=None):
         """
         Met à jour la taille de la grille en fonction des valeurs entrées,
         génère de nouvelles pièces si la taille n'est pas 5x11.
+
+        Paramètres:
+        - generator (GridPolyminoGenerator): Pièces déjà générées à réutiliser (plateau rechargé), optionnel.
         """
         try:
             new_x = int(self.grid_x_spinbox.get())
@@ -304,7 +315,7 @@ class IQPuzzlerInterface:
             self.init_plateau()
             self.pieces = {}
             self.placed_pieces = {}
-            self.load_pieces() 
+            self.load_pieces(generator)
             self.afficher_plateau()
             self.step_progress_label.config(text="")
         except ValueError:
@@ -336,21 +347,18 @@ class IQPuzzlerInterface:
         """
         if self.selected_piece:
             piece = self.pieces[self.selected_piece]
-            variante = piece.variantes[self.rotation_index]
             positions = []
             valid_placement = True
 
-            for dx in range(variante.shape[0]):
-                for dy in range(variante.shape[1]):
-                    if variante[dx][dy] == 1:
-                        x, y = i + dx, j + dy
-                        if 0 <= x < self.grid_y and 0 <= y < self.grid_x:
-                            if self.plateau.plateau[x][y] == 0:
-                                positions.append((x, y))
-                            else:
-                                valid_placement = False
-                        else:
-                            valid_placement = False
+            for dx, dy in piece.variants[self.rotation_index].offsets:
+                x, y = i + dx, j + dy
+                if 0 <= x < self.grid_y and 0 <= y < self.grid_x:
+                    if self.plateau.plateau[x][y] == 0:
+                        positions.append((x, y))
+                    else:
+                        valid_placement = False
+                else:
+                    valid_placement = False
 
             piece_color = PIECE_COLORS.get(self.selected_piece, "gray")
             hover_color = piece_color if valid_placement else "gray"
@@ -379,31 +387,25 @@ class IQPuzzlerInterface:
                         break
                 self.cases[i][j].configure(bg=color)
 
-    def load_pieces(self):
+    def load_pieces(self, generator=None):
         """
         Charge la liste des pièces définies (selon version),
         ou génère des pièces aléatoires si la taille n'est pas 5x11.
+
+        Paramètres:
+        - generator (GridPolyminoGenerator): Pièces déjà générées à réutiliser, optionnel.
         """
         if self.version == 1:
             # On garde les pièces du jeu de base
-            piece_definitions = [
-                ("red", [[1, 1, 1, 1], [0, 0, 0, 1]]),
-                ("orange", [[0, 1, 0], [1, 1, 1], [1, 0, 0]]),
-                ("yellow", [[1, 1, 1, 1], [0, 1, 0, 0]]),
-                ("lime", [[1, 1, 1], [1, 0, 1]]),
-                ("green", [[1, 1, 1], [0, 1, 0]]),
-                ("white", [[1, 1, 1], [0, 1, 1]]),
-                ("cyan", [[0, 1], [1, 1]]),
-                ("skyblue", [[1, 1, 1], [1, 0, 0], [1, 0, 0]]),
-                ("blue", [[0, 0, 1], [1, 1, 1]]),
-                ("purple", [[1, 1, 0], [0, 1, 1], [0, 0, 1]]),
-                ("darkred", [[0, 1, 1], [1, 1, 0]]),
-                ("pink", [[1, 1, 0, 0], [0, 1, 1, 1]])
-            ]
+            self.generator = None
+            piece_definitions = CLASSIC_PIECES
         else:
-            # On génère des polyminos aléatoires en fonction de la taille de la grille
-            generator = GridPolyminoGenerator(self.grid_y, self.grid_x)
-            generator.generate()
+            # On génère des polyminos aléatoires en fonction de la taille de la grille.
+            # Le générateur est conservé: sa graine et ses pièces sont enregistrées avec le plateau.
+            if generator is None:
+                generator = GridPolyminoGenerator(self.grid_y, self.grid_x)
+                generator.generate()
+            self.generator = generator
             piece_definitions = generator.get_piece_definitions()
 
         self.nbrpieces = len(piece_definitions)
@@ -447,15 +449,13 @@ class IQPuzzlerInterface:
         canvas = piece.preview_canvas
         canvas.delete("all")
 
-        variante = piece.variantes[self.rotation_index] if self.selected_piece == piece_name else piece.variantes[0]
+        variant = piece.variants[self.rotation_index] if self.selected_piece == piece_name else piece.variants[0]
         color = PIECE_COLORS.get(piece_name, "gray")
 
-        for i, row in enumerate(variante):
-            for j, val in enumerate(row):
-                if val == 1:
-                    x0, y0 = j * 15, i * 15
-                    x1, y1 = x0 + 15, y0 + 15
-                    canvas.create_rectangle(x0, y0, x1, y1, fill=color)
+        for i, j in variant.offsets:
+            x0, y0 = j * 15, i * 15
+            x1, y1 = x0 + 15, y0 + 15
+            canvas.create_rectangle(x0, y0, x1, y1, fill=color)
 
     def select_piece(self, piece_name):
         """
@@ -497,10 +497,9 @@ class IQPuzzlerInterface:
         """
         if self.selected_piece:
             piece = self.pieces[self.selected_piece]
-            variante = piece.variantes[self.rotation_index]
-            if self.plateau.peut_placer(variante, (i, j)):
+            if self.plateau.peut_placer(piece, self.rotation_index, (i, j)):
                 self.plateau.placer_piece(piece, self.rotation_index, (i, j))
-                positions = [(i + dx, j + dy) for dx, row in enumerate(variante) for dy, val in enumerate(row) if val == 1]
+                positions = [(i + dx, j + dy) for dx, dy in piece.variants[self.rotation_index].offsets]
                 self.placed_pieces[self.selected_piece] = {
                     'variante_index': self.rotation_index,
                     'position': (i, j),
@@ -553,6 +552,9 @@ class IQPuzzlerInterface:
                     'variante_index': info['variante_index'],
                     'position': info['position']
                 }
+            if self.generator is not None:
+                # Pièces générées et pavage de référence: le plateau se recharge à l'identique
+                data['generator'] = self.generator.to_dict()
             with open(fichier, 'w') as f:
                 json.dump(data, f)
             messagebox.showinfo("Sauvegarde", "Plateau sauvegardé avec succès.")
@@ -566,6 +568,14 @@ class IQPuzzlerInterface:
             with open(fichier, 'r') as f:
                 data = json.load(f)
 
+            if 'generator' in data:
+                # Plateau généré: on recrée la grille et ses pièces avant de placer les pièces
+                generator = GridPolyminoGenerator.from_dict(data['generator'])
+                for spinbox, value in ((self.grid_x_spinbox, generator.cols), (self.grid_y_spinbox, generator.rows)):
+                    spinbox.delete(0, "end")
+                    spinbox.insert(0, str(value))
+                self.update_grid_size(generator)
+
             self.reset_board()
 
             for piece_name, info in data.get('placed_pieces', {}).items():
@@ -573,13 +583,11 @@ class IQPuzzlerInterface:
                     piece = self.pieces[piece_name]
                     variante_index = info['variante_index']
                     position = tuple(info['position'])
-                    variante = piece.variantes[variante_index]
 
-                    if self.plateau.peut_placer(variante, position):
+                    if self.plateau.peut_placer(piece, variante_index, position):
                         self.plateau.placer_piece(piece, variante_index, position)
                         positions = [(position[0] + dx, position[1] + dy)
-                                     for dx, row in enumerate(variante)
-                                     for dy, val in enumerate(row) if val == 1]
+                                     for dx, dy in piece.variants[variante_index].offsets]
                         self.placed_pieces[piece_name] = {
                             'variante_index': variante_index,
                             'position': position,
@@ -613,7 +621,8 @@ class IQPuzzlerInterface:
             plateau_copy,
             self.pieces,
             heuristic,
-            fixed_pieces
+            fixed_pieces,
+            record_steps=self.record_steps.get()
         )
 
         self.disable_controls()
@@ -626,26 +635,28 @@ class IQPuzzlerInterface:
 
     def update_feedback(self):
         """
-        Mise à jour continue de l'interface pendant la résolution.
+        Mise à jour continue de l'interface pendant la résolution, à partir des événements
+        publiés par la recherche (seul le plus récent est affiché).
         """
-        if self.manager.running:
-            stats = self.manager.get_stats()
-            self.update_stats_display(stats)
-
+        events = self.manager.get_events()
+        done = next((event for event in events if event["type"] == "done"), None)
+        if done is None:
+            if events:
+                self.update_stats_display(events[-1]["stats"])
             self.root.after(50, self.update_feedback)
+            return
+
+        if done["solution"]:
+            self.solution = done["solution"]
+            self.solution_steps = done["partial"]
+            self.current_step = -1
+            self.update_stats_display(done["stats"])
+            self.afficher_solution()
         else:
-            solutions = self.manager.get_solutions()
-            if solutions:
-                self.solution = solutions[0]
-                self.solution_steps = self.manager.get_current_solution_steps()
-                self.current_step = -1
-                self.update_stats_display()
-                self.afficher_solution()
-            else:
-                self.update_info("Aucune solution trouvée.")
-                self.afficher_plateau()
+            self.update_info("Aucune solution trouvée.")
+            self.afficher_plateau()
 
-            self.enable_controls()
+        self.enable_controls()
 
     def display_intermediate_solution(self, current_solution):
         """
@@ -660,9 +671,9 @@ class IQPuzzlerInterface:
                 self.cases[i][j].configure(bg=color)
 
         for step in current_solution:
-            piece = step['piece']
+            piece = step.piece
             color = PIECE_COLORS.get(piece.nom, "gray")
-            for cell in step['cells_covered']:
+            for cell in step.cells_covered:
                 i, j = cell
                 self.cases[i][j].configure(bg=color)
 
@@ -728,9 +739,9 @@ class IQPuzzlerInterface:
                 self.cases[i][j].configure(bg=color)
 
         for step in self.solution_steps[:self.current_step + 1]:
-            piece = step['piece']
+            piece = step.piece
             color = PIECE_COLORS.get(piece.nom, "gray")
-            for cell in step['cells_covered']:
+            for cell in step.cells_covered:
                 i, j = cell
                 self.cases[i][j].configure(bg=color)
 
@@ -742,9 +753,9 @@ class IQPuzzlerInterface:
             return
         self.reset_board()
         for sol in self.solution:
-            piece = sol['piece']
+            piece = sol.piece
             color = PIECE_COLORS.get(piece.nom, "gray") 
-            for cell in sol['cells_covered']:
+            for cell in sol.cells_covered:
                 i, j = cell
                 self.cases[i][j].configure(bg=color)
 
@@ -839,12 +850,14 @@ class IQPuzzlerInterface:
             plateau_copy,
             self.pieces,
             heuristics_list,
-            fixed_pieces
+            fixed_pieces,
+            use_processes=True
         )
 
         self.disable_controls()
         self.is_solving = True
 
+        self.multi_stats = {heuristic: {} for heuristic in heuristics_list}
         self.multi_manager.run_all()
 
         # Lancer une mise à jour périodique comme avec update_feedback, mais pour multi
@@ -852,14 +865,20 @@ class IQPuzzlerInterface:
 
     def update_feedback_multi(self):
         """
-        Met à jour l'interface pendant la résolution multi-heuristique.
+        Met à jour l'interface pendant la résolution multi-heuristique
+        (statistiques issues des derniers événements de chaque heuristique).
         """
+        for event in self.multi_manager.get_events():
+            self.multi_stats[event["source"]] = event["stats"]
         finished, stats, solution, winner_heuristic = self.multi_manager.check_status()
 
         info_text = "Résolution en cours...\nHeuristiques testées:\n"
 
         for heuristic, manager in self.multi_manager.managers:
-            manager_stats = manager.get_stats()
+            manager_stats = self.multi_stats.get(heuristic)
+            if not manager_stats:
+                info_text += f"  - {heuristic} : démarrage...\n"
+                continue
             running = self.multi_manager.results[heuristic]["running"]
 
             info_text += f"  - {heuristic} : "
@@ -0,0 +1,147 @@
+import json
+import operator
+from piece import Piece
+from plateau import Plateau
+from piece_sets import CLASSIC_PIECES
+from polyminos_generator import GridPolyminoGenerator
+
+
+def load_level(path):
+    """
+    Lit un niveau au format des fichiers de levels/ (et de la sauvegarde de l'interface):
+    {"placed_pieces": {nom: {"variante_index": int, "position": [ligne, colonne]}}}.
+
+    Retourne:
+    - dict: {nom: {'variante_index': int, 'position': (ligne, colonne)}}.
+
+    Lève:
+    - ValueError: Fichier qui n'est pas du JSON ou entrée mal formée (voir parse_placement()).
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    placed_pieces = {}
+    for nom, info in data.get('placed_pieces', {}).items():
+        variante_index, position = parse_placement(nom, info)
+        placed_pieces[nom] = {'variante_index': variante_index, 'position': position}
+    return placed_pieces
+
+
+def parse_placement(nom, info):
+    """
+    Lit l'indice de variante et la position d'une entrée de niveau.
+
+    Paramètres:
+    - nom (str): Nom de la pièce (pour le message d'erreur).
+    - info (dict): {'variante_index': int, 'position': [ligne, colonne]}.
+
+    Retourne:
+    - tuple: (variante_index, (ligne, colonne)).
+
+    Lève:
+    - ValueError: Variante ou position qui ne sont pas des entiers, position sans deux valeurs.
+    - KeyError: Entrée sans 'variante_index' ou sans 'position'.
+    """
+    try:
+        variante_index = operator.index(info['variante_index'])
+        ligne, colonne = (operator.index(v) for v in info['position'])
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid placement for piece {nom}: {info!r}") from None
+    return variante_index, (ligne, colonne)
+
+
+def load_piece_definitions(spec="classic", lignes=5, colonnes=11, seed=None):
+    """
+    Retourne un jeu de pièces au format [(nom, forme)].
+
+    Paramètres:
+    - spec (str): "classic" (jeu de base 5x11), "generated" (polyminos aléatoires pavant
+      un plateau lignes x colonnes, comme l'interface pour les autres tailles) ou chemin
+      d'un fichier JSON contenant une liste [[nom, forme], ...] (ou {"pieces": [...]}, par exemple
+      un plateau exporté avec GridPolyminoGenerator.save()).
+    - lignes, colonnes (int): Taille du plateau (pour "generated").
+    - seed (int): Graine du générateur (pour "generated"), optionnelle.
+    """
+    if spec == "classic":
+        return list(CLASSIC_PIECES)
+    if spec == "generated":
+        generator = GridPolyminoGenerator(lignes, colonnes, seed=seed)
+        generator.generate()
+        return generator.get_piece_definitions()
+    with open(spec, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data['pieces']
+    return [(nom, forme) for nom, forme in data]
+
+
+def build_pieces(piece_definitions):
+    """
+    Crée les pièces {nom: Piece} à partir de définitions [(nom, forme)].
+    """
+    return {nom: Piece(nom, forme) for nom, forme in piece_definitions}
+
+
+def place_level(placed_pieces, plateau, pieces):
+    """
+    Pose les pièces d'un niveau sur le plateau.
+
+    Paramètres:
+    - placed_pieces (dict): Pièces du niveau (voir load_level()).
+    - plateau (Plateau): Plateau à remplir.
+    - pieces (dict): Dictionnaire {nom: Piece}.
+
+    Retourne:
+    - dict: Pièces fixées {nom: {'variante_index', 'position'}}, pour AlgorithmX.
+
+    Lève:
+    - ValueError: Pièce inconnue, entrée mal formée (voir parse_placement()), variante
+      inexistante ou placement impossible (hors du plateau ou sur une cellule occupée).
+    - KeyError: Entrée sans 'variante_index' ou sans 'position'.
+    """
+    fixed_pieces = {}
+    for nom, info in placed_pieces.items():
+        if nom not in pieces:
+            raise ValueError(f"Unknown piece: {nom}")
+        piece = pieces[nom]
+        variante_index, position = parse_placement(nom, info)
+        ligne, colonne = position
+        if not 0 <= variante_index < len(piece.variantes):
+            raise ValueError(f"Unknown variant {variante_index} for piece {nom}")
+        if ligne < 0 or colonne < 0 or not plateau.peut_placer(piece, variante_index, position):
+            raise ValueError(f"Cannot place piece {nom} at {list(position)}")
+        plateau.placer_piece(piece, variante_index, position)
+        fixed_pieces[nom] = {'variante_index': variante_index, 'position': position}
+    return fixed_pieces
+
+
+def load_problem(path, lignes, colonnes, piece_definitions, placed_pieces=None):
+    """
+    Construit un problème complet (plateau, pièces, pièces fixées) à partir d'un niveau.
+
+    Paramètres:
+    - path (str): Fichier du niveau, ou None pour le plateau vide.
+    - lignes, colonnes (int): Taille du plateau.
+    - piece_definitions (list): Jeu de pièces [(nom, forme)].
+    - placed_pieces (dict): Pièces du niveau déjà lues (voir load_level()), utilisées à la
+      place du fichier, optionnel (par exemple un niveau d'un LevelStore).
+
+    Retourne:
+    - tuple: (Plateau, {nom: Piece}, pièces fixées).
+    """
+    plateau = Plateau(lignes, colonnes)
+    pieces = build_pieces(piece_definitions)
+    if placed_pieces is None:
+        placed_pieces = load_level(path) if path else {}
+    fixed_pieces = place_level(placed_pieces, plateau, pieces)
+    return plateau, pieces, fixed_pieces
+
+
+def solution_to_placed_pieces(solution):
+    """
+    Convertit une solution (liste de placements) au format "placed_pieces" des niveaux:
+    le résultat peut être rechargé comme un niveau.
+    """
+    return {
+        p.piece.nom: {'variante_index': int(p.variante_index), 'position': [int(v) for v in p.position]}
+        for p in solution
+    }
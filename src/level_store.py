@@ -0,0 +1,196 @@
+import json
+import os
+import struct
+import numpy as np
+
+# Signature et version du format des fichiers de niveaux binaires.
+STORE_MAGIC = b"IQLS"
+STORE_VERSION = 1
+
+# Extension des fichiers de niveaux binaires (reconnue par cli.py).
+STORE_EXTENSION = ".iqls"
+
+# Identifiant de pièce d'un emplacement inutilisé dans un enregistrement.
+EMPTY_PIECE = 255
+
+# Un placement: identifiant de pièce (indice dans la liste des pièces du fichier),
+# indice de variante et position (ligne, colonne) du coin haut-gauche de la variante.
+PLACEMENT_DTYPE = np.dtype([("piece", "u1"), ("variant", "u1"), ("row", "<u2"), ("col", "<u2")])
+
+# Taille de l'en-tête (signature, version, longueur de la description JSON qui suit).
+HEADER_STRUCT = struct.Struct("<4sII")
+
+# Alignement du début des enregistrements dans le fichier.
+RECORD_ALIGNMENT = 64
+
+
+def record_dtype(max_pieces):
+    """
+    Type d'un enregistrement: nombre de solutions connu (-1: inconnu) puis max_pieces placements.
+    """
+    return np.dtype([("solutions", "<i8"), ("placements", PLACEMENT_DTYPE, (max_pieces,))])
+
+
+class LevelStore:
+    """
+    Fichier binaire de niveaux (ou de solutions) à enregistrements de taille fixe,
+    lisible via numpy.memmap: on peut conserver des millions de niveaux générés et leur
+    nombre de solutions, et les parcourir ou les filtrer avec NumPy sans analyser de JSON
+    ni tout charger en mémoire.
+
+    Un enregistrement contient le nombre de solutions connu du niveau (-1 si inconnu) et
+    jusqu'à max_pieces placements (pièce, variante, ligne, colonne); les emplacements
+    inutilisés ont la pièce EMPTY_PIECE. Une solution est enregistrée comme un niveau dont
+    toutes les pièces sont placées (voir level_loader.solution_to_placed_pieces).
+
+    Format: en-tête (STORE_MAGIC, version, longueur de la description), description JSON
+    {"rows", "cols", "pieces": [noms], "max_pieces"}, puis les enregistrements à partir d'un
+    multiple de RECORD_ALIGNMENT octets.
+
+    Paramètres:
+    - path (str): Fichier existant (voir create() pour en créer un).
+    - mode (str): "r" (lecture seule) ou "r+" (modification des enregistrements, ajouts).
+
+    Utilisation:
+    store = LevelStore("levels.iqls")
+    unique = np.flatnonzero(store.records["solutions"] == 1)  # Niveaux à solution unique
+    placed_pieces = store.get(unique[0])
+    """
+    def __init__(self, path, mode="r"):
+        if mode not in ("r", "r+"):
+            raise ValueError(f"Unknown mode: {mode}")
+        self.path = path
+        self.mode = mode
+        with open(path, "rb") as f:
+            magic, version, length = HEADER_STRUCT.unpack(f.read(HEADER_STRUCT.size))
+            if magic != STORE_MAGIC or version != STORE_VERSION:
+                raise ValueError(f"Not a level store (or unsupported version): {path}")
+            header = json.loads(f.read(length).decode())
+        self.lignes = header["rows"]
+        self.colonnes = header["cols"]
+        self.piece_names = header["pieces"]
+        self.piece_ids = {nom: k for k, nom in enumerate(self.piece_names)}
+        self.max_pieces = header["max_pieces"]
+        self.dtype = record_dtype(self.max_pieces)
+        self.offset = self.header_size(length)
+        self._records = None
+
+    @staticmethod
+    def header_size(length):
+        size = HEADER_STRUCT.size + length
+        return -(-size // RECORD_ALIGNMENT) * RECORD_ALIGNMENT
+
+    @classmethod
+    def create(cls, path, lignes, colonnes, piece_names, max_pieces=None):
+        """
+        Crée un fichier vide (écrase un fichier existant) et l'ouvre en modification.
+
+        Paramètres:
+        - lignes, colonnes (int): Taille du plateau.
+        - piece_names (list): Noms des pièces (l'identifiant d'une pièce est son indice).
+        - max_pieces (int): Nombre maximal de placements par enregistrement (par défaut,
+          le nombre de pièces).
+        """
+        if len(piece_names) >= EMPTY_PIECE:
+            raise ValueError(f"Too many pieces for a level store: {len(piece_names)}")
+        header = json.dumps({
+            "rows": lignes,
+            "cols": colonnes,
+            "pieces": list(piece_names),
+            "max_pieces": max_pieces if max_pieces is not None else len(piece_names),
+        }).encode()
+        with open(path, "wb") as f:
+            f.write(HEADER_STRUCT.pack(STORE_MAGIC, STORE_VERSION, len(header)))
+            f.write(header)
+            f.write(b"\0" * (cls.header_size(len(header)) - HEADER_STRUCT.size - len(header)))
+        return cls(path, "r+")
+
+    @property
+    def records(self):
+        """
+        Enregistrements (tableau structuré projeté en mémoire, voir record_dtype()).
+        """
+        if self._records is None:
+            count = (os.path.getsize(self.path) - self.offset) // self.dtype.itemsize
+            if count == 0:
+                # numpy.memmap refuse les fichiers vides
+                return np.zeros(0, dtype=self.dtype)
+            self._records = np.memmap(self.path, dtype=self.dtype, mode=self.mode,
+                                      offset=self.offset, shape=(count,))
+        return self._records
+
+    def __len__(self):
+        return len(self.records)
+
+    def encode(self, placed_pieces, solutions=-1):
+        """
+        Convertit un niveau au format "placed_pieces" en enregistrement.
+        """
+        if len(placed_pieces) > self.max_pieces:
+            raise ValueError(f"Too many placed pieces: {len(placed_pieces)} > {self.max_pieces}")
+        record = np.zeros((), dtype=self.dtype)
+        record["solutions"] = solutions
+        record["placements"]["piece"] = EMPTY_PIECE
+        for k, (nom, info) in enumerate(placed_pieces.items()):
+            if nom not in self.piece_ids:
+                raise ValueError(f"Unknown piece: {nom}")
+            row, col = info["position"]
+            record["placements"][k] = (self.piece_ids[nom], info["variante_index"], row, col)
+        return record
+
+    def decode(self, record):
+        """
+        Convertit un enregistrement en niveau au format "placed_pieces" (voir level_loader.load_level).
+        """
+        return {
+            self.piece_names[piece]: {"variante_index": int(variant), "position": (int(row), int(col))}
+            for piece, variant, row, col in record["placements"].tolist()
+            if piece != EMPTY_PIECE
+        }
+
+    def get(self, index):
+        """
+        Retourne le niveau d'indice index au format "placed_pieces".
+        """
+        return self.decode(self.records[index])
+
+    def solution_count(self, index):
+        return int(self.records[index]["solutions"])
+
+    def set_solution_count(self, index, solutions):
+        """
+        Met à jour le nombre de solutions d'un niveau (mode "r+").
+        """
+        self.records[index]["solutions"] = solutions
+
+    def extend(self, levels):
+        """
+        Ajoute des niveaux en fin de fichier (mode "r+").
+
+        Paramètres:
+        - levels (iterable): Couples (placed_pieces, nombre de solutions ou -1).
+        """
+        if self.mode != "r+":
+            raise ValueError("Level store opened read-only")
+        batch = np.array([self.encode(placed, solutions) for placed, solutions in levels], dtype=self.dtype)
+        self.flush()
+        with open(self.path, "ab") as f:
+            f.write(batch.tobytes())
+        self._records = None  # Nouvelle projection au prochain accès
+
+    def append(self, placed_pieces, solutions=-1):
+        self.extend([(placed_pieces, solutions)])
+
+    def flush(self):
+        if isinstance(self._records, np.memmap):
+            self._records.flush()
+
+    def close(self):
+        self.flush()
+        self._records = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,94 @@
+class MatrixEngine:
+    """
+    Moteur de couverture exacte historique, basé sur la liste de placements.
+    Au lieu de reconstruire une matrice réduite à chaque branche, on marque les
+    lignes retirées comme inactives. L'index creux (SparseIndex) permet d'aller
+    directement aux placements couvrant une colonne, et aux lignes en conflit
+    avec un placement choisi: aucun parcours complet de la matrice n'est nécessaire.
+
+    Le nombre de lignes actives couvrant chaque colonne est maintenu de façon incrémentale:
+    les lignes retirées par une sélection décrémentent les compteurs et les
+    réincrémentent à la désélection. La sélection MRV est alors en O(colonnes).
+
+    Ce moteur est conservé comme référence; DancingLinks est plus rapide.
+
+    Paramètres:
+    - matrix (list): Liste des placements (Placement, indexés par id).
+    - index (SparseIndex): Index creux de la matrice.
+    - incremental_counts (bool): Si False, les compteurs sont recalculés à chaque noeud
+      (comportement historique, utile pour les benchmarks).
+    """
+    def __init__(self, matrix, index, incremental_counts=True):
+        self.rows = matrix
+        self.num_columns = index.num_columns
+        self.row_columns = [list(index.columns_of(r)) for r in range(index.num_rows)]
+        self.column_rows = [list(index.rows_of(c)) for c in range(index.num_columns)]
+        self.alive = bytearray([1]) * index.num_rows
+        self.incremental_counts = incremental_counts
+        self.counts = [len(rows) for rows in self.column_rows]
+        self.removed_rows = []  # Lignes retirées à chaque sélection (pour les restaurer).
+
+    def count_columns(self):
+        """
+        Compte, pour chaque colonne, le nombre de lignes actives qui la couvrent.
+
+        Retourne:
+        - counts (list): Nombre de lignes par colonne.
+        """
+        counts = [0] * self.num_columns
+        alive = self.alive
+        for row_id, columns in enumerate(self.row_columns):
+            if alive[row_id]:
+                for idx in columns:
+                    counts[idx] += 1
+        return counts
+
+    def select_min_column(self):
+        """
+        Sélectionne la colonne avec le moins d'options (heuristique MRV - Minimum Remaining Values).
+        On utilise pour chaque colonne le nombre de lignes (placements) qui la couvrent.
+        La colonne avec le moins d'options est choisie car plus contraignante,
+        réduisant l'espace de recherche.
+
+        Retourne:
+        - int ou None: L'indice de colonne choisie, ou None si aucune (matrice vide).
+        """
+        counts = self.counts if self.incremental_counts else self.count_columns()
+        counts = [c if c > 0 else float('inf') for c in counts]
+        m = min(counts)
+        if m == float('inf'):
+            return None
+        return counts.index(m)
+
+    def rows_for_column(self, column):
+        """
+        Retourne les identifiants des lignes actives couvrant la colonne.
+        """
+        alive = self.alive
+        return [row_id for row_id in self.column_rows[column] if alive[row_id]]
+
+    def select_row(self, row_id):
+        """
+        Sélectionne un placement: toutes les lignes qui couvrent une de ses colonnes
+        (y compris lui-même) sont désactivées.
+        """
+        alive, counts, row_columns = self.alive, self.counts, self.row_columns
+        removed = []
+        for column in row_columns[row_id]:
+            for other in self.column_rows[column]:
+                if alive[other]:
+                    alive[other] = 0
+                    removed.append(other)
+                    for idx in row_columns[other]:
+                        counts[idx] -= 1
+        self.removed_rows.append(removed)
+
+    def deselect_row(self, row_id):
+        """
+        Annule le dernier select_row() en réactivant les lignes retirées.
+        """
+        alive, counts, row_columns = self.alive, self.counts, self.row_columns
+        for other in self.removed_rows.pop():
+            alive[other] = 1
+            for idx in row_columns[other]:
+                counts[idx] += 1
@@ -1,6 +1,11 @@
 import threading
 import time
+import queue
+import multiprocessing
 from solve_manager import SolverManager
+from process_solver import ProcessSolverProxy
+from cancellation import StopSignal
+from progress import DEFAULT_EVENT_CAPACITY, drain_events
 
 class MultiHeuristicManager:
     """
@@ -13,29 +18,48 @@ class MultiHeuristicManager:
     - pieces (dict): Dictionnaire des pièces {nom: Piece}.
     - heuristics (list): Liste des heuristiques à lancer en parallèle. Ex: ["ascender", "descender", "holes"]
     - fixed_pieces (dict): Pièces pré-placées, optionnel.
+    - engine (str): Moteur de couverture exacte utilisé par chaque SolverManager.
+    - use_processes (bool): Lance chaque heuristique dans son propre processus (ProcessSolverProxy)
+      plutôt que dans un thread: les heuristiques s'exécutent alors réellement en parallèle
+      (pas de GIL partagé). Les processus partagent un signal d'arrêt (StopSignal), levé par le
+      premier qui trouve une solution: les autres s'arrêtent en quelques noeuds.
+
+    Les événements de progression de toutes les branches arrivent dans une même file
+    (get_events()); le champ 'source' de chaque événement indique son heuristique.
 
     Utilisation:
     multi_manager = MultiHeuristicManager(plateau_copy, pieces, ["ascender", "descender", "holes"], fixed_pieces)
     multi_manager.run_all()
     # On peut ensuite périodiquement checker:
+    # events = multi_manager.get_events()
     # finished, stats, solution = multi_manager.check_status()
     # finished = True si l'une des branches a terminé. On récupère stats et solution.
     """
 
-    def __init__(self, plateau, pieces, heuristics, fixed_pieces=None):
+    def __init__(self, plateau, pieces, heuristics, fixed_pieces=None, engine="dlx", use_processes=False):
         self.plateau = plateau
         self.pieces = pieces
         self.heuristics = heuristics
         self.fixed_pieces = fixed_pieces if fixed_pieces else {}
-        
+        self.engine = engine
+        self.use_processes = use_processes
+        if use_processes:
+            self.context = multiprocessing.get_context("spawn")
+            self.stop_signal = StopSignal(self.context)
+
         self.managers = []
         self.threads = []
         self.results = {}
         self.lock = threading.Lock()
+        self.events = queue.Queue(DEFAULT_EVENT_CAPACITY)
         # results aura la structure {heuristic_name: {"finished": bool, "stats": {}, "solution": [], "running": bool}}
 
         for h in self.heuristics:
-            mgr = SolverManager(self.plateau, self.pieces, h, self.fixed_pieces)
+            if use_processes:
+                mgr = ProcessSolverProxy(self.plateau, self.pieces, h, self.fixed_pieces,
+                                         self.stop_signal, self.context, events=self.events, engine=self.engine)
+            else:
+                mgr = SolverManager(self.plateau, self.pieces, h, self.fixed_pieces, self.engine, events=self.events)
             self.managers.append((h, mgr))
             self.results[h] = {
                 "finished": False,
@@ -46,7 +70,8 @@ class MultiHeuristicManager:
 
     def run_all(self):
         """
-        Lance tous les SolverManager dans des threads séparés.
+        Lance tous les SolverManager dans des threads séparés
+        (en mode processus, chaque thread relaie les messages de son processus).
         """
         for h, mgr in self.managers:
             t = threading.Thread(target=self._run_manager, args=(h, mgr), daemon=True)
@@ -58,6 +83,7 @@ class MultiHeuristicManager:
         """
         Méthode interne appelée par chaque thread pour exécuter le SolverManager.
         On attend la fin de la résolution, puis on enregistre les résultats.
+        Le gagnant arrête aussitôt les autres branches, sans attendre check_status().
         """
         mgr.run()  # Lance l'algo (bloquant)
         with self.lock:
@@ -65,10 +91,19 @@ class MultiHeuristicManager:
             stats = mgr.get_stats()
             solutions = mgr.get_solutions()
             sol = solutions[0] if solutions else []
-            self.results[heuristic]["finished"] = True
+            # Une branche interrompue sans solution n'a rien prouvé: elle n'est pas "finie"
+            self.results[heuristic]["finished"] = bool(sol) or not mgr.was_stopped()
             self.results[heuristic]["running"] = False
             self.results[heuristic]["stats"] = stats
             self.results[heuristic]["solution"] = sol
+            if self.results[heuristic]["finished"]:
+                self._stop_others(heuristic)
+
+    def get_events(self):
+        """
+        Retourne les événements de progression de toutes les branches publiés depuis le dernier appel.
+        """
+        return drain_events(self.events)
 
     def check_status(self):
         """
@@ -87,6 +122,10 @@ class MultiHeuristicManager:
                 if self.results[h]["finished"]:
                     self._stop_others(h)
                     return True, self.results[h]["stats"], self.results[h]["solution"], h
+            if all(not r["running"] for r in self.results.values()) and self.threads \
+                    and not any(t.is_alive() for t in self.threads):
+                # Toutes les branches ont été arrêtées sans résultat
+                return True, self.results[self.heuristics[0]]["stats"], [], ""
         return False, {}, [], ""
 
     def _stop_others(self, winner_heuristic):
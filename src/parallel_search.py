@@ -0,0 +1,262 @@
+import os
+import time
+import queue
+import threading
+import multiprocessing
+from algo_x_knuth import AlgorithmX
+from process_solver import serialize_problem, rebuild_problem
+from cancellation import StopSignal
+from placement import solution_ids
+
+# Profondeur par défaut du découpage initial de l'arbre en sous-problèmes.
+DEFAULT_SPLIT_DEPTH = 2
+
+# Délai (en secondes) d'attente d'une tâche ou d'un message avant de revérifier l'état.
+POLL_INTERVAL = 0.05
+
+# Intervalle (en secondes) de surveillance des processus inoccupés par un processus occupé.
+STEAL_INTERVAL = 0.01
+
+
+def search_worker(problem, heuristic, options, tasks, results, pending, idle, stop_signal, max_solutions, limits):
+    """
+    Point d'entrée d'un processus de recherche parallèle.
+    Le processus reconstruit le problème (même matrice, mêmes identifiants de lignes que le
+    processus parent), puis traite des tâches: chaque tâche est un état au format de
+    AlgorithmX.save_search_state(), repris avec le parcours itératif.
+
+    La recherche interroge elle-même stop_signal et ses limites (délai, nombre total de noeuds)
+    tous les CHECK_INTERVAL noeuds, ainsi qu'à chaque attente de tâche. Un thread de
+    surveillance demande un vol de travail (steal_requested) lorsqu'un autre processus attend
+    une tâche et que la file est vide; le travail cédé est ajouté à la file des tâches.
+
+    Messages envoyés sur results:
+    - ("solution", identifiants des lignes): Une solution trouvée.
+    - ("stats", stats): Statistiques du processus, à la fin.
+
+    Paramètres:
+    - problem (dict): Problème issu de serialize_problem().
+    - heuristic (str), options (dict): Paramètres d'AlgorithmX.
+    - tasks (Queue): File des tâches.
+    - results (Queue): File des messages vers le processus parent.
+    - pending (Value): Nombre de tâches créées et non terminées (partagé).
+    - idle (Value): Nombre de processus en attente d'une tâche (partagé).
+    - stop_signal (StopSignal): Arrêt de la recherche (partagé).
+    - max_solutions (int): 1 pour s'arrêter à la première solution, sinon None.
+    - limits (tuple): (délai restant, limite de noeuds, compteur de noeuds partagé), voir
+      AlgorithmX.start_cancellation().
+    """
+    plateau, pieces, fixed_pieces = rebuild_problem(problem)
+    algo = AlgorithmX(plateau, pieces, heuristic, fixed_pieces, search="iterative",
+                      stop_signal=stop_signal, **options)
+    algo.store_solutions = False
+    algo.start_cancellation(*limits)
+    engine, matrix = algo.build_engine()
+
+    def donate(state):
+        with pending.get_lock():
+            pending.value += 1
+        tasks.put(state)
+
+    algo.donate = donate
+    finished = threading.Event()
+
+    def monitor():
+        while not finished.is_set():
+            if idle.value > 0 and tasks.empty():
+                algo.steal_requested = True
+            time.sleep(STEAL_INTERVAL)
+
+    watcher = threading.Thread(target=monitor, daemon=True)
+    watcher.start()
+    try:
+        while not algo.poll_cancellation():
+            with idle.get_lock():
+                idle.value += 1
+            try:
+                state = tasks.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                state = None
+            finally:
+                with idle.get_lock():
+                    idle.value -= 1
+            if state is None:
+                if pending.value == 0:
+                    break
+                continue
+
+            solution = []
+            stack = algo.restore_search_state(state, engine, matrix, solution)
+            algo.steal_requested = False
+            while algo.algorithm_x_iterative(engine, matrix, solution, stack):
+                results.put(("solution", solution_ids(solution)))
+                if max_solutions == 1:
+                    stop_signal.set("solution")
+                    break
+                stack = algo.search_stack
+            if algo.stop_requested:
+                break
+            with pending.get_lock():
+                pending.value -= 1
+    finally:
+        finished.set()
+        watcher.join()
+        results.put(("stats", algo.get_stats()))
+        # Des tâches peuvent rester dans la file après un arrêt: ne pas attendre leur lecture
+        tasks.cancel_join_thread()
+
+
+class ParallelSearch:
+    """
+    Recherche parallèle avec vol de travail pour AlgorithmX (voir AlgorithmX.solve_parallel).
+
+    1. Le processus courant développe l'arbre de recherche jusqu'à split_depth (avec le
+       même pruning que la recherche séquentielle). Chaque noeud atteint devient une tâche:
+       les placements qui y mènent et ses candidats.
+    2. Les tâches sont placées dans une file partagée par un groupe de processus.
+    3. Un processus inoccupé provoque un vol: un processus occupé cède la moitié des
+       candidats non essayés du niveau le moins profond de sa pile, sous forme de nouvelle
+       tâche (AlgorithmX.split_search_stack).
+    4. La recherche se termine quand toutes les tâches sont traitées, ou dès que
+       max_solutions solutions ont été trouvées.
+
+    Les solutions sont transmises sous forme d'identifiants de lignes et reconstruites
+    avec la matrice du processus courant; les statistiques des processus sont cumulées.
+
+    Paramètres:
+    - algo (AlgorithmX): Algorithme à paralléliser (problème, heuristique, options).
+    - workers (int): Nombre de processus (par défaut, le nombre de coeurs).
+    - split_depth (int): Profondeur du découpage initial.
+    - max_solutions (int): Nombre de solutions recherchées (None: toutes).
+    - context: Contexte multiprocessing (par défaut "spawn").
+    - timeout (float): Délai maximal de la recherche en secondes, optionnel.
+    - node_limit (int): Nombre maximal de placements testés, tous processus confondus (compteur
+      partagé, mis à jour à chaque vérification: la limite est dépassée d'au plus
+      CHECK_INTERVAL noeuds par processus).
+    """
+    def __init__(self, algo, workers=None, split_depth=DEFAULT_SPLIT_DEPTH, max_solutions=1, context=None,
+                 timeout=None, node_limit=None):
+        self.algo = algo
+        self.workers = workers if workers else (os.cpu_count() or 1)
+        self.split_depth = split_depth
+        self.max_solutions = max_solutions
+        self.context = context if context is not None else multiprocessing.get_context("spawn")
+        self.timeout = timeout
+        self.node_limit = node_limit
+
+    def enough_solutions(self):
+        return self.max_solutions is not None and len(self.algo.solutions) >= self.max_solutions
+
+    def run(self):
+        """
+        Exécute la recherche parallèle; les solutions sont ajoutées à algo.solutions.
+        """
+        algo = self.algo
+        node_counter = self.context.Value('q', 0)
+        algo.start_cancellation(self.timeout, self.node_limit, node_counter)
+        engine, matrix = algo.build_engine()
+        tasks = []
+        self.expand(engine, matrix, [], 0, tasks)
+        if tasks and not algo.poll_cancellation() and not self.enough_solutions():
+            self.run_workers(matrix, tasks, node_counter)
+        algo.finish_cancellation()
+        algo.stats.stop_timer()
+        algo.save_tiling_table()
+
+    def expand(self, engine, matrix, solution, depth, tasks):
+        """
+        Développe l'arbre jusqu'à split_depth (comme algorithm_x) et collecte les tâches.
+        Les solutions atteintes avant cette profondeur sont validées directement.
+        """
+        algo, stats = self.algo, self.algo.stats
+        stats.increment_branches_explored()
+        stats.increment_depth()
+
+        column = engine.select_min_column()
+        if column is None:
+            stats.decrement_depth()
+            algo.accept_solution(solution)
+            return
+
+        rows = algo.prioritize_rows([matrix[row_id] for row_id in engine.rows_for_column(column)])
+        if depth == self.split_depth:
+            tasks.append([([row.id], 1, row.id) for row in solution] + [([row.id for row in rows], 0, None)])
+            stats.decrement_depth()
+            return
+
+        for row in rows:
+            if algo.should_stop() or self.enough_solutions():
+                break
+            solution.append(row)
+            stats.increment_placements_testes()
+            engine.select_row(row.id)
+            for pruner in algo.pruners:
+                pruner.push(row)
+            if not algo.is_dead_end(solution):
+                self.expand(engine, matrix, solution, depth + 1, tasks)
+            else:
+                stats.increment_branches_pruned()
+            for pruner in reversed(algo.pruners):
+                pruner.pop(row)
+            engine.deselect_row(row.id)
+            solution.pop()
+            stats.increment_calculs()
+        stats.decrement_depth()
+
+    def run_workers(self, matrix, initial_tasks, node_counter):
+        """
+        Lance les processus, distribue les tâches et collecte solutions et statistiques.
+        Un arrêt du processus courant (request_stop(), délai, signal) est relayé aux processus
+        par leur signal d'arrêt; une limite de noeuds atteinte par les processus est constatée
+        via le compteur partagé.
+        """
+        algo, context = self.algo, self.context
+        tasks = context.Queue()
+        results = context.Queue()
+        pending = context.Value('i', len(initial_tasks))
+        idle = context.Value('i', 0)
+        stop_signal = StopSignal(context)
+        for task in initial_tasks:
+            tasks.put(task)
+
+        problem = serialize_problem(algo.plateau, algo.pieces, algo.fixed_pieces)
+        worker_max = 1 if self.max_solutions == 1 else None
+        limits = (algo.cancel_token.remaining_time(), self.node_limit, node_counter)
+        processes = [
+            context.Process(
+                target=search_worker,
+                args=(problem, algo.heuristic, algo.worker_options(), tasks, results,
+                      pending, idle, stop_signal, worker_max, limits),
+                daemon=True
+            )
+            for _ in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        reports = 0
+        while reports < len(processes):
+            if not stop_signal.is_set() and algo.poll_cancellation():
+                token = algo.cancel_token
+                stop_signal.set(token.reason, token.cancel_time)
+            try:
+                message = results.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+            if message[0] == "solution":
+                if not self.enough_solutions():
+                    solution = [matrix[row_id] for row_id in message[1]]
+                    algo.solutions.append(solution)
+                    algo.stats.add_solution(solution)
+                if self.enough_solutions():
+                    stop_signal.set("solution")
+            elif message[0] == "stats":
+                algo.stats.merge(message[1])
+                reports += 1
+
+        stop_signal.set()
+        for process in processes:
+            process.join()
+        tasks.cancel_join_thread()
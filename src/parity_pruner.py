@@ -0,0 +1,189 @@
+import numpy as np
+
+
+class ParityPruner:
+    """
+    Pruning par coloriage du plateau. Les cellules libres doivent être couvertes exactement
+    par les pièces restantes; or chaque pièce couvre, quelle que soit sa position, un nombre
+    contraint de cellules de chaque couleur:
+    - Damier ((i + j) mod 2): une pièce couvre noires - blanches = +d ou -d cellules, où d
+      (son déséquilibre) ne dépend pas de la variante. Le déséquilibre des cellules libres
+      doit donc s'écrire comme une somme des ±d des pièces restantes.
+    - Bandes (i mod 3, et j mod 3): une pièce couvre entre lo et hi cellules de chaque
+      bande (bornes sur toutes ses variantes et décalages). Le nombre de cellules libres
+      de chaque bande doit rester entre la somme des lo et la somme des hi.
+
+    Les compteurs des cellules libres et les sommes sur les pièces restantes sont mis à jour
+    à chaque push()/pop(): le test coûte quelques opérations entières par noeud. Seule
+    l'existence d'une combinaison de signes pour le damier demande un calcul (somme de
+    sous-ensemble), mémorisé par (déséquilibre, déséquilibres des pièces restantes).
+    La contribution de chaque ligne (damier et bandes) est calculée une fois pour toutes
+    sur les tableaux de PlacementArrays: push()/pop() la lisent par Placement.id au lieu
+    de parcourir les cellules du placement.
+
+    Les placements des pièces fixées ne modifient rien: leurs cellules sont occupées dès la
+    construction (qu'elles soient posées sur le plateau ou non) et leurs pièces ne comptent
+    pas parmi les pièces restantes.
+
+    Paramètres:
+    - plateau: Objet plateau (dimensions + grille)
+    - pieces (dict): Dictionnaire des pièces disponibles
+    - fixed_pieces (dict): Pièces fixées (exclues des pièces restantes)
+    - placements (PlacementArrays): Lignes de la matrice de contraintes (voir ConstraintMatrixBuilder.arrays)
+    """
+    def __init__(self, plateau, pieces, fixed_pieces, placements):
+        lignes, colonnes = plateau.lignes, plateau.colonnes
+        occupied = np.asarray(plateau.plateau) != 0
+        # Les pièces fixées peuvent ne pas être posées sur le plateau: leurs cellules sont
+        # occupées dans tous les cas (push() et pop() ignorent leurs placements)
+        for nom, info in fixed_pieces.items():
+            variant = pieces[nom].variants[info['variante_index']]
+            i, j = info['position']
+            occupied[i + variant.rows, j + variant.cols] = True
+        free = ~occupied.ravel()
+        rows, cols = np.divmod(np.arange(lignes * colonnes), colonnes)
+        # Contribution de chaque cellule (aplatie): +1/-1 sur le damier, bande de ligne et de
+        # colonne (3 = cellule déjà occupée, non comptée)
+        cell_parity = np.where(free, 1 - 2 * ((rows + cols) % 2), 0)
+        cell_row_band = np.where(free, rows % 3, 3)
+        cell_col_band = np.where(free, cols % 3, 3)
+
+        self.imbalance = int(cell_parity.sum())
+        self.row_bands = np.bincount(cell_row_band, minlength=4)[:3].tolist()
+        self.col_bands = np.bincount(cell_col_band, minlength=4)[:3].tolist()
+        self.row_deltas = self.placement_deltas(placements, cell_parity, cell_row_band, cell_col_band)
+
+        self.piece_profiles = {nom: self.piece_profile(piece) for nom, piece in pieces.items()}
+        max_imbalance = max((d for d, _, _ in self.piece_profiles.values()), default=0)
+        self.imbalance_counts = [0] * (max_imbalance + 1)
+        self.imbalance_sum = 0
+        self.band_lo = 0
+        self.band_hi = 0
+        for nom in pieces:
+            if nom in fixed_pieces:
+                continue
+            self.add_piece(nom, 1)
+        self.feasible_imbalances = {}
+
+    @staticmethod
+    def piece_profile(piece):
+        """
+        Calcule le profil de coloriage d'une pièce.
+
+        Retourne:
+        - tuple: (déséquilibre d sur le damier, minimum et maximum de cellules dans une bande
+          de 3, sur toutes les variantes et tous les décalages).
+        """
+        base = piece.variants[0]
+        imbalance = abs(int(np.sum(1 - 2 * ((base.rows + base.cols) % 2))))
+        lo, hi = None, None
+        for variant in piece.variants:
+            # Décaler la pièce permute les bandes: les extrêmes du profil suffisent
+            band_counts = np.bincount(variant.rows % 3, minlength=3)
+            lo = int(band_counts.min()) if lo is None else min(lo, int(band_counts.min()))
+            hi = int(band_counts.max()) if hi is None else max(hi, int(band_counts.max()))
+        return imbalance, lo, hi
+
+    @staticmethod
+    def placement_deltas(placements, cell_parity, cell_row_band, cell_col_band):
+        """
+        Calcule, pour chaque ligne, sa contribution aux compteurs des cellules libres.
+
+        Retourne:
+        - list: Par identifiant de ligne, le tuple (damier, cellules dans chacune des bandes
+          de ligne 0, 1, 2, puis de colonne 0, 1, 2). Les lignes ne prennent qu'une poignée
+          de valeurs distinctes: les tuples sont partagés (une référence par ligne).
+        """
+        columns = [placements.row_sums(cell_parity)]
+        columns += [placements.row_sums(cell_row_band == band) for band in range(3)]
+        columns += [placements.row_sums(cell_col_band == band) for band in range(3)]
+        distinct, inverse = np.unique(np.column_stack(columns), axis=0, return_inverse=True)
+        distinct = [tuple(deltas) for deltas in distinct.tolist()]
+        return [distinct[k] for k in inverse.ravel().tolist()]
+
+    def add_piece(self, nom, sign):
+        """
+        Ajoute (sign = 1) ou retire (sign = -1) une pièce des sommes sur les pièces restantes.
+        """
+        imbalance, lo, hi = self.piece_profiles[nom]
+        self.imbalance_counts[imbalance] += sign
+        self.imbalance_sum += sign * imbalance
+        self.band_lo += sign * lo
+        self.band_hi += sign * hi
+
+    def push(self, placement):
+        """
+        Applique un placement: ses cellules ne sont plus libres et sa pièce n'est plus disponible.
+        """
+        if placement.fixed:
+            return
+        parity, r0, r1, r2, c0, c1, c2 = self.row_deltas[placement.id]
+        self.imbalance -= parity
+        row_bands, col_bands = self.row_bands, self.col_bands
+        row_bands[0] -= r0
+        row_bands[1] -= r1
+        row_bands[2] -= r2
+        col_bands[0] -= c0
+        col_bands[1] -= c1
+        col_bands[2] -= c2
+        self.add_piece(placement.piece.nom, -1)
+
+    def pop(self, placement):
+        """
+        Annule push().
+        """
+        if placement.fixed:
+            return
+        parity, r0, r1, r2, c0, c1, c2 = self.row_deltas[placement.id]
+        self.imbalance += parity
+        row_bands, col_bands = self.row_bands, self.col_bands
+        row_bands[0] += r0
+        row_bands[1] += r1
+        row_bands[2] += r2
+        col_bands[0] += c0
+        col_bands[1] += c1
+        col_bands[2] += c2
+        self.add_piece(placement.piece.nom, 1)
+
+    def should_prune(self, solution):
+        """
+        Indique si les pièces restantes ne peuvent plus équilibrer le coloriage des cellules libres.
+
+        Paramètres:
+        - solution (list): Liste des placements actuels (non utilisée: l'état est incrémental).
+
+        Retourne:
+        - bool: True si la branche est sans issue.
+        """
+        lo, hi = self.band_lo, self.band_hi
+        row_bands, col_bands = self.row_bands, self.col_bands
+        for band in range(3):
+            if not lo <= row_bands[band] <= hi or not lo <= col_bands[band] <= hi:
+                return True
+
+        imbalance, total = abs(self.imbalance), self.imbalance_sum
+        if imbalance > total or (total - imbalance) % 2:
+            return True
+        if imbalance == total:
+            return False
+        key = (imbalance, tuple(self.imbalance_counts))
+        feasible = self.feasible_imbalances.get(key)
+        if feasible is None:
+            feasible = self.can_reach_imbalance(imbalance, total)
+            self.feasible_imbalances[key] = feasible
+        return not feasible
+
+    def can_reach_imbalance(self, imbalance, total):
+        """
+        Cherche des signes tels que la somme des ±d des pièces restantes vaille imbalance,
+        c'est-à-dire un sous-ensemble de pièces de déséquilibre total (total + imbalance) / 2.
+
+        Retourne:
+        - bool: True si une telle combinaison existe.
+        """
+        target = (total + imbalance) // 2
+        reachable = 1  # Bit s: somme s atteignable
+        for d, count in enumerate(self.imbalance_counts):
+            for _ in range(count if d else 0):
+                reachable |= reachable << d
+        return bool(reachable >> target & 1)
@@ -1,26 +1,122 @@
 import numpy as np
 
+# Variantes déjà calculées, par forme de base (hauteur, largeur, masque): les pièces de
+# même forme (jeux générés, pièces rechargées à chaque niveau) partagent leurs variantes.
+_variant_cache = {}
+
+
+class Variant:
+    """
+    Géométrie précalculée d'une variante (orientation) d'une pièce, dans son rectangle
+    englobant: forme canonique d'une variante, calculée une seule fois et partagée.
+
+    Attributs:
+    - height, width (int): Dimensions du rectangle englobant.
+    - offsets (tuple): Cellules occupées (ligne, colonne), relatives au coin haut-gauche,
+      ligne par ligne.
+    - rows, cols (np.ndarray): Mêmes décalages en tableaux (lecture seule), pour NumPy.
+    - mask (int): Masque des cellules occupées (bit i * width + j).
+    - key (tuple): (height, width, mask), identifie la variante.
+    """
+    __slots__ = ("height", "width", "offsets", "rows", "cols", "mask", "key", "_board_masks")
+
+    def __init__(self, forme):
+        self.height, self.width = forme.shape
+        self.offsets = tuple(map(tuple, np.argwhere(forme == 1).tolist()))
+        self.rows = np.array([i for i, _ in self.offsets], dtype=np.intp)
+        self.cols = np.array([j for _, j in self.offsets], dtype=np.intp)
+        self.rows.setflags(write=False)
+        self.cols.setflags(write=False)
+        self.mask = sum(1 << (i * self.width + j) for i, j in self.offsets)
+        self.key = (self.height, self.width, self.mask)
+        self._board_masks = {}
+
+    @staticmethod
+    def key_of(forme):
+        """
+        Clé (hauteur, largeur, masque) d'une forme 2D, sans construire la variante.
+        """
+        height, width = forme.shape
+        return height, width, sum(1 << (i * width + j) for i, j in np.argwhere(forme == 1).tolist())
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def cells(self, position, colonnes):
+        """
+        Retourne les indices aplatis (ligne * colonnes + colonne) des cellules couvertes
+        par la variante placée à position, croissants.
+        """
+        base = position[0] * colonnes + position[1]
+        return tuple(base + i * colonnes + j for i, j in self.offsets)
+
+    def board_mask(self, colonnes):
+        """
+        Masque de la variante placée en (0, 0) sur un plateau de colonnes colonnes
+        (bit ligne * colonnes + colonne); décalé de ligne * colonnes + colonne, il donne
+        le masque de la variante placée en (ligne, colonne).
+        """
+        mask = self._board_masks.get(colonnes)
+        if mask is None:
+            mask = self._board_masks[colonnes] = sum(1 << (i * colonnes + j) for i, j in self.offsets)
+        return mask
+
+    def __repr__(self):
+        return "Variant({}x{}, {})".format(self.height, self.width, self.offsets)
+
+
 class Piece:
+    """
+    Pièce du puzzle et ses variantes (rotations et symétries distinctes).
+
+    Attributs:
+    - variantes (tuple): Variantes sous forme de tableaux 2D (lecture seule, 1 = cellule occupée).
+    - variants (tuple): Géométrie précalculée de chaque variante (Variant), même ordre.
+
+    Ces données sont partagées entre toutes les pièces de même forme: elles sont immuables.
+    """
     def __init__(self, nom, forme_base):
         self.nom = nom
         self.forme_base = np.array(forme_base)
-        self.variantes = self.generer_variantes()
+        self.variantes, self.variants, self.variant_ids = self.generer_variantes()
 
     def generer_variantes(self):
-        variantes = []
+        """
+        Calcule les variantes distinctes de la pièce, dans l'ordre des rotations (0°, 90°,
+        180°, 270°) suivies chacune de leur symétrie horizontale. Les doublons sont écartés
+        par leur clé (dimensions et masque), et le résultat est partagé entre les pièces de
+        même forme.
+
+        Retourne:
+        - tuple: (variantes, variants, {clé: indice de la variante}), à ne pas modifier.
+        """
+        base_key = Variant.key_of(self.forme_base)
+        cached = _variant_cache.get(base_key)
+        if cached is not None:
+            return cached
+
+        variantes, variants, variant_ids = [], [], {}
         for i in range(4):  # (0°, 90°, 180°, 270°)
             rotation = np.rot90(self.forme_base, i)
-            variantes.append(rotation)
             # symétrie horizontale
-            symetrie = np.fliplr(rotation)
-            variantes.append(symetrie)
-
-        # temp, doublons
-        variantes_uniques = []
-        for var in variantes:
-            if not any(np.array_equal(var, existante) for existante in variantes_uniques):
-                variantes_uniques.append(var)
-        return variantes_uniques
+            for forme in (rotation, np.fliplr(rotation)):
+                key = Variant.key_of(forme)
+                if key in variant_ids:
+                    continue
+                forme = np.array(forme)
+                forme.setflags(write=False)
+                variant_ids[key] = len(variants)
+                variantes.append(forme)
+                variants.append(Variant(forme))
+
+        cached = _variant_cache[base_key] = (tuple(variantes), tuple(variants), variant_ids)
+        return cached
+
+    def variant_index(self, forme):
+        """
+        Retourne l'indice de la variante égale au tableau forme, ou None.
+        """
+        return self.variant_ids.get(Variant.key_of(np.asarray(forme)))
 
     def afficher_variantes(self):
         for i, variante in enumerate(self.variantes):
@@ -0,0 +1,15 @@
+# Pièces du jeu de base IQ Puzzler Pro (plateau 5x11), au format (nom, forme).
+CLASSIC_PIECES = [
+    ("red", [[1, 1, 1, 1], [0, 0, 0, 1]]),
+    ("orange", [[0, 1, 0], [1, 1, 1], [1, 0, 0]]),
+    ("yellow", [[1, 1, 1, 1], [0, 1, 0, 0]]),
+    ("lime", [[1, 1, 1], [1, 0, 1]]),
+    ("green", [[1, 1, 1], [0, 1, 0]]),
+    ("white", [[1, 1, 1], [0, 1, 1]]),
+    ("cyan", [[0, 1], [1, 1]]),
+    ("skyblue", [[1, 1, 1], [1, 0, 0], [1, 0, 0]]),
+    ("blue", [[0, 0, 1], [1, 1, 1]]),
+    ("purple", [[1, 1, 0], [0, 1, 1], [0, 0, 1]]),
+    ("darkred", [[0, 1, 1], [1, 1, 0]]),
+    ("pink", [[1, 1, 0, 0], [0, 1, 1, 1]])
+]
@@ -0,0 +1,161 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Coordonnées (ligne, colonne) des cellules, par largeur de plateau: les couples sont
+# partagés par tous les placements (Placement.cells_covered ne contient que des références).
+_coordinates = {}
+
+
+def cell_coordinates(cells, board_width):
+    """
+    Retourne les couples (ligne, colonne) des cellules (indices aplatis, croissants) d'un
+    plateau de board_width colonnes.
+    """
+    table = _coordinates.get(board_width)
+    if table is None or (cells and cells[-1] >= len(table)):
+        table = _coordinates.setdefault(board_width, [])
+        table.extend(divmod(cell, board_width) for cell in range(len(table), max(cells, default=-1) + 1))
+    return tuple(map(table.__getitem__, cells))
+
+
+class Placement(namedtuple("Placement",
+                           "id piece variante_index position cells piece_column board_width fixed cells_covered",
+                           defaults=(False, None))):
+    """
+    Placement d'une pièce (ligne de la matrice de contraintes), immuable et compact:
+    un tuple nommé sans dictionnaire d'attributs (__slots__ vide), dont les cellules sont
+    des entiers. Les objets Piece sont partagés entre tous les placements d'une pièce.
+
+    Les mêmes lignes sont aussi rangées en colonnes dans PlacementArrays (un tableau NumPy
+    par champ), dont sont déduits l'index creux des moteurs et les contributions par ligne
+    des pruners; les objets Placement restent ce que la recherche renvoie.
+
+    Champs:
+    - id (int): Indice de la ligne dans la matrice (-1 pour un placement hors matrice,
+      par exemple l'image d'une solution par une symétrie).
+    - piece (Piece): Pièce placée.
+    - variante_index (int): Indice de la variante de la pièce.
+    - position (tuple): (ligne, colonne) du coin haut-gauche de la variante.
+    - cells (tuple): Indices aplatis (ligne * board_width + colonne) des cellules couvertes, croissants.
+    - piece_column (int): Colonne de la pièce dans la matrice.
+    - board_width (int): Nombre de colonnes du plateau.
+    - fixed (bool): Pièce fixée par le niveau.
+    - cells_covered (tuple): Cellules couvertes, sous forme de couples (ligne, colonne),
+      calculées à la création (ne pas les fournir).
+    """
+    __slots__ = ()
+
+    def __new__(cls, id, piece, variante_index, position, cells, piece_column, board_width, fixed=False,
+                cells_covered=None):
+        if cells_covered is None:
+            cells_covered = cell_coordinates(cells, board_width)
+        return tuple.__new__(cls, (id, piece, variante_index, position, cells, piece_column, board_width,
+                                   fixed, cells_covered))
+
+    @property
+    def columns(self):
+        """
+        Colonnes couvertes dans la matrice: les cellules, puis la colonne de la pièce.
+        """
+        return self.cells + (self.piece_column,)
+
+    def key(self):
+        """
+        Clé indépendante de la matrice: (nom de la pièce, indice de variante, position).
+        """
+        return self.piece.nom, self.variante_index, self.position
+
+    def __repr__(self):
+        return "Placement({}, {}, variante={}, position={})".format(
+            self.id, self.piece.nom, self.variante_index, self.position)
+
+
+class PlacementArrays:
+    """
+    Lignes de la matrice de contraintes rangées en colonnes (struct of arrays): un tableau
+    NumPy par champ, indexé par l'identifiant de ligne (Placement.id).
+
+    ConstraintMatrixBuilder la remplit par blocs (les placements d'une variante, ou d'une
+    pièce lue dans PlacementTable) et en déduit l'index creux des moteurs (SparseIndex);
+    les pruners y calculent en une opération vectorisée la contribution de chaque ligne
+    (voir row_sums() et ParityPruner).
+
+    Attributs:
+    - piece (np.ndarray): Indice de la pièce (dans piece_names, ordre des colonnes de pièces).
+    - variant (np.ndarray): Indice de la variante de la pièce.
+    - origin (np.ndarray): (ligne, colonne) du coin haut-gauche, tableau de forme (lignes, 2).
+    - cell_offsets, cells (np.ndarray): Cellules couvertes (indices aplatis, croissants) au
+      format CSR: celles de la ligne r sont cells[cell_offsets[r]:cell_offsets[r + 1]].
+    - fixed (np.ndarray): True pour les lignes des pièces fixées.
+    - piece_names (list): Noms des pièces.
+    """
+    def __init__(self, piece, variant, origin, cell_offsets, cells, fixed, piece_names):
+        self.piece = piece
+        self.variant = variant
+        self.origin = origin
+        self.cell_offsets = cell_offsets
+        self.cells = cells
+        self.fixed = fixed
+        self.piece_names = piece_names
+
+    @classmethod
+    def from_blocks(cls, blocks, piece_names):
+        """
+        Assemble les tableaux à partir de blocs de lignes consécutives.
+
+        Paramètres:
+        - blocks (list): Blocs (indice de pièce, variantes, origines, cellules, fixé), où
+          variantes a une entrée par ligne, origines est de forme (n, 2) et cellules de
+          forme (n, nombre de cellules de la pièce).
+        - piece_names (list): Noms des pièces, dans l'ordre de leurs indices.
+
+        Retourne:
+        - PlacementArrays: Les lignes des blocs, dans l'ordre des blocs.
+        """
+        counts = [len(variants) for _, variants, _, _, _ in blocks]
+        widths = [np.shape(cells)[1] for _, _, _, cells, _ in blocks]
+        lengths = np.repeat(np.array(widths, dtype=np.intc), counts)
+        return cls(
+            np.repeat(np.array([block[0] for block in blocks], dtype=np.intc), counts),
+            np.concatenate([np.asarray(block[1], dtype=np.intc) for block in blocks] or [np.zeros(0, np.intc)]),
+            np.concatenate([np.asarray(block[2], dtype=np.intc).reshape(-1, 2) for block in blocks]
+                           or [np.zeros((0, 2), np.intc)]),
+            np.concatenate(([0], np.cumsum(lengths))).astype(np.intc),
+            np.concatenate([np.asarray(block[3], dtype=np.intc).ravel() for block in blocks]
+                           or [np.zeros(0, np.intc)]),
+            np.repeat(np.array([block[4] for block in blocks], dtype=bool), counts),
+            piece_names)
+
+    def __len__(self):
+        return len(self.piece)
+
+    def cells_of(self, row_id):
+        """
+        Retourne les cellules couvertes par la ligne row_id.
+        """
+        return self.cells[self.cell_offsets[row_id]:self.cell_offsets[row_id + 1]]
+
+    def row_sums(self, cell_values):
+        """
+        Somme, pour chaque ligne, des valeurs de ses cellules.
+
+        Paramètres:
+        - cell_values (np.ndarray): Une valeur par cellule (indice aplati) du plateau.
+
+        Retourne:
+        - np.ndarray: Une somme par ligne.
+        """
+        values = np.asarray(cell_values, dtype=np.intc)[self.cells]
+        if not len(self):
+            return values
+        # Chaque ligne couvre au moins une cellule: aucun segment vide pour reduceat
+        return np.add.reduceat(values, self.cell_offsets[:-1])
+
+
+def solution_ids(solution):
+    """
+    Réduit une solution à un tuple d'identifiants de lignes (léger à copier, hacher,
+    transmettre entre processus ou enregistrer); matrix[id] redonne chaque placement.
+    """
+    return tuple(placement.id for placement in solution)
@@ -0,0 +1,119 @@
+import hashlib
+import numpy as np
+from disk_cache import load_arrays, save_arrays
+
+# Version du format des tables sur disque (à incrémenter si le contenu change de sens).
+TABLE_VERSION = 1
+
+# Tables déjà chargées dans ce processus, par nom de fichier (une résolution par lot
+# de niveaux ne relit pas le disque à chaque niveau).
+_loaded_tables = {}
+
+
+class PlacementTable:
+    """
+    Table de tous les placements des pièces sur un plateau vide, calculée une seule fois
+    par taille de plateau et jeu de pièces, puis enregistrée sur disque (format binaire .npz).
+    Pour un niveau, ConstraintMatrixBuilder ne fait que filtrer cette table avec le masque
+    des cellules occupées, au lieu de rechercher les positions de chaque variante.
+
+    Les placements sont rangés par pièce (ordre des noms), puis par variante et par position
+    (ligne par ligne): l'ordre est celui de ConstraintMatrixBuilder.add_piece_to_matrix, la
+    matrice obtenue est donc identique. Pour chaque pièce, les cellules des placements
+    forment un tableau (placements x taille de la pièce).
+
+    Paramètres:
+    - lignes, colonnes (int): Taille du plateau.
+    - pieces (dict): Dictionnaire {nom: Piece}.
+    """
+    def __init__(self, lignes, colonnes, pieces):
+        self.lignes = lignes
+        self.colonnes = colonnes
+        self.names = sorted(pieces)
+        digest = hashlib.sha1("{}x{}|{}".format(lignes, colonnes, TABLE_VERSION).encode())
+        for nom in self.names:
+            digest.update("{}={}|".format(nom, np.asarray(pieces[nom].forme_base).tolist()).encode())
+        self.signature = digest.hexdigest()
+        self.variants = {}  # nom -> indice de variante de chaque placement
+        self.positions = {}  # nom -> (ligne, colonne) de chaque placement
+        self.cells = {}  # nom -> identifiants des cellules de chaque placement (ligne * colonnes + colonne)
+
+    @classmethod
+    def load(cls, lignes, colonnes, pieces):
+        """
+        Retourne la table du plateau et du jeu de pièces: depuis la mémoire, le disque,
+        ou calculée (puis enregistrée) si elle n'existe pas encore.
+        """
+        table = cls(lignes, colonnes, pieces)
+        name = table.file_name()
+        if name in _loaded_tables:
+            return _loaded_tables[name]
+        data = load_arrays(name)
+        if data is not None and str(data["signature"]) == table.signature:
+            table.from_arrays(data)
+        else:
+            table.compute(pieces)
+            save_arrays(name, table.to_arrays())
+        _loaded_tables[name] = table
+        return table
+
+    def file_name(self):
+        return "placements-{}.npz".format(self.signature[:16])
+
+    def compute(self, pieces):
+        """
+        Calcule les placements de chaque pièce sur le plateau vide.
+        """
+        lignes, colonnes = self.lignes, self.colonnes
+        cell_type = np.min_scalar_type(lignes * colonnes - 1)
+        for nom in self.names:
+            variants, positions, cells = [], [], []
+            for variante_index, variant in enumerate(pieces[nom].variants):
+                height, width = variant.height, variant.width
+                if height > lignes or width > colonnes:
+                    continue
+                anchors = np.argwhere(np.ones((lignes - height + 1, colonnes - width + 1), dtype=bool))
+                variants.append(np.full(len(anchors), variante_index, dtype=np.int8))
+                positions.append(anchors)
+                cells.append((anchors[:, :1] + variant.rows) * colonnes + anchors[:, 1:] + variant.cols)
+            size = len(pieces[nom].variants[0])
+            self.variants[nom] = np.concatenate(variants) if variants else np.zeros(0, dtype=np.int8)
+            self.positions[nom] = (np.concatenate(positions) if positions else np.zeros((0, 2))).astype(np.int16)
+            # Plus petit type entier contenant les identifiants de cellules (uint8 en 5x11)
+            self.cells[nom] = (np.concatenate(cells) if cells else np.zeros((0, size))).astype(cell_type)
+
+    def to_arrays(self):
+        """
+        Sérialise la table en tableaux NumPy (un jeu de trois tableaux par pièce).
+        """
+        arrays = {"signature": np.array(self.signature)}
+        for k, nom in enumerate(self.names):
+            arrays["variants_{}".format(k)] = self.variants[nom]
+            arrays["positions_{}".format(k)] = self.positions[nom]
+            arrays["cells_{}".format(k)] = self.cells[nom]
+        return arrays
+
+    def from_arrays(self, data):
+        for k, nom in enumerate(self.names):
+            self.variants[nom] = data["variants_{}".format(k)]
+            self.positions[nom] = data["positions_{}".format(k)]
+            self.cells[nom] = data["cells_{}".format(k)]
+
+    def placements(self, nom, occupied, allowed=None):
+        """
+        Retourne les placements d'une pièce compatibles avec les cellules occupées.
+
+        Paramètres:
+        - nom (str): Nom de la pièce.
+        - occupied (np.ndarray): Masque (aplati) des cellules occupées du plateau.
+        - allowed (list): Indices des variantes autorisées, optionnel (toutes par défaut).
+
+        Retourne:
+        - tuple: (variantes, positions, cellules) des placements retenus, dans l'ordre de la table.
+        """
+        cells = self.cells[nom]
+        keep = ~occupied[cells].any(axis=1)
+        if allowed is not None:
+            keep &= np.isin(self.variants[nom], allowed)
+        return self.variants[nom][keep], self.positions[nom][keep], cells[keep]
+
@@ -11,37 +11,26 @@ class Plateau:
         print(self.plateau)
 
     def placer_piece(self, piece, variante_index, position):
-        variante = piece.variantes[variante_index]
+        variant = piece.variants[variante_index]
         ligne, colonne = position
 
-        if not self.peut_placer(variante, position):
+        if not self.peut_placer(piece, variante_index, position):
             print(f"Impossible de placer la pièce {piece.nom} à la position {position}")
             return False
 
-        for i in range(variante.shape[0]):
-            for j in range(variante.shape[1]):
-                if variante[i, j] == 1:
-                    self.plateau[ligne + i, colonne + j] = 1
+        self.plateau[ligne + variant.rows, colonne + variant.cols] = 1
         return True
 
-    def peut_placer(self, variante, position):
+    def peut_placer(self, piece, variante_index, position):
+        variant = piece.variants[variante_index]
         ligne, colonne = position
 
-        if ligne + variante.shape[0] > self.lignes or colonne + variante.shape[1] > self.colonnes:
+        if ligne + variant.height > self.lignes or colonne + variant.width > self.colonnes:
             return False
 
-        for i in range(variante.shape[0]):
-            for j in range(variante.shape[1]):
-                if variante[i, j] == 1 and self.plateau[ligne + i, colonne + j] != 0:
-                    return False
-
-        return True
+        return not np.any(self.plateau[ligne + variant.rows, colonne + variant.cols])
 
     def retirer_piece(self, piece, variante_index, position):
-        variante = piece.variantes[variante_index]
+        variant = piece.variants[variante_index]
         ligne, colonne = position
-
-        for i in range(variante.shape[0]):
-            for j in range(variante.shape[1]):
-                if variante[i, j] == 1:
-                    self.plateau[ligne + i, colonne + j] = 0
\ No newline at end of file
+        self.plateau[ligne + variant.rows, colonne + variant.cols] = 0
@@ -1,3 +1,4 @@
+import json
 import random
 from collections import deque
 
@@ -6,6 +7,11 @@ class GridPolyminoGenerator:
     Générateur de polyominos uniques à partir d'une grille.
     Permet de diviser une grille de dimensions données en polyominos aléatoires
     tout en garantissant que toutes les cases de la grille sont remplies.
+
+    Le tirage utilise un générateur aléatoire propre à l'instance: une même graine donne
+    toujours les mêmes pièces. Sans graine, une graine est tirée et conservée dans self.seed,
+    ce qui permet de rejouer n'importe quel plateau. Le jeu de pièces et le pavage de
+    référence (self.grid) s'exportent avec save() et se rechargent avec load().
     """
 
     PIECE_COLORS = {
@@ -24,7 +30,7 @@ class GridPolyminoGenerator:
         "palegreen": "palegreen", "darkmagenta": "darkmagenta"
     }
 
-    def __init__(self, rows, cols, max_pieces=50):
+    def __init__(self, rows, cols, max_pieces=50, seed=None):
         if rows < 1 or cols < 1:
             raise ValueError("Les dimensions de la grille doivent être supérieures à 1.")
         self.rows = rows
@@ -32,6 +38,8 @@ class GridPolyminoGenerator:
         self.grid = [[-1 for _ in range(cols)] for _ in range(rows)]  # Grille initiale
         self.polyominos = []  # Liste des polyominos générés
         self.max_pieces = min(max_pieces, len(self.PIECE_COLORS))
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
 
     def generate(self):
         """
@@ -43,7 +51,7 @@ class GridPolyminoGenerator:
         for i in range(self.rows):
             for j in range(self.cols):
                 if not visited[i][j] and label < self.max_pieces:
-                    size = random.randint(2, min(self.rows, self.cols))  # Taille aléatoire
+                    size = self.rng.randint(2, min(self.rows, self.cols))  # Taille aléatoire
                     polyomino = self._create_polymino(i, j, size, visited, label)
                     if polyomino:
                         self.polyominos.append(polyomino)
@@ -77,7 +85,7 @@ class GridPolyminoGenerator:
                 self.grid[x][y] = label
                 polyomino.append((x, y))
 
-                random.shuffle(directions)  # Mélange des directions pour ajouter de l'aléatoire
+                self.rng.shuffle(directions)  # Mélange des directions pour ajouter de l'aléatoire
                 for dx, dy in directions:
                     nx, ny = x + dx, y + dy
                     if 0 <= nx < self.rows and 0 <= ny < self.cols and not visited[nx][ny]:
@@ -160,6 +168,53 @@ class GridPolyminoGenerator:
 
         return piece_definitions
 
+    def to_dict(self):
+        """
+        Exporte le plateau généré: dimensions, graine, pièces et pavage de référence.
+
+        Retourne:
+        - dict: {'rows', 'cols', 'seed', 'pieces': [[nom, forme]], 'tiling': {nom: [[ligne, colonne]]}}.
+          La clé 'pieces' rend le fichier directement utilisable comme jeu de pièces
+          (voir level_loader.load_piece_definitions()).
+        """
+        names = list(self.PIECE_COLORS.keys())
+        return {
+            'rows': self.rows,
+            'cols': self.cols,
+            'seed': self.seed,
+            'pieces': [[nom, forme] for nom, forme in self.get_piece_definitions()],
+            'tiling': {names[idx]: [list(cell) for cell in polyomino] for idx, polyomino in enumerate(self.polyominos)},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Reconstruit un générateur (pièces et pavage de référence) exporté avec to_dict(),
+        sans nouveau tirage.
+        """
+        generator = cls(data['rows'], data['cols'], seed=data.get('seed'))
+        for label, cells in enumerate(data['tiling'].values()):
+            polyomino = [tuple(cell) for cell in cells]
+            for x, y in polyomino:
+                generator.grid[x][y] = label
+            generator.polyominos.append(polyomino)
+        return generator
+
+    def save(self, path):
+        """
+        Enregistre le plateau généré dans un fichier JSON (voir to_dict()).
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Recharge un plateau généré enregistré avec save().
+        """
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
     def display_grid(self):
         """
         Affiche la grille générée avec des polyominos étiquetés.
@@ -0,0 +1,231 @@
+import time
+import queue
+import multiprocessing
+import threading
+import numpy as np
+from algo_x_knuth import AlgorithmX
+from algorithm_stats import AlgorithmStats
+from piece import Piece
+from placement import Placement
+from plateau import Plateau
+from cancellation import StopSignal
+from progress import ProgressPublisher, DEFAULT_PROGRESS_INTERVAL, DEFAULT_EVENT_CAPACITY, drain_events
+
+# Intervalle (en secondes) entre deux envois de statistiques par un processus de résolution.
+STATS_INTERVAL = 0.1
+
+
+def serialize_problem(plateau, pieces, fixed_pieces):
+    """
+    Réduit un problème à des données simples, transmissibles à un autre processus:
+    les objets Piece de l'interface portent des widgets Tk et ne peuvent pas être copiés.
+
+    Retourne:
+    - dict: {'lignes', 'colonnes', 'grille', 'pieces': [(nom, forme_base)], 'fixed_pieces'}
+    """
+    return {
+        'lignes': plateau.lignes,
+        'colonnes': plateau.colonnes,
+        'grille': np.asarray(plateau.plateau).tolist(),
+        'pieces': [(nom, np.asarray(piece.forme_base).tolist()) for nom, piece in pieces.items()],
+        'fixed_pieces': {
+            nom: {'variante_index': info['variante_index'], 'position': tuple(info['position'])}
+            for nom, info in (fixed_pieces or {}).items()
+        },
+    }
+
+
+def rebuild_problem(problem):
+    """
+    Reconstruit (plateau, pieces, fixed_pieces) à partir de serialize_problem().
+    """
+    plateau = Plateau(problem['lignes'], problem['colonnes'])
+    plateau.plateau = np.array(problem['grille'], dtype=int)
+    pieces = {nom: Piece(nom, forme) for nom, forme in problem['pieces']}
+    return plateau, pieces, problem['fixed_pieces']
+
+
+def solution_to_keys(solution):
+    """
+    Réduit une solution à des clés (nom de pièce, indice de variante, position).
+    """
+    return [p.key() for p in solution]
+
+
+def solution_from_keys(keys, plateau, pieces):
+    """
+    Reconstruit une solution (liste de placements) à partir de solution_to_keys(),
+    avec les objets Piece de l'appelant.
+
+    Paramètres:
+    - keys (list): Clés (nom, variante_index, position).
+    - plateau (Plateau): Plateau du problème (pour les indices de colonnes).
+    - pieces (dict): Dictionnaire {nom: Piece} de l'appelant.
+
+    Retourne:
+    - list: Placements (Placement hors matrice, d'identifiant -1).
+    """
+    num_cells = plateau.lignes * plateau.colonnes
+    piece_columns = {nom: num_cells + idx for idx, nom in enumerate(pieces.keys())}
+    solution = []
+    for nom, variante_index, position in keys:
+        piece = pieces[nom]
+        cells = piece.variants[variante_index].cells(position, plateau.colonnes)
+        solution.append(Placement(-1, piece, variante_index, tuple(position), cells,
+                                  piece_columns[nom], plateau.colonnes))
+    return solution
+
+
+def solve_in_process(conn, stop_signal, problem, heuristic, options):
+    """
+    Point d'entrée d'un processus de résolution.
+    La résolution tourne dans un thread du processus et interroge elle-même stop_signal
+    (tous les CHECK_INTERVAL noeuds); le thread principal envoie les statistiques toutes
+    les STATS_INTERVAL secondes. Si une solution est trouvée, stop_signal est levé
+    (raison "solution") pour arrêter les autres processus.
+
+    Messages envoyés sur conn:
+    - ("stats", stats): Statistiques courantes.
+    - ("done", stats, keys, stopped): Fin de la résolution; keys = solution_to_keys() ou None,
+      stopped = True si la recherche a été interrompue.
+
+    Paramètres:
+    - conn (Connection): Extrémité du pipe vers le processus parent.
+    - stop_signal (StopSignal): Signal d'arrêt partagé.
+    - problem (dict): Problème issu de serialize_problem().
+    - heuristic (str): Heuristique utilisée.
+    - options (dict): Paramètres supplémentaires d'AlgorithmX (engine, search...).
+    """
+    plateau, pieces, fixed_pieces = rebuild_problem(problem)
+    algo = AlgorithmX(plateau, pieces, heuristic, fixed_pieces, stop_signal=stop_signal, **options)
+    solver = threading.Thread(target=algo.solve, daemon=True)
+    solver.start()
+    try:
+        while solver.is_alive():
+            solver.join(STATS_INTERVAL)
+            conn.send(("stats", algo.get_stats()))
+        solutions = algo.get_solutions()
+        if solutions:
+            stop_signal.set("solution")
+        keys = solution_to_keys(solutions[0]) if solutions else None
+        conn.send(("done", algo.get_stats(), keys, algo.stop_requested))
+    except (BrokenPipeError, EOFError):
+        algo.request_stop()
+    finally:
+        conn.close()
+
+
+class ProcessSolverProxy:
+    """
+    Résolution dans un processus séparé, avec la même interface de suivi que SolverManager
+    (get_stats(), get_solutions(), request_stop(), is_running()).
+    Les statistiques arrivent par un pipe et sont lues par un thread du processus courant,
+    qui les publie sous forme d'événements de progression (voir SolverManager.get_events()).
+    La solution partielle n'est pas transmise: les événements ont des branches vides.
+
+    Paramètres:
+    - plateau (Plateau): Plateau du problème.
+    - pieces (dict): Dictionnaire des pièces {nom: Piece}.
+    - heuristic (str): Heuristique utilisée.
+    - fixed_pieces (dict): Pièces pré-placées, optionnel.
+    - stop_signal (StopSignal): Signal d'arrêt, partagé entre les processus d'un portfolio.
+    - context: Contexte multiprocessing (par défaut "spawn", sûr avec Tk et les threads).
+    - progress_interval (float), on_event (callable), events (queue.Queue): Publication des
+      événements de progression, comme pour SolverManager.
+    - options: Paramètres supplémentaires d'AlgorithmX (engine, search...).
+    """
+    def __init__(self, plateau, pieces, heuristic, fixed_pieces=None, stop_signal=None, context=None,
+                 progress_interval=DEFAULT_PROGRESS_INTERVAL, on_event=None, events=None, **options):
+        self.plateau = plateau
+        self.pieces = pieces
+        self.heuristic = heuristic
+        self.fixed_pieces = fixed_pieces if fixed_pieces else {}
+        self.context = context if context is not None else multiprocessing.get_context("spawn")
+        self.stop_signal = stop_signal if stop_signal is not None else StopSignal(self.context)
+        self.options = options
+        self.events = events if events is not None else queue.Queue(DEFAULT_EVENT_CAPACITY)
+        self.publisher = ProgressPublisher(self.events, on_event, progress_interval, source=heuristic)
+        self.stats = AlgorithmStats().get_stats()
+        self.solutions = []
+        self.running = False
+        self.stopped = False
+        self.process = None
+        self.conn = None
+
+    def start(self):
+        """
+        Démarre le processus de résolution.
+        """
+        self.conn, child_conn = self.context.Pipe(duplex=False)
+        problem = serialize_problem(self.plateau, self.pieces, self.fixed_pieces)
+        self.process = self.context.Process(
+            target=solve_in_process,
+            args=(child_conn, self.stop_signal, problem, self.heuristic, self.options),
+            daemon=True
+        )
+        self.running = True
+        self.process.start()
+        child_conn.close()
+
+    def run(self):
+        """
+        Lance la résolution et relaie les messages du processus jusqu'à sa fin (bloquant,
+        comme SolverManager.run()).
+        """
+        if self.process is None:
+            self.start()
+        try:
+            while True:
+                message = self.conn.recv()
+                self.stats = message[1]
+                if message[0] == "stats":
+                    if self.publisher.due(self.stats["placements_testes"], time.time()):
+                        self.publisher.publish("progress", self.stats)
+                elif message[0] == "done":
+                    self.stopped = message[3]
+                    if message[2] is not None:
+                        self.solutions = [solution_from_keys(message[2], self.plateau, self.pieces)]
+                    break
+        except EOFError:
+            # Processus terminé sans message de fin: rien n'a été prouvé
+            self.stopped = True
+        finally:
+            self.running = False
+            self.conn.close()
+            self.process.join()
+            self.publisher.publish("done", self.get_stats(), stopped=self.stopped,
+                                   solution=self.solutions[0] if self.solutions else [])
+
+    def get_events(self):
+        return drain_events(self.events)
+
+    def is_running(self):
+        return self.running
+
+    def was_stopped(self):
+        """
+        Indique si la résolution a été interrompue avant d'aboutir.
+        """
+        return self.stopped
+
+    def request_stop(self):
+        """
+        Demande l'arrêt: le signal étant partagé, cela arrête tout le portfolio.
+        """
+        self.stop_signal.set("requested")
+        self.running = False
+
+    def get_stats(self):
+        return dict(self.stats)
+
+    def get_current_solution_steps(self):
+        """
+        La solution partielle n'est pas transmise entre processus.
+        """
+        return []
+
+    def get_intermediate_steps(self):
+        return []
+
+    def get_solutions(self):
+        return self.solutions.copy()
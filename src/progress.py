@@ -0,0 +1,132 @@
+import time
+import queue
+
+# Intervalle minimal (en secondes) entre deux événements de progression.
+DEFAULT_PROGRESS_INTERVAL = 0.1
+
+# Nombre maximal d'événements en attente: au-delà, les plus anciens sont écartés.
+DEFAULT_EVENT_CAPACITY = 1000
+
+
+def put_event(events, event):
+    """
+    Ajoute un événement à une file bornée sans jamais bloquer: si la file est pleine,
+    l'événement le plus ancien est écarté (un consommateur lent ne ralentit pas la recherche).
+    """
+    while True:
+        try:
+            events.put_nowait(event)
+            return
+        except queue.Full:
+            try:
+                events.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def drain_events(events):
+    """
+    Retire et retourne tous les événements en attente dans la file (sans bloquer).
+    """
+    drained = []
+    while True:
+        try:
+            drained.append(events.get_nowait())
+        except queue.Empty:
+            return drained
+
+
+class ProgressPublisher:
+    """
+    Publie la progression d'une recherche sous forme d'événements (dictionnaires),
+    dans une file thread-safe et/ou via un callback.
+
+    Les instantanés sont construits par le thread de la recherche lui-même (tick(), appelé
+    tous les CHECK_INTERVAL noeuds): le consommateur (interface, client sans interface)
+    reçoit des copies cohérentes et ne lit jamais les statistiques en cours de modification.
+    Les événements "progress" sont limités en temps (au plus un par interval secondes)
+    et en noeuds (au moins min_nodes placements testés depuis le précédent).
+
+    Contenu d'un événement:
+    - type (str): "progress", "solution" ou "done".
+    - source (str): Origine de l'événement (par exemple l'heuristique), optionnelle.
+    - nodes (int): Placements testés.
+    - node_rate (float): Placements testés par seconde depuis l'événement précédent.
+    - depth (int): Profondeur courante.
+    - max_depth (int): Profondeur maximale atteinte.
+    - solutions_found (int): Nombre de solutions trouvées.
+    - partial (list): Placements de la branche courante.
+    - best_partial (list): Placements de la branche la plus profonde atteinte.
+    - stats (dict): Statistiques complètes (AlgorithmStats.get_stats()).
+    Les événements "done" ajoutent 'stopped' (bool) et 'solution' (list).
+
+    Paramètres:
+    - events (queue.Queue): File recevant les événements, optionnelle.
+    - callback (callable): Fonction appelée avec chaque événement (dans le thread de la
+      recherche: elle doit rester rapide), optionnelle.
+    - interval (float): Intervalle minimal entre deux événements "progress".
+    - min_nodes (int): Nombre minimal de placements testés entre deux événements "progress".
+    - source (str): Valeur du champ 'source' des événements.
+    """
+    def __init__(self, events=None, callback=None, interval=DEFAULT_PROGRESS_INTERVAL, min_nodes=1, source=None):
+        self.events = events
+        self.callback = callback
+        self.interval = interval
+        self.min_nodes = min_nodes
+        self.source = source
+        self.last_time = time.time()
+        self.last_nodes = 0
+
+    def due(self, nodes, now):
+        """
+        Indique si un événement "progress" peut être publié (limites de temps et de noeuds).
+        """
+        return now - self.last_time >= self.interval and nodes - self.last_nodes >= self.min_nodes
+
+    def tick(self, stats):
+        """
+        Appelé régulièrement par la recherche: publie un événement "progress" si les
+        limites le permettent.
+
+        Paramètres:
+        - stats (AlgorithmStats): Statistiques de la recherche.
+        """
+        now = time.time()
+        if self.due(stats.placements_testes, now):
+            stats.snapshot_current_solution_steps()
+            self.publish("progress", stats.get_stats(), stats.get_current_solution_steps(),
+                         stats.get_best_partial_steps(), now)
+
+    def publish(self, kind, stats, partial=None, best_partial=None, now=None, **extra):
+        """
+        Construit et diffuse un événement (sans limite de fréquence).
+
+        Paramètres:
+        - kind (str): Type de l'événement.
+        - stats (dict): Statistiques (AlgorithmStats.get_stats()).
+        - partial (list), best_partial (list): Branche courante et branche la plus profonde.
+        - now (float): Date de l'événement (par défaut, maintenant).
+        - extra: Champs supplémentaires de l'événement.
+        """
+        now = time.time() if now is None else now
+        nodes = stats["placements_testes"]
+        elapsed = now - self.last_time
+        event = {
+            "type": kind,
+            "source": self.source,
+            "nodes": nodes,
+            "node_rate": (nodes - self.last_nodes) / elapsed if elapsed > 0 else 0.0,
+            "depth": stats["current_depth"],
+            "max_depth": stats["max_recursion_depth"],
+            "solutions_found": stats["solutions_found"],
+            "partial": partial if partial is not None else [],
+            "best_partial": best_partial if best_partial is not None else [],
+            "stats": stats,
+        }
+        event.update(extra)
+        self.last_time = now
+        self.last_nodes = nodes
+        if self.events is not None:
+            put_event(self.events, event)
+        if self.callback is not None:
+            self.callback(event)
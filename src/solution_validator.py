@@ -18,23 +18,25 @@ class SolutionValidator:
         3. Vérifie que toutes les cellules du plateau sont couvertes (solution complète).
 
         Paramètres:
-        - solution (list): Liste des placements (chaque placement contient 'piece', 'cells_covered', etc.)
+        - solution (list): Liste des placements (Placement).
 
         Retourne:
         - bool: True si la solution est valide, False sinon.
         """
+        colonnes = self.plateau.colonnes
         pieces_used = set()
-        cells_covered = set()
+        cells_covered = 0  # Masque des cellules couvertes (bit ligne * colonnes + colonne)
         for sol in solution:
-            piece_name = sol['piece'].nom
+            piece_name = sol.piece.nom
             if piece_name in pieces_used:
                 return False
             pieces_used.add(piece_name)
-            for cell in sol['cells_covered']:
-                if cell in cells_covered:
-                    return False
-                cells_covered.add(cell)
+            i, j = sol.position
+            mask = sol.piece.variants[sol.variante_index].board_mask(colonnes) << (i * colonnes + j)
+            if cells_covered & mask:
+                return False
+            cells_covered |= mask
 
         all_pieces_used = len(pieces_used) == len(self.pieces)
-        full_board_covered = len(cells_covered) == (self.plateau.lignes * self.plateau.colonnes)
+        full_board_covered = cells_covered == (1 << (self.plateau.lignes * colonnes)) - 1
         return all_pieces_used and full_board_covered
\ No newline at end of file
@@ -1,4 +1,6 @@
+import queue
 from algo_x_knuth import AlgorithmX
+from progress import ProgressPublisher, DEFAULT_PROGRESS_INTERVAL, DEFAULT_EVENT_CAPACITY, drain_events
 
 class SolverManager:
     """
@@ -9,30 +11,42 @@ class SolverManager:
     - Récupérer les statistiques et la solution en cours.
     - Arrêter l'algorithme au besoin.
 
-    L'idée est que l'interface puisse appeler périodiquement get_stats() et get_current_solution(),
-    tant que is_running() est True, afin d'afficher le progrès. Une fois terminé, on peut afficher
-    la solution finale.
+    La progression est publiée par le thread de la recherche sous forme d'événements
+    (voir ProgressPublisher): l'interface les récupère avec get_events() (ou un callback
+    on_event), sans lire les statistiques pendant qu'elles sont modifiées. Un événement
+    "done" termine la résolution; on peut alors afficher la solution finale.
 
     Paramètres:
     - plateau (Plateau): Copie du plateau initial.
     - pieces (dict): Dictionnaire des pièces {nom: Piece}.
     - heuristic_choice (string): Heuristique pour l'ordre des pièces.
     - fixed_pieces (dict): Pièces pré-placées, optionnel.
+    - engine (str): Moteur de couverture exacte utilisé par AlgorithmX ("dlx", "bitset" ou "matrix").
+    - record_steps (bool): Enregistre les étapes intermédiaires pour la relecture (désactivé par défaut).
+    - progress_interval (float): Intervalle minimal entre deux événements de progression.
+    - on_event (callable): Callback appelé avec chaque événement (dans le thread de la recherche).
+    - events (queue.Queue): File des événements, optionnelle (par exemple partagée entre
+      plusieurs managers; chaque événement indique son heuristique dans 'source').
 
     Utilisation:
     manager = SolverManager(plateau_copy, pieces, heuristic_choice, fixed_pieces)
-    manager.run()
-    while manager.is_running():
-        stats = manager.get_stats()
-        current_sol = manager.get_current_solution_steps()
-        # Mettre à jour l'affichage
-    final_solutions = manager.get_solutions()
+    threading.Thread(target=manager.run).start()
+    # Périodiquement:
+    for event in manager.get_events():
+        # Mettre à jour l'affichage avec event["stats"], event["partial"]...
+        if event["type"] == "done":
+            final_solutions = manager.get_solutions()
     """
-    def __init__(self, plateau, pieces, heuristic_choice, fixed_pieces=None):
+    def __init__(self, plateau, pieces, heuristic_choice, fixed_pieces=None, engine="dlx", record_steps=False,
+                 progress_interval=DEFAULT_PROGRESS_INTERVAL, on_event=None, events=None):
         self.plateau = plateau
         self.pieces = pieces
         self.heuristic = heuristic_choice
         self.fixed_pieces = fixed_pieces if fixed_pieces else {}
+        self.engine = engine
+        self.record_steps = record_steps
+        self.events = events if events is not None else queue.Queue(DEFAULT_EVENT_CAPACITY)
+        self.publisher = ProgressPublisher(self.events, on_event, progress_interval, source=heuristic_choice)
         self.algo = None
         self.running = False
 
@@ -41,18 +55,36 @@ class SolverManager:
         Lance l'algorithme de résolution.
         Cette méthode exécute l'algorithme X, ce qui peut prendre du temps.
         On peut imaginer la lancer dans un thread séparé pour ne pas bloquer l'UI,
-        mais ici on la lance directement. L'interface peut régulièrement
-        consulter get_stats() et get_current_solution_steps() pour suivre la progression.
+        mais ici on la lance directement. La progression est publiée sous forme
+        d'événements, terminés par un événement "done".
         """
         self.algo = AlgorithmX(
             self.plateau,
             self.pieces,
             self.heuristic,
-            self.fixed_pieces
+            self.fixed_pieces,
+            self.engine,
+            record_steps=self.record_steps
         )
+        self.algo.progress = self.publisher
         self.running = True
-        self.algo.solve()
-        self.running = False
+        try:
+            self.algo.solve()
+        finally:
+            self.running = False
+            solutions = self.algo.get_solutions()
+            self.publisher.publish("done", self.algo.get_stats(), self.algo.get_current_solution_steps(),
+                                   self.algo.stats.get_best_partial_steps(),
+                                   stopped=self.was_stopped(), solution=solutions[0] if solutions else [])
+
+    def get_events(self):
+        """
+        Retourne les événements de progression publiés depuis le dernier appel.
+
+        Retourne:
+        - list: Événements (dictionnaires, voir ProgressPublisher), du plus ancien au plus récent.
+        """
+        return drain_events(self.events)
 
     def is_running(self):
         """
@@ -62,6 +94,12 @@ class SolverManager:
         """
         return self.running and not self.algo.stop_requested
 
+    def was_stopped(self):
+        """
+        Indique si la résolution a été interrompue avant d'aboutir (solution ou recherche épuisée).
+        """
+        return self.algo is not None and self.algo.stop_requested
+
     def request_stop(self):
         """
         Demande l'arrêt prématuré de l'algorithme.
@@ -87,12 +125,23 @@ class SolverManager:
         Récupère la liste des placements choisis jusqu'à présent (solution partielle).
 
         Retourne:
-        - list: Liste des étapes (chacune contenant 'piece', 'cells_covered', etc.)
+        - list: Liste des étapes (Placement: piece, cells_covered, etc.)
         """
         if self.algo:
             return self.algo.get_current_solution_steps()
         return []
 
+    def get_intermediate_steps(self):
+        """
+        Récupère les étapes intermédiaires enregistrées (si record_steps est actif).
+
+        Retourne:
+        - list: Liste d'étapes, chacune étant une séquence de placements.
+        """
+        if self.algo:
+            return self.algo.get_intermediate_steps()
+        return []
+
     def get_solutions(self):
         """
         Retourne toutes les solutions trouvées. Généralement après la fin de l'algo.
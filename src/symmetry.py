@@ -0,0 +1,169 @@
+import numpy as np
+from itertools import combinations
+from placement import Placement
+
+# Transformations du plateau (rotations et symétries), appliquées à des tableaux 2D.
+# Les quatre dernières ne conservent les dimensions que d'un plateau carré.
+TRANSFORMS = {
+    "identity": lambda a: a,
+    "rot180": lambda a: np.rot90(a, 2),
+    "flipud": np.flipud,
+    "fliplr": np.fliplr,
+    "rot90": lambda a: np.rot90(a, 1),
+    "rot270": lambda a: np.rot90(a, 3),
+    "transpose": lambda a: a.T,
+    "antitranspose": lambda a: np.rot90(a, 2).T,
+}
+
+
+class BoardSymmetry:
+    """
+    Cassage de symétrie: détecte les rotations et symétries qui laissent invariantes les
+    cellules libres du plateau (cases occupées et pièces fixées), puis restreint une pièce
+    libre à une variante par classe de symétrie.
+
+    Sans restriction, chaque solution est trouvée dans toutes ses orientations (jusqu'à 8
+    sur un plateau carré vide): l'image d'une solution par une symétrie du plateau en est une
+    autre, de mêmes pièces fixées. On choisit une pièce "asymétrique" vis-à-vis d'un groupe H
+    de symétries (aucune transformation de H, hors l'identité, ne laisse une de ses variantes
+    inchangée): en ne gardant qu'une variante de chaque orbite, chaque famille de solutions
+    symétriques est trouvée exactement une fois, ce qui divise la recherche par |H|.
+    Les autres solutions s'obtiennent avec images() (énumération complète).
+
+    Paramètres:
+    - plateau (Plateau): Plateau du puzzle.
+    - pieces (dict): Dictionnaire {nom: Piece} de toutes les pièces.
+    - fixed_pieces (dict): Pièces fixées (variante et position), optionnel.
+
+    Attributs (après construction):
+    - group (list): Noms des transformations laissant le plateau invariant.
+    - subgroup (list): Transformations utilisées pour le cassage (identité seule: aucun cassage).
+    - piece (str): Pièce restreinte, ou None.
+    - allowed_variants (dict): {nom: indices des variantes conservées} (vide sans cassage).
+    """
+    def __init__(self, plateau, pieces, fixed_pieces=None):
+        self.lignes, self.colonnes = plateau.lignes, plateau.colonnes
+        self.pieces = pieces
+        fixed_pieces = fixed_pieces if fixed_pieces else {}
+
+        occupied = np.asarray(plateau.plateau) != 0
+        for nom, info in fixed_pieces.items():
+            variant = pieces[nom].variants[info['variante_index']]
+            i, j = info['position']
+            occupied[i + variant.rows, j + variant.cols] = True
+
+        # Image de chaque cellule par chaque transformation, lue sur un tableau d'indices
+        reference = np.arange(self.lignes * self.colonnes).reshape(self.lignes, self.colonnes)
+        self.cell_maps = {}
+        keys = {}
+        for name, transform in TRANSFORMS.items():
+            image = transform(reference)
+            if image.shape != reference.shape or not np.array_equal(transform(occupied), occupied):
+                continue
+            cell_map = np.empty((reference.size, 2), dtype=int)
+            cell_map[image.ravel()] = np.argwhere(np.ones(image.shape, dtype=bool))
+            self.cell_maps[name] = cell_map
+            keys[image.tobytes()] = name
+        self.group = list(self.cell_maps)
+        # Composition des transformations (pour vérifier qu'un sous-ensemble est un groupe)
+        self.compose = {
+            (a, b): keys[TRANSFORMS[a](TRANSFORMS[b](reference)).tobytes()]
+            for a in self.group for b in self.group
+        }
+
+        self.subgroup = ["identity"]
+        self.piece = None
+        self.allowed_variants = {}
+        self.variant_maps = {}
+        free_pieces = [p for nom, p in pieces.items() if nom not in fixed_pieces]
+        for subgroup in self.subgroups():
+            candidates = [p for p in free_pieces if self.acts_freely(p, subgroup)]
+            if candidates:
+                # Plus une pièce a de variantes, plus la restriction retire de placements
+                piece = max(candidates, key=lambda p: len(p.variantes))
+                self.subgroup = subgroup
+                self.piece = piece.nom
+                self.allowed_variants = {piece.nom: self.orbit_representatives(piece, subgroup)}
+                break
+
+    def subgroups(self):
+        """
+        Retourne les sous-groupes non triviaux du groupe de symétrie, du plus grand au plus petit.
+        """
+        others = [name for name in self.group if name != "identity"]
+        found = []
+        for size in range(len(others), 0, -1):
+            for subset in combinations(others, size):
+                candidate = ["identity"] + list(subset)
+                if all(self.compose[a, b] in candidate for a in candidate for b in candidate):
+                    found.append(candidate)
+        return found
+
+    def variant_map(self, piece, name):
+        """
+        Retourne, pour chaque variante de la pièce, l'indice de son image par la transformation.
+        """
+        key = (piece.nom, name)
+        if key not in self.variant_maps:
+            self.variant_maps[key] = [piece.variant_index(TRANSFORMS[name](variante))
+                                      for variante in piece.variantes]
+        return self.variant_maps[key]
+
+    def acts_freely(self, piece, subgroup):
+        """
+        Indique si aucune transformation du sous-groupe (hors l'identité) ne fixe une variante
+        de la pièce: les orbites des variantes ont alors toutes |subgroup| éléments.
+        """
+        for name in subgroup:
+            if name == "identity":
+                continue
+            if any(image == k for k, image in enumerate(self.variant_map(piece, name))):
+                return False
+        return True
+
+    def orbit_representatives(self, piece, subgroup):
+        """
+        Retourne la plus petite variante (par indice) de chaque orbite sous le sous-groupe.
+        """
+        representatives = []
+        seen = set()
+        for k in range(len(piece.variantes)):
+            if k not in seen:
+                representatives.append(k)
+                seen.update(self.variant_map(piece, name)[k] for name in subgroup)
+        return representatives
+
+    @property
+    def order(self):
+        """
+        Nombre de solutions représentées par chaque solution trouvée.
+        """
+        return len(self.subgroup)
+
+    def transform_placement(self, row, name):
+        """
+        Retourne l'image d'un placement (ligne de la matrice) par une transformation du plateau
+        (placement hors matrice, d'identifiant -1).
+        """
+        piece = row.piece
+        cell_map = self.cell_maps[name]
+        variante_index = self.variant_map(piece, name)[row.variante_index]
+        variant = piece.variants[row.variante_index]
+        height, width = variant.height, variant.width
+        i, j = row.position
+        # Coin haut-gauche de l'image du rectangle englobant
+        corners = cell_map[[i * self.colonnes + j, (i + height - 1) * self.colonnes + j + width - 1]]
+        cells = tuple(sorted(int(r) * self.colonnes + int(c) for r, c in cell_map[list(row.cells)]))
+        position = (int(corners[:, 0].min()), int(corners[:, 1].min()))
+        return Placement(-1, piece, variante_index, position, cells, row.piece_column, self.colonnes)
+
+    def images(self, solution):
+        """
+        Produit les images d'une solution par les transformations du sous-groupe (hors l'identité),
+        à la demande: avec la solution elle-même, ce sont toutes les solutions qu'elle représente.
+        Les pièces fixées restent en place.
+        """
+        for name in self.subgroup:
+            if name == "identity":
+                continue
+            yield [row if row.fixed else self.transform_placement(row, name) for row in solution]
@@ -0,0 +1,227 @@
+import hashlib
+from disk_cache import load_json, save_json
+
+# Taille maximale (en cellules) des zones vides testées par leur forme.
+SMALL_ZONE_MAX_CELLS = 10
+
+# Version du format des tables sur disque (à incrémenter si le contenu change de sens).
+TABLE_VERSION = 1
+
+# Formes déjà chargées dans ce processus, par nom de fichier: les tables d'un même ensemble
+# de pièces partagent leur dictionnaire de formes (une résolution par lot de niveaux ne
+# relit pas le disque à chaque niveau). Les indices de classes ne dépendent que des formes
+# des pièces, donc de la signature: le partage est valable quels que soient les noms.
+_loaded_shapes = {}
+
+
+def piece_set_signature(shape_counts):
+    """
+    Calcule une signature stable d'un ensemble de pièces, à partir des formes canoniques
+    des pièces et de leur nombre (les noms n'interviennent pas: deux jeux de pièces de
+    mêmes formes partagent la même table).
+
+    Paramètres:
+    - shape_counts (dict): {forme canonique: nombre de pièces de cette forme}.
+
+    Retourne:
+    - str: Empreinte hexadécimale.
+    """
+    digest = hashlib.sha1()
+    for shape in sorted(shape_counts):
+        digest.update("{}={}|".format(shape, shape_counts[shape]).encode())
+    return digest.hexdigest()
+
+
+def canonical_shape(cells):
+    """
+    Forme canonique d'un ensemble de cellules, à translation, rotation et symétrie près:
+    la plus petite (ordre lexicographique) des 8 transformations normalisées.
+
+    Paramètres:
+    - cells (iterable): Cellules (i, j).
+
+    Retourne:
+    - str: Clé de la forme, par exemple "0,0;0,1;1,0".
+    """
+    best = None
+    for transform in (
+        lambda i, j: (i, j), lambda i, j: (i, -j), lambda i, j: (-i, j), lambda i, j: (-i, -j),
+        lambda i, j: (j, i), lambda i, j: (j, -i), lambda i, j: (-j, i), lambda i, j: (-j, -i),
+    ):
+        moved = [transform(i, j) for i, j in cells]
+        min_i = min(i for i, _ in moved)
+        min_j = min(j for _, j in moved)
+        candidate = sorted((i - min_i, j - min_j) for i, j in moved)
+        if best is None or candidate < best:
+            best = candidate
+    return ";".join("{},{}".format(i, j) for i, j in best)
+
+
+class TilingTable:
+    """
+    Table indiquant, pour chaque forme de petite zone vide, quelles combinaisons de pièces
+    peuvent la paver exactement. Elle permet un pruning plus fort que le seul test sur la
+    taille des zones: une zone de 5 cellules en forme de croix ne peut pas être comblée
+    si aucune pièce restante n'a cette forme, même si une pièce de 5 cellules reste.
+
+    Les pièces de même forme sont interchangeables: elles sont regroupées en classes
+    (une par forme canonique), et un pavage est décrit par le nombre de pièces de chaque
+    classe qu'il utilise. Pour chaque forme de zone (à rotation et symétrie près: les
+    variantes des pièces couvrent toutes les orientations), la table conserve les pavages
+    minimaux, sous forme de couples (classe, nombre). Les formes sont calculées à la demande,
+    à partir de Piece.variants, puis la table est enregistrée sur disque, indexée par la
+    signature de l'ensemble de pièces (voir load() et save()). Les tables de même signature
+    d'un processus partagent leurs formes calculées.
+
+    Paramètres:
+    - pieces (dict): Dictionnaire {nom: Piece} de toutes les pièces.
+    - max_cells (int): Taille maximale des zones traitées.
+    """
+    def __init__(self, pieces, max_cells=SMALL_ZONE_MAX_CELLS):
+        self.max_cells = max_cells
+        piece_shapes = {
+            nom: canonical_shape(list(piece.variants[0].offsets))
+            for nom, piece in pieces.items()
+        }
+        self.shape_counts = {}
+        for shape in piece_shapes.values():
+            self.shape_counts[shape] = self.shape_counts.get(shape, 0) + 1
+        self.signature = piece_set_signature(self.shape_counts)
+        shapes = sorted(self.shape_counts)
+        class_index = {shape: k for k, shape in enumerate(shapes)}
+        self.class_of = {nom: class_index[shape] for nom, shape in piece_shapes.items()}
+        self.class_limits = [self.shape_counts[shape] for shape in shapes]
+        # Pour chaque classe, les cellules de chaque variante relatives à sa première
+        # cellule (ordre ligne par ligne)
+        self.class_offsets = [None] * len(shapes)
+        for nom, k in self.class_of.items():
+            if self.class_offsets[k] is not None:
+                continue
+            variantes = []
+            for variant in pieces[nom].variants:
+                first_i, first_j = variant.offsets[0]
+                variantes.append([(i - first_i, j - first_j) for i, j in variant.offsets])
+            self.class_offsets[k] = variantes
+        self.shapes = {}  # Forme canonique -> pavages minimaux [[classe, nombre], ...]
+        self.normalized = {}  # Forme translatée (tuple) -> pavages, évite la canonisation
+        self.dirty = False
+
+    @classmethod
+    def load(cls, pieces, max_cells=SMALL_ZONE_MAX_CELLS):
+        """
+        Crée la table de l'ensemble de pièces, en reprenant les formes déjà calculées dans
+        ce processus, ou à défaut enregistrées sur disque s'il y en a (le fichier n'est lu
+        qu'une fois par processus).
+        """
+        table = cls(pieces, max_cells)
+        name = table.file_name()
+        shapes = _loaded_shapes.get(name)
+        if shapes is None:
+            shapes = _loaded_shapes[name] = table.read_shapes()
+        table.shapes = shapes
+        return table
+
+    def read_shapes(self):
+        """
+        Lit les formes enregistrées sur disque pour cet ensemble de pièces.
+
+        Retourne:
+        - dict: {forme canonique: pavages}, vide si le fichier est absent, illisible ou
+          d'une autre version.
+        """
+        data = load_json(self.file_name())
+        if data and data.get("version") == TABLE_VERSION and data.get("signature") == self.signature:
+            return data["shapes"]
+        return {}
+
+    def file_name(self):
+        return "tilings-{}.json".format(self.signature[:16])
+
+    def save(self):
+        """
+        Enregistre la table sur disque si de nouvelles formes ont été calculées. Les formes
+        déjà présentes dans le fichier (écrites entre-temps par un autre processus) sont
+        fusionnées avec celles de la table avant l'écriture, qui est atomique (voir
+        disk_cache.save_json): des processus concurrents ne perdent pas leurs formes.
+        """
+        if not self.dirty:
+            return
+        for shape, tilings in self.read_shapes().items():
+            self.shapes.setdefault(shape, tilings)
+        data = {"version": TABLE_VERSION, "signature": self.signature, "shapes": self.shapes}
+        if save_json(self.file_name(), data):
+            self.dirty = False
+
+    def can_tile(self, cells, class_counts):
+        """
+        Indique si une zone peut être pavée exactement par des pièces restantes.
+
+        Paramètres:
+        - cells (list): Cellules (i, j) de la zone (au plus max_cells).
+        - class_counts (list): Nombre de pièces restantes de chaque classe (voir class_of).
+
+        Retourne:
+        - bool: True si un pavage n'utilisant que des pièces restantes existe.
+        """
+        for tiling in self.tilings(cells):
+            for k, count in tiling:
+                if class_counts[k] < count:
+                    break
+            else:
+                return True
+        return False
+
+    def tilings(self, cells):
+        """
+        Retourne les pavages minimaux de la zone ([[classe, nombre], ...] pour chacun).
+        """
+        min_i = min(i for i, _ in cells)
+        min_j = min(j for _, j in cells)
+        key = tuple(sorted((i - min_i, j - min_j) for i, j in cells))
+        tilings = self.normalized.get(key)
+        if tilings is None:
+            shape = canonical_shape(key)
+            tilings = self.shapes.get(shape)
+            if tilings is None:
+                tilings = self.compute_tilings(key)
+                self.shapes[shape] = tilings
+                self.dirty = True
+            self.normalized[key] = tilings
+        return tilings
+
+    def compute_tilings(self, cells):
+        """
+        Énumère les pavages exacts de la zone (en couvrant toujours la première cellule
+        libre, avec mémorisation des sous-zones déjà résolues), dans la limite du nombre
+        de pièces de chaque classe.
+
+        Retourne:
+        - list: Pavages minimaux (aucun n'utilise plus de pièces de chaque classe qu'un autre),
+          chacun sous forme de liste [[classe, nombre], ...].
+        """
+        class_offsets, limits = self.class_offsets, self.class_limits
+        memo = {}
+
+        def search(free):
+            # Ensemble des vecteurs (nombre de pièces par classe) pavant exactement free
+            if not free:
+                return {(0,) * len(limits)}
+            if free in memo:
+                return memo[free]
+            result = set()
+            first_i, first_j = min(free)
+            for k, variantes in enumerate(class_offsets):
+                for offsets in variantes:
+                    placed = [(first_i + di, first_j + dj) for di, dj in offsets]
+                    if all(cell in free for cell in placed):
+                        for counts in search(free.difference(placed)):
+                            if counts[k] < limits[k]:
+                                result.add(counts[:k] + (counts[k] + 1,) + counts[k + 1:])
+            memo[free] = result
+            return result
+
+        found = search(frozenset(cells))
+        minimal = [counts for counts in found
+                   if not any(other != counts and all(o <= c for o, c in zip(other, counts))
+                              for other in found)]
+        return [[[k, n] for k, n in enumerate(counts) if n] for counts in sorted(minimal)]
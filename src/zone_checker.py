@@ -1,4 +1,47 @@
 import numpy as np
+from collections import OrderedDict
+
+# Nombre d'entrées conservées par défaut dans le cache de remplissage des zones.
+DEFAULT_ZONE_CACHE_CAPACITY = 8192
+
+class ZoneCache:
+    """
+    Cache LRU (le moins récemment utilisé est évincé) de capacité bornée, utilisé pour
+    mémoriser la faisabilité du remplissage des zones vides.
+
+    Paramètres:
+    - capacity (int): Nombre maximal d'entrées conservées.
+    """
+    def __init__(self, capacity=DEFAULT_ZONE_CACHE_CAPACITY):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Retourne la valeur associée à key (et la marque comme récemment utilisée), ou None si absente.
+        """
+        entries = self.entries
+        if key not in entries:
+            return None
+        entries.move_to_end(key)
+        return entries[key]
+
+    def put(self, key, value):
+        """
+        Mémorise une valeur, en évinçant l'entrée la plus ancienne si la capacité est atteinte.
+        """
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
 
 class ZoneChecker:
     """
@@ -6,23 +49,116 @@ class ZoneChecker:
     L'objectif est de détecter les situations où les zones vides ne peuvent plus être remplies
     par les pièces restantes, permettant ainsi un pruning (coupure) précoce.
 
+    Le vérificateur est créé une seule fois par recherche et conserve une grille d'occupation
+    mise à jour en place à chaque placement (push) et retrait (pop), ainsi que les tailles
+    des pièces restantes. La vérification ne parcourt que les zones voisines du dernier
+    placement: son coût dépend de la taille de la pièce et non de celle du plateau.
+    La grille est aplatie (bytearray) avec des tables de voisins précalculées, et les zones
+    sont mesurées par un parcours avec pile qui ne retourne que leur taille.
+
     Paramètres:
     - plateau: Objet plateau (dimensions + grille)
     - pieces (dict): Dictionnaire des pièces disponibles
-    - zone_cache (dict): Cache pour mémoriser la faisabilité du remplissage de zones de tailles données
+    - zone_cache (ZoneCache): Cache de la faisabilité du remplissage d'une zone, indexé par
+      (taille de zone, multiensemble des tailles des pièces restantes)
+    - stats (AlgorithmStats, optionnel): Statistiques recevant les succès/échecs du cache
+    - tiling_table (TilingTable, optionnel): Table de pavage des petites zones; si fournie,
+      les zones d'au plus tiling_table.max_cells cellules sont testées selon leur forme
     """
-    def __init__(self, plateau, pieces, zone_cache):
+    def __init__(self, plateau, pieces, zone_cache, stats=None, tiling_table=None):
         self.plateau = plateau
         self.pieces = pieces
         self.zone_cache = zone_cache
+        self.stats = stats
+        self.tiling_table = tiling_table
+        lignes, colonnes = plateau.lignes, plateau.colonnes
+        self.width = colonnes
+        self.num_cells = lignes * colonnes
+        # Grille aplatie (cellule = i * colonnes + j): nombre de placements couvrant chaque
+        # cellule, les cellules déjà occupées valent 1
+        self.occupancy = bytearray((np.asarray(plateau.plateau) != 0).astype(np.uint8).ravel().tobytes())
+        # Voisins (4-directions) de chaque cellule, calculés une seule fois
+        self.neighbours = []
+        for i in range(lignes):
+            for j in range(colonnes):
+                cell = i * colonnes + j
+                voisins = []
+                if i > 0:
+                    voisins.append(cell - colonnes)
+                if i < lignes - 1:
+                    voisins.append(cell + colonnes)
+                if j > 0:
+                    voisins.append(cell - 1)
+                if j < colonnes - 1:
+                    voisins.append(cell + 1)
+                self.neighbours.append(tuple(voisins))
+        # Marquage des cellules visitées par numéro de parcours (évite de réinitialiser un ensemble)
+        self.visited = [0] * self.num_cells
+        self.stamp = 0
+        self.remaining_sizes = {nom: len(p.variants[0]) for nom, p in pieces.items()}
+        self.removed_sizes = []
+        # Multiensemble des tailles restantes: nombre de pièces restantes de chaque taille.
+        # Sa forme en tuple (signature) complète la clé du cache.
+        self.size_counts = [0] * (max(self.remaining_sizes.values(), default=0) + 1)
+        for size in self.remaining_sizes.values():
+            self.size_counts[size] += 1
+        self.signature = tuple(self.size_counts)
+        # Nombre de pièces restantes de chaque classe de forme, au sens de la table de pavage
+        self.class_of = tiling_table.class_of if tiling_table is not None else {}
+        self.class_counts = list(tiling_table.class_limits) if tiling_table is not None else []
+
+    def cells_of(self, placement):
+        """
+        Retourne les indices (aplatis) des cellules couvertes par un placement.
+        """
+        return placement.cells
+
+    def push(self, placement):
+        """
+        Applique un placement à la grille d'occupation et retire sa pièce des pièces restantes.
+        """
+        occupancy = self.occupancy
+        for cell in self.cells_of(placement):
+            occupancy[cell] += 1
+        nom = placement.piece.nom
+        size = self.remaining_sizes.pop(nom, None)
+        self.removed_sizes.append((nom, size))
+        if size is not None:
+            self.size_counts[size] -= 1
+            self.signature = tuple(self.size_counts)
+            if nom in self.class_of:
+                self.class_counts[self.class_of[nom]] -= 1
+
+    def pop(self, placement):
+        """
+        Annule le dernier push().
+        """
+        occupancy = self.occupancy
+        for cell in self.cells_of(placement):
+            occupancy[cell] -= 1
+        nom, size = self.removed_sizes.pop()
+        if size is not None:
+            self.remaining_sizes[nom] = size
+            self.size_counts[size] += 1
+            self.signature = tuple(self.size_counts)
+            if nom in self.class_of:
+                self.class_counts[self.class_of[nom]] += 1
+
+    def should_prune(self, solution):
+        """
+        Interface commune des pruners (voir AlgorithmX.pruners): True si la branche est sans issue.
+        """
+        return self.has_unfillable_voids(solution)
 
     def has_unfillable_voids(self, solution):
         """
-        Détermine s'il existe des zones vides impossibles à remplir avec les pièces restantes.
-        Pour cela:
-        1. On applique la solution courante au plateau pour marquer les cellules occupées.
-        2. On identifie les zones vides (suite de cellules contiguës).
-        3. On vérifie si leur taille peut être atteinte par une combinaison des tailles de pièces restantes.
+        Détermine s'il existe, autour du dernier placement, des zones vides impossibles
+        à remplir avec les pièces restantes. Pour cela:
+        1. On part des cellules vides voisines du dernier placement (déjà appliqué via push()).
+        2. On mesure les zones vides (suite de cellules contiguës) qui les contiennent.
+        3. Pour une petite zone, on vérifie dans la table de pavage que sa forme peut être
+           pavée par des pièces restantes; sinon, on vérifie si sa taille peut être atteinte
+           par une combinaison des tailles de pièces restantes.
 
         Paramètres:
         - solution (list): Liste des placements actuels dans la branche de recherche.
@@ -30,90 +166,85 @@ class ZoneChecker:
         Retourne:
         - bool: True si une zone est impossible à remplir, False sinon.
         """
-        plateau_temp = self.apply_solution_to_plateau(solution)
-        empty_zones = self.get_empty_zones(plateau_temp)
-        remaining_pieces = set(self.pieces.keys()) - set(sol['piece'].nom for sol in solution)
-        remaining_sizes = [np.count_nonzero(self.pieces[p].forme_base) for p in remaining_pieces]
-
-        for zone in empty_zones:
-            zone_size = len(zone)
-            # Vérification via le cache
-            if zone_size in self.zone_cache:
-                if not self.zone_cache[zone_size]:
-                    return True
-                else:
-                    continue
-
-            # Calcul si zone comblable
-            possible = self.is_zone_fillable(zone_size, remaining_sizes)
-            self.zone_cache[zone_size] = possible
-            if not possible:
-                return True
+        if not solution:
+            return False
+        occupancy, neighbours, visited = self.occupancy, self.neighbours, self.visited
+        collect = self.tiling_table is not None
+        stamp = self.next_stamp()
+        for cell in self.cells_of(solution[-1]):
+            for voisin in neighbours[cell]:
+                if not occupancy[voisin] and visited[voisin] != stamp:
+                    zone = [] if collect else None
+                    zone_size = self.zone_size(voisin, stamp, zone)
+                    if not self.is_zone_possible(zone_size, zone):
+                        return True
         return False
 
-    def apply_solution_to_plateau(self, solution):
+    def is_zone_possible(self, zone_size, zone=None):
         """
-        Applique la solution courante au plateau, retournant un plateau temporaire
-        avec les placements déjà effectués.
+        Teste si une zone vide peut encore être comblée par les pièces restantes.
 
         Paramètres:
-        - solution (list): Liste des placements déjà choisis.
+        - zone_size (int): Taille de la zone.
+        - zone (list, optionnel): Cellules (indices aplatis) de la zone, pour le test de forme.
 
         Retourne:
-        - plateau_temp (np.ndarray): Copie du plateau avec les pièces placées.
+        - bool: False si la zone ne peut pas être comblée.
         """
-        plateau_temp = np.copy(self.plateau.plateau)
-        for sol in solution:
-            for cell in sol['cells_covered']:
-                i, j = cell
-                plateau_temp[i, j] = 1
-        return plateau_temp
+        table = self.tiling_table
+        if zone is not None and zone_size <= table.max_cells:
+            width = self.width
+            return table.can_tile([divmod(cell, width) for cell in zone], self.class_counts)
 
-    def get_empty_zones(self, plateau_temp):
-        """
-        Identifie toutes les zones vides dans le plateau temporaire.
-        Une zone vide est un ensemble de cellules contiguës (en 4-directions) non occupées.
-
-        Paramètres:
-        - plateau_temp (np.ndarray): Plateau actuel avec placements déjà effectués.
+        # Vérification via le cache: la réponse dépend de la taille de la zone
+        # et des tailles des pièces encore disponibles
+        key = (zone_size, self.signature)
+        possible = self.zone_cache.get(key)
+        if possible is not None:
+            if self.stats is not None:
+                self.stats.increment_zone_cache_hits()
+        else:
+            if self.stats is not None:
+                self.stats.increment_zone_cache_misses()
+            # Calcul si zone comblable
+            possible = self.is_zone_fillable(zone_size, list(self.remaining_sizes.values()))
+            self.zone_cache.put(key, possible)
+        return possible
 
-        Retourne:
-        - empty_zones (list): Liste de zones, chaque zone est une liste de coordonnées (i,j).
+    def next_stamp(self):
         """
-        visited = set()
-        empty_zones = []
-        for i in range(self.plateau.lignes):
-            for j in range(self.plateau.colonnes):
-                if plateau_temp[i, j] == 0 and (i, j) not in visited:
-                    zone = self.explore_zone(plateau_temp, i, j, visited)
-                    empty_zones.append(zone)
-        return empty_zones
+        Démarre un nouveau parcours: les cellules marquées lors des parcours précédents
+        redeviennent non visitées sans avoir à effacer le tableau.
+        """
+        self.stamp += 1
+        return self.stamp
 
-    def explore_zone(self, plateau_temp, i, j, visited):
+    def zone_size(self, start, stamp, zone=None):
         """
-        Explore une zone vide à partir d'une cellule donnée (i,j).
-        Effectue un parcours en largeur (BFS) pour récupérer toutes les cellules contiguës vides.
+        Mesure la zone vide contenant la cellule start (parcours en profondeur avec pile).
 
         Paramètres:
-        - plateau_temp (np.ndarray): Plateau temporaire.
-        - i (int), j (int): Coordonnées de départ pour explorer la zone.
-        - visited (set): Ensemble des cellules déjà visitées.
+        - start (int): Cellule vide de départ (indice aplati), non encore visitée.
+        - stamp (int): Numéro du parcours courant (voir next_stamp()).
+        - zone (list, optionnel): Si fourni, reçoit les cellules de la zone.
 
         Retourne:
-        - zone (list): Liste des cellules (i,j) constituant la zone vide explorée.
-        """
-        queue = [(i, j)]
-        visited.add((i, j))
-        zone = [(i, j)]
-        while queue:
-            ci, cj = queue.pop(0)
-            for ni, nj in [(ci+1, cj), (ci-1, cj), (ci, cj+1), (ci, cj-1)]:
-                if 0 <= ni < self.plateau.lignes and 0 <= nj < self.plateau.colonnes:
-                    if plateau_temp[ni, nj] == 0 and (ni, nj) not in visited:
-                        visited.add((ni, nj))
-                        queue.append((ni, nj))
-                        zone.append((ni, nj))
-        return zone
+        - int: Nombre de cellules de la zone.
+        """
+        occupancy, neighbours, visited = self.occupancy, self.neighbours, self.visited
+        visited[start] = stamp
+        stack = [start]
+        size = 0
+        while stack:
+            cell = stack.pop()
+            size += 1
+            if zone is not None:
+                zone.append(cell)
+            for voisin in neighbours[cell]:
+                if not occupancy[voisin] and visited[voisin] != stamp:
+                    visited[voisin] = stamp
+                    stack.append(voisin)
+        return size
 
     def is_zone_fillable(self, zone_size, remaining_sizes):
         """
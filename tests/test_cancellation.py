@@ -0,0 +1,126 @@
+"""
+Vérifie l'arrêt coopératif des recherches: délai, limite de noeuds et signal externe.
+"""
+import time
+
+import pytest
+
+from algo_x_knuth import AlgorithmX
+from cancellation import CHECK_INTERVAL
+from piece import Piece
+from piece_sets import CLASSIC_PIECES
+from plateau import Plateau
+
+SEARCHES = [
+    {"engine": "dlx"},
+    {"engine": "bitset"},
+    {"engine": "matrix"},
+    {"engine": "dlx", "search": "iterative"},
+    {"engine": "bitset", "search": "iterative"},
+    {"engine": "matrix", "search": "iterative"},
+]
+
+
+def option_id(options):
+    return ",".join(f"{key}={value}" for key, value in options.items())
+
+
+def build_algo(**options):
+    # Plateau classique vide: l'énumération complète est bien trop longue pour aboutir
+    pieces = {nom: Piece(nom, forme) for nom, forme in CLASSIC_PIECES}
+    return AlgorithmX(Plateau(5, 11), pieces, "descender", **options)
+
+
+class CountdownSignal:
+    """
+    Signal levé dès que la recherche a testé trigger placements (même interface que StopSignal).
+    """
+    def __init__(self, trigger):
+        self.algo = None
+        self.trigger = trigger
+        self.time = None
+
+    def is_set(self):
+        if self.time is None and self.algo.stats.placements_testes >= self.trigger:
+            self.time = time.time()
+        return self.time is not None
+
+    def get_reason(self):
+        return "requested"
+
+    def get_time(self):
+        return self.time
+
+
+@pytest.mark.parametrize("options", SEARCHES, ids=option_id)
+def test_timeout(options):
+    algo = build_algo(**options)
+    start = time.time()
+    algo.count_solutions(timeout=0.2)
+    elapsed = time.time() - start
+
+    stats = algo.get_stats()
+    assert stats["stop_reason"] == "timeout"
+    assert elapsed < 1.0
+    assert stats["stop_latency"] is not None and stats["stop_latency"] < 0.5
+
+
+@pytest.mark.parametrize("node_limit", [1, CHECK_INTERVAL - 1, 100, 1000])
+@pytest.mark.parametrize("options", SEARCHES, ids=option_id)
+def test_node_limit_is_exact(options, node_limit):
+    algo = build_algo(**options)
+    algo.count_solutions(node_limit=node_limit)
+
+    stats = algo.get_stats()
+    assert stats["stop_reason"] == "node_limit"
+    assert stats["placements_testes"] == node_limit
+
+
+@pytest.mark.parametrize("options", SEARCHES, ids=option_id)
+def test_node_limit_on_solve(options):
+    # Une solution demande un placement par pièce: la limite tombe avant
+    algo = build_algo(**options)
+    assert algo.solve(node_limit=len(CLASSIC_PIECES) - 1) == []
+    stats = algo.get_stats()
+    assert stats["stop_reason"] == "node_limit"
+    assert stats["placements_testes"] == len(CLASSIC_PIECES) - 1
+
+
+@pytest.mark.parametrize("trigger", [1, 37, 500])
+@pytest.mark.parametrize("options", SEARCHES, ids=option_id)
+def test_signal_overshoot_is_bounded(options, trigger):
+    # Le signal n'est lu que tous les CHECK_INTERVAL noeuds: l'arrêt est pris en compte
+    # au plus CHECK_INTERVAL placements après son déclenchement.
+    signal = CountdownSignal(trigger)
+    algo = build_algo(stop_signal=signal, **options)
+    signal.algo = algo
+    algo.count_solutions()
+
+    stats = algo.get_stats()
+    assert stats["stop_reason"] == "requested"
+    assert trigger <= stats["placements_testes"] <= trigger + CHECK_INTERVAL
+
+
+@pytest.mark.parametrize("engine", ["dlx", "bitset", "matrix"])
+def test_resume_after_node_limit(engine):
+    expected = build_algo(engine=engine, search="iterative").solve()
+    assert expected
+
+    algo = build_algo(engine=engine, search="iterative")
+    assert algo.solve(node_limit=len(CLASSIC_PIECES) - 1) == []
+    state = algo.save_search_state()
+    assert state
+
+    resumed = build_algo(engine=engine, search="iterative").solve(resume_state=state)
+    assert [sorted(row.id for row in solution) for solution in resumed] == \
+        [sorted(row.id for row in solution) for solution in expected]
+
+
+@pytest.mark.parametrize("engine", ["dlx", "bitset", "matrix"])
+def test_recursive_search_cannot_be_saved(engine):
+    algo = build_algo(engine=engine)
+    with pytest.raises(RuntimeError):
+        algo.save_search_state()
+    algo.solve(node_limit=len(CLASSIC_PIECES) - 1)
+    with pytest.raises(RuntimeError):
+        algo.save_search_state()
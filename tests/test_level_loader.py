@@ -0,0 +1,70 @@
+"""
+Vérifie la pose des pièces d'un niveau (place_level) et le traitement des niveaux invalides par la CLI.
+"""
+import json
+
+import pytest
+
+from cli import solve_level
+from level_loader import build_pieces, load_problem, place_level
+from piece_sets import CLASSIC_PIECES
+from plateau import Plateau
+
+NOM = CLASSIC_PIECES[0][0]
+
+INVALID_ENTRIES = [
+    {"variante_index": 0, "position": [-1, 0]},
+    {"variante_index": 0, "position": [0, -1]},
+    {"variante_index": 0, "position": [5, 0]},
+    {"variante_index": 0, "position": [0, 11]},
+    {"variante_index": 99, "position": [0, 0]},
+    {"variante_index": -1, "position": [0, 0]},
+    {"variante_index": 1.5, "position": [0, 0]},
+    {"variante_index": "0", "position": [0, 0]},
+    {"variante_index": 0, "position": 3},
+    {"variante_index": 0, "position": [0]},
+    {"variante_index": 0, "position": [0, 0, 0]},
+    {"variante_index": 0, "position": ["0", 0]},
+    [0, [0, 0]],
+]
+
+
+def place(placed_pieces):
+    return place_level(placed_pieces, Plateau(5, 11), build_pieces(CLASSIC_PIECES))
+
+
+def test_place_level():
+    fixed_pieces = place({NOM: {"variante_index": 0, "position": [0, 0]}})
+    assert fixed_pieces == {NOM: {"variante_index": 0, "position": (0, 0)}}
+
+
+@pytest.mark.parametrize("info", INVALID_ENTRIES, ids=repr)
+def test_invalid_entries_raise_value_error(info):
+    with pytest.raises(ValueError):
+        place({NOM: info})
+
+
+def test_overlap_raises_value_error():
+    other = CLASSIC_PIECES[1][0]
+    with pytest.raises(ValueError):
+        place({NOM: {"variante_index": 0, "position": [0, 0]}, other: {"variante_index": 0, "position": [0, 0]}})
+
+
+@pytest.mark.parametrize("info", INVALID_ENTRIES + [{"position": [0, 0]}], ids=repr)
+def test_cli_reports_invalid_level(info, tmp_path):
+    path = tmp_path / "level.json"
+    path.write_text(json.dumps({"placed_pieces": {NOM: info}}))
+    result = solve_level({
+        "level": str(path), "rows": 5, "cols": 11, "pieces": CLASSIC_PIECES, "heuristic": "descender",
+        "engine": "dlx", "timeout": None, "node_limit": None, "count": False, "placed_pieces": None,
+    })
+    assert result["status"] == "error"
+    assert result["error"]
+
+
+def test_load_problem_keeps_valid_level(tmp_path):
+    path = tmp_path / "level.json"
+    path.write_text(json.dumps({"placed_pieces": {NOM: {"variante_index": 0, "position": [0, 0]}}}))
+    plateau, pieces, fixed_pieces = load_problem(str(path), 5, 11, CLASSIC_PIECES)
+    assert fixed_pieces[NOM]["position"] == (0, 0)
+    assert plateau.plateau.any()
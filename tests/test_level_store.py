@@ -0,0 +1,129 @@
+"""
+Vérifie l'écriture et la relecture (projection en mémoire) des fichiers de niveaux LevelStore.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from level_loader import load_level
+from level_store import EMPTY_PIECE, RECORD_ALIGNMENT, STORE_MAGIC, LevelStore
+from piece_sets import CLASSIC_PIECES
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "levels")
+LEVELS = ["lvl1", "lvl3", "lvl37", "lvl39"]
+PIECE_NAMES = [nom for nom, _ in CLASSIC_PIECES]
+
+
+def load_levels():
+    return [load_level(os.path.join(LEVELS_DIR, level + ".json")) for level in LEVELS]
+
+
+def as_placed_pieces(level):
+    # Format de decode(): indice de variante et position en tuple d'entiers
+    return {
+        nom: {"variante_index": int(info["variante_index"]), "position": tuple(info["position"])}
+        for nom, info in level.items()
+    }
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "levels.iqls")
+
+
+def test_create_empty(store_path):
+    with LevelStore.create(store_path, 5, 11, PIECE_NAMES) as store:
+        assert len(store) == 0
+        assert store.records.dtype == store.dtype
+
+    with open(store_path, "rb") as f:
+        assert f.read(len(STORE_MAGIC)) == STORE_MAGIC
+    assert os.path.getsize(store_path) % RECORD_ALIGNMENT == 0
+
+    store = LevelStore(store_path)
+    assert (store.lignes, store.colonnes) == (5, 11)
+    assert store.piece_names == PIECE_NAMES
+    assert store.max_pieces == len(PIECE_NAMES)
+
+
+def test_round_trip(store_path):
+    levels = load_levels()
+    with LevelStore.create(store_path, 5, 11, PIECE_NAMES) as store:
+        store.append(levels[0], 1)
+        store.extend((level, -1) for level in levels[1:])
+        assert len(store) == len(levels)
+
+    store = LevelStore(store_path)
+    assert isinstance(store.records, np.memmap)
+    assert len(store) == len(levels)
+    for index, level in enumerate(levels):
+        assert store.get(index) == as_placed_pieces(level)
+    assert store.solution_count(0) == 1
+    assert [store.solution_count(index) for index in range(1, len(levels))] == [-1] * (len(levels) - 1)
+
+    # Les emplacements inutilisés portent EMPTY_PIECE
+    placements = store.records["placements"]
+    used = np.count_nonzero(placements["piece"] != EMPTY_PIECE, axis=1)
+    assert used.tolist() == [len(level) for level in levels]
+
+
+def test_filter_with_numpy(store_path):
+    levels = load_levels()
+    with LevelStore.create(store_path, 5, 11, PIECE_NAMES) as store:
+        store.extend((level, index % 2) for index, level in enumerate(levels))
+
+    store = LevelStore(store_path)
+    unique = np.flatnonzero(store.records["solutions"] == 1)
+    assert unique.tolist() == [1, 3]
+    assert [store.get(index) for index in unique] == [as_placed_pieces(levels[1]), as_placed_pieces(levels[3])]
+
+
+def test_update_solution_counts(store_path):
+    levels = load_levels()
+    with LevelStore.create(store_path, 5, 11, PIECE_NAMES) as store:
+        store.extend((level, -1) for level in levels)
+
+    with LevelStore(store_path, "r+") as store:
+        for index in range(len(store)):
+            store.set_solution_count(index, index + 10)
+
+    store = LevelStore(store_path)
+    assert store.records["solutions"].tolist() == [index + 10 for index in range(len(levels))]
+    assert store.get(2) == as_placed_pieces(levels[2])
+
+
+def test_append_after_reading(store_path):
+    levels = load_levels()
+    with LevelStore.create(store_path, 5, 11, PIECE_NAMES) as store:
+        store.append(levels[0])
+        assert len(store) == 1
+        store.append(levels[1], 7)
+        assert len(store) == 2
+        assert store.solution_count(1) == 7
+
+
+def test_read_only(store_path):
+    with LevelStore.create(store_path, 5, 11, PIECE_NAMES) as store:
+        store.append(load_levels()[0])
+
+    store = LevelStore(store_path)
+    with pytest.raises(ValueError):
+        store.append(load_levels()[1])
+    with pytest.raises(ValueError):
+        store.set_solution_count(0, 1)
+
+
+def test_invalid_levels(store_path):
+    with LevelStore.create(store_path, 5, 11, PIECE_NAMES, max_pieces=2) as store:
+        with pytest.raises(ValueError):
+            store.append({"unknown": {"variante_index": 0, "position": [0, 0]}})
+        with pytest.raises(ValueError):
+            store.append(load_levels()[0])  # 9 pièces placées
+
+
+def test_not_a_store(tmp_path):
+    path = tmp_path / "level.iqls"
+    path.write_bytes(b"JSON" + b"\0" * 60)
+    with pytest.raises(ValueError):
+        LevelStore(str(path))
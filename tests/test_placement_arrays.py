@@ -0,0 +1,64 @@
+"""
+Vérifie que les lignes rangées en colonnes (PlacementArrays) et l'index creux qui en est
+déduit décrivent exactement les placements de la matrice.
+"""
+import os
+
+import numpy as np
+import pytest
+
+import disk_cache
+from constraint_matrix_builder import ConstraintMatrixBuilder, SparseIndex
+from level_loader import load_problem
+from parity_pruner import ParityPruner
+from piece_sets import CLASSIC_PIECES
+from placement_table import PlacementTable
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "levels")
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+
+
+def build(level, use_table):
+    plateau, pieces, fixed_pieces = load_problem(os.path.join(LEVELS_DIR, level + ".json"), 5, 11, CLASSIC_PIECES)
+    table = PlacementTable.load(plateau.lignes, plateau.colonnes, pieces) if use_table else None
+    weights = {nom: len(piece.variants[0].rows) for nom, piece in pieces.items()}
+    builder = ConstraintMatrixBuilder(plateau, pieces, weights, fixed_pieces, placement_table=table)
+    matrix, header = builder.create_constraint_matrix()
+    return builder, matrix, header, (plateau, pieces, fixed_pieces)
+
+
+@pytest.mark.parametrize("use_table", [False, True], ids=["search", "table"])
+@pytest.mark.parametrize("level", ["lvl1", "lvl37"])
+def test_arrays_match_matrix(level, use_table):
+    builder, matrix, header, _ = build(level, use_table)
+    arrays = builder.arrays
+    assert len(arrays) == len(matrix)
+    for row in matrix:
+        assert arrays.piece_names[arrays.piece[row.id]] == row.piece.nom
+        assert arrays.variant[row.id] == row.variante_index
+        assert tuple(arrays.origin[row.id].tolist()) == row.position
+        assert tuple(arrays.cells_of(row.id).tolist()) == row.cells
+        assert arrays.fixed[row.id] == row.fixed
+
+    reference = SparseIndex([row.columns for row in matrix], len(header))
+    for name in ("row_offsets", "row_columns", "column_offsets", "column_rows"):
+        assert getattr(builder.index, name) == getattr(reference, name)
+
+
+@pytest.mark.parametrize("level", ["lvl1", "lvl37"])
+def test_parity_deltas_match_cells(level):
+    builder, matrix, _, (plateau, pieces, fixed_pieces) = build(level, False)
+    pruner = ParityPruner(plateau, pieces, fixed_pieces, builder.arrays)
+    colonnes = plateau.colonnes
+    for row in matrix:
+        if row.fixed:
+            continue
+        rows, cols = np.divmod(np.array(row.cells), colonnes)
+        expected = (int(np.sum(1 - 2 * ((rows + cols) % 2))),)
+        expected += tuple(int(np.sum(rows % 3 == band)) for band in range(3))
+        expected += tuple(int(np.sum(cols % 3 == band)) for band in range(3))
+        assert pruner.row_deltas[row.id] == expected
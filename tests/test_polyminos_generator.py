@@ -0,0 +1,70 @@
+"""
+Vérifie le tirage reproductible de GridPolyminoGenerator et l'export des plateaux générés.
+"""
+import random
+
+import pytest
+
+from polyminos_generator import GridPolyminoGenerator
+
+BOARDS = [(4, 4, 1), (5, 11, 3), (6, 10, 42), (12, 12, 7)]
+
+
+def board_id(board):
+    return "{}x{}-seed{}".format(*board)
+
+
+def generate(rows, cols, seed):
+    generator = GridPolyminoGenerator(rows, cols, seed=seed)
+    generator.generate()
+    return generator
+
+
+@pytest.mark.parametrize("board", BOARDS, ids=board_id)
+def test_same_seed_same_board(board):
+    first = generate(*board)
+    # L'état du module random ne doit pas influencer le tirage
+    random.seed(12345)
+    second = generate(*board)
+    assert first.get_piece_definitions() == second.get_piece_definitions()
+    assert first.grid == second.grid
+
+
+@pytest.mark.parametrize("board", BOARDS, ids=board_id)
+def test_board_is_fully_tiled(board):
+    generator = generate(*board)
+    rows, cols, _ = board
+    cells = [cell for polyomino in generator.polyominos for cell in polyomino]
+    assert len(cells) == len(set(cells)) == rows * cols
+    assert all(generator.grid[x][y] != -1 for x in range(rows) for y in range(cols))
+
+
+def test_seed_is_kept_without_explicit_seed():
+    generator = GridPolyminoGenerator(5, 11)
+    generator.generate()
+    replay = generate(5, 11, generator.seed)
+    assert replay.get_piece_definitions() == generator.get_piece_definitions()
+
+
+@pytest.mark.parametrize("board", BOARDS, ids=board_id)
+def test_dict_round_trip(board):
+    generator = generate(*board)
+    restored = GridPolyminoGenerator.from_dict(generator.to_dict())
+    assert restored.seed == generator.seed
+    assert (restored.rows, restored.cols) == (generator.rows, generator.cols)
+    assert restored.polyominos == generator.polyominos
+    assert restored.grid == generator.grid
+    assert restored.get_piece_definitions() == generator.get_piece_definitions()
+    assert restored.to_dict() == generator.to_dict()
+
+
+@pytest.mark.parametrize("board", BOARDS, ids=board_id)
+def test_save_load_round_trip(board, tmp_path):
+    generator = generate(*board)
+    path = tmp_path / "board.json"
+    generator.save(str(path))
+    restored = GridPolyminoGenerator.load(str(path))
+    assert restored.seed == generator.seed
+    assert restored.grid == generator.grid
+    assert restored.get_piece_definitions() == generator.get_piece_definitions()
+    assert restored.to_dict() == generator.to_dict()
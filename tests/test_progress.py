@@ -0,0 +1,56 @@
+"""
+Vérifie que les événements de progression et les étapes publiées sont des copies figées
+de la branche en cours, et non la liste modifiée par la recherche.
+"""
+import pytest
+
+from algo_x_knuth import AlgorithmX
+from level_loader import build_pieces
+from piece_sets import CLASSIC_PIECES
+from plateau import Plateau
+from progress import ProgressPublisher
+
+SEARCHES = [{"search": "recursive"}, {"search": "iterative"}]
+
+
+def build_algo(events):
+    # Sans cassage de symétrie: chaque solution énumérée donne un événement "solution"
+    algo = AlgorithmX(Plateau(5, 11), build_pieces(CLASSIC_PIECES), "descender", symmetry_breaking=False)
+    # Publication à chaque vérification (tous les CHECK_INTERVAL noeuds)
+    algo.progress = ProgressPublisher(callback=lambda event: events.append((event, list(event["partial"]))),
+                                      interval=0)
+    return algo
+
+
+def test_published_partials_are_snapshots():
+    events = []
+    algo = build_algo(events)
+    solutions = [list(solution) for solution in algo.solve_all(max_solutions=20)]
+    assert len(solutions) == 20
+    progress = [(event, partial) for event, partial in events if event["type"] == "progress"]
+    assert progress
+    # La recherche a continué après chaque publication: les branches publiées n'ont pas bougé
+    assert all(event["partial"] == partial for event, partial in events)
+    assert [event["partial"] for event, _ in events if event["type"] == "solution"] == solutions
+
+
+@pytest.mark.parametrize("options", SEARCHES, ids=lambda options: options["search"])
+def test_current_steps_after_solve(options):
+    algo = AlgorithmX(Plateau(5, 11), build_pieces(CLASSIC_PIECES), "descender", **options)
+    solutions = algo.solve()
+    steps = algo.get_current_solution_steps()
+    assert steps == solutions[0]
+    steps.pop()
+    assert algo.get_current_solution_steps() == solutions[0]
+
+
+def test_current_steps_after_stop():
+    algo = AlgorithmX(Plateau(5, 11), build_pieces(CLASSIC_PIECES), "descender", search="iterative")
+    algo.solve(node_limit=5)
+    steps = algo.get_current_solution_steps()
+    assert 0 < len(steps) <= 5
+
+    # Reprise: la copie prise à l'arrêt n'est pas modifiée par la suite de la recherche
+    state = algo.save_search_state()
+    AlgorithmX(Plateau(5, 11), build_pieces(CLASSIC_PIECES), "descender", search="iterative").solve(resume_state=state)
+    assert algo.get_current_solution_steps() == steps
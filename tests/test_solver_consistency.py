@@ -0,0 +1,126 @@
+"""
+Vérifie que les options du solveur (moteurs, parcours, pruning, cassage de symétrie,
+table des placements) ne changent pas les solutions trouvées.
+"""
+import json
+import os
+from functools import lru_cache, partial
+
+import pytest
+
+import algo_x_knuth
+from algo_x_knuth import AlgorithmX
+from level_loader import build_pieces, load_level, load_problem, solution_to_placed_pieces
+from matrix_engine import MatrixEngine
+from piece_sets import CLASSIC_PIECES
+from plateau import Plateau
+from polyminos_generator import GridPolyminoGenerator
+from solution_validator import SolutionValidator
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "levels")
+LEVELS = ["lvl1", "lvl3", "lvl37", "lvl39"]
+
+# Plateaux générés (lignes, colonnes, graine), assez petits pour tout énumérer.
+GENERATED_BOARDS = [(4, 4, 1), (4, 4, 2), (4, 5, 3), (4, 5, 7)]
+
+OPTIONS = [
+    {"engine": "matrix"},
+    {"engine": "dlx"},
+    {"engine": "bitset"},
+    {"engine": "matrix", "search": "iterative"},
+    {"engine": "dlx", "search": "iterative"},
+    {"engine": "bitset", "search": "iterative"},
+    {"shape_pruning": False},
+    {"parity_pruning": False},
+    {"shape_pruning": False, "parity_pruning": False},
+    {"symmetry_breaking": False},
+    {"placement_cache": False},
+]
+
+
+def option_id(options):
+    return ",".join(f"{key}={value}" for key, value in options.items())
+
+
+def build_problem(case):
+    """
+    Construit (plateau, pièces, pièces fixées) d'un cas: ("level", nom) ou
+    ("generated", lignes, colonnes, graine).
+    """
+    if case[0] == "level":
+        return load_problem(os.path.join(LEVELS_DIR, case[1] + ".json"), 5, 11, CLASSIC_PIECES)
+    _, lignes, colonnes, seed = case
+    generator = GridPolyminoGenerator(lignes, colonnes, seed=seed)
+    generator.generate()
+    return Plateau(lignes, colonnes), build_pieces(generator.get_piece_definitions()), {}
+
+
+def solution_key(solution):
+    return json.dumps(solution_to_placed_pieces(solution), sort_keys=True)
+
+
+@lru_cache(maxsize=None)
+def reference_solutions(case):
+    """
+    Solutions de référence (ensemble de clés), sans pruning ni cassage de symétrie.
+    """
+    plateau, pieces, fixed_pieces = build_problem(case)
+    algo = AlgorithmX(plateau, pieces, "descender", fixed_pieces, shape_pruning=False,
+                      parity_pruning=False, symmetry_breaking=False, placement_cache=False)
+    return frozenset(solution_key(solution) for solution in algo.solve_all())
+
+
+def check_options(case, options):
+    expected = reference_solutions(case)
+    assert expected
+
+    plateau, pieces, fixed_pieces = build_problem(case)
+    algo = AlgorithmX(plateau, pieces, "descender", fixed_pieces, **options)
+    solutions = [solution_key(solution) for solution in algo.solve_all()]
+    assert len(solutions) == len(set(solutions))
+    assert set(solutions) == expected
+
+    plateau, pieces, fixed_pieces = build_problem(case)
+    assert AlgorithmX(plateau, pieces, "descender", fixed_pieces, **options).count_solutions() == len(expected)
+
+    # Première solution (parcours récursif ou itératif selon les options)
+    plateau, pieces, fixed_pieces = build_problem(case)
+    solutions = AlgorithmX(plateau, pieces, "descender", fixed_pieces, **options).solve()
+    assert len(solutions) == 1
+    assert SolutionValidator(pieces, plateau).validate_solution(solutions[0])
+    assert solution_key(solutions[0]) in expected
+
+
+@pytest.mark.parametrize("options", OPTIONS, ids=option_id)
+@pytest.mark.parametrize("level", LEVELS)
+def test_levels(level, options):
+    check_options(("level", level), options)
+
+
+@pytest.mark.parametrize("options", OPTIONS, ids=option_id)
+@pytest.mark.parametrize("board", GENERATED_BOARDS, ids=lambda board: "{}x{}-seed{}".format(*board))
+def test_generated_boards(board, options):
+    check_options(("generated",) + board, options)
+
+
+@pytest.mark.parametrize("case", [("level", level) for level in LEVELS] + [("generated",) + board for board in GENERATED_BOARDS])
+def test_matrix_incremental_counts(case, monkeypatch):
+    # Les compteurs incrémentaux choisissent les mêmes colonnes que le recomptage complet
+    monkeypatch.setitem(algo_x_knuth.ENGINES, "matrix-recount", partial(MatrixEngine, incremental_counts=False))
+    results = []
+    for engine in ("matrix", "matrix-recount"):
+        plateau, pieces, fixed_pieces = build_problem(case)
+        algo = AlgorithmX(plateau, pieces, "descender", fixed_pieces, engine=engine)
+        solutions = algo.solve()
+        results.append(([solution_key(solution) for solution in solutions], algo.get_stats()["branches_explored"]))
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("level", LEVELS)
+@pytest.mark.parametrize("parity_pruning", [True, False])
+def test_fixed_pieces_on_unstamped_plateau(level, parity_pruning):
+    # Pièces fixées transmises à AlgorithmX sans être posées sur le plateau
+    fixed_pieces = load_level(os.path.join(LEVELS_DIR, level + ".json"))
+    algo = AlgorithmX(Plateau(5, 11), build_pieces(CLASSIC_PIECES), "descender", fixed_pieces,
+                      parity_pruning=parity_pruning)
+    assert algo.count_solutions() == 1
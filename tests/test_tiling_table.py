@@ -0,0 +1,59 @@
+"""
+Vérifie le chargement (mémorisé par processus) et l'enregistrement (fusionné) des tables de pavage.
+"""
+import pytest
+
+import disk_cache
+import tiling_table
+from level_loader import build_pieces
+from piece_sets import CLASSIC_PIECES
+from tiling_table import TilingTable
+
+# Zones de 5 cellules: une barre droite (pavée par la pièce en I) et une croix
+BAR = [(0, j) for j in range(5)]
+CROSS = [(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(tiling_table, "_loaded_shapes", {})
+
+
+def test_load_reads_disk_once(monkeypatch):
+    reads = []
+    load_json = tiling_table.load_json
+    monkeypatch.setattr(tiling_table, "load_json", lambda name: reads.append(name) or load_json(name))
+
+    first = TilingTable.load(build_pieces(CLASSIC_PIECES))
+    first.tilings(BAR)
+    second = TilingTable.load(build_pieces(CLASSIC_PIECES))
+    assert len(reads) == 1
+    assert second.shapes is first.shapes
+    assert tiling_table.canonical_shape(BAR) in second.shapes
+
+
+def test_save_merges_with_disk():
+    # Deux processus partis de la même table vide calculent chacun une forme différente
+    first = TilingTable.load(build_pieces(CLASSIC_PIECES))
+    first.tilings(BAR)
+    tiling_table._loaded_shapes.clear()
+    second = TilingTable.load(build_pieces(CLASSIC_PIECES))
+    second.tilings(CROSS)
+
+    first.save()
+    second.save()
+    tiling_table._loaded_shapes.clear()
+    saved = TilingTable.load(build_pieces(CLASSIC_PIECES)).shapes
+    assert tiling_table.canonical_shape(BAR) in saved
+    assert tiling_table.canonical_shape(CROSS) in saved
+
+
+def test_tables_of_same_shapes_share_classes():
+    # Noms différents, mêmes formes: même fichier, mêmes indices de classes
+    renamed = [(nom.upper(), forme) for nom, forme in CLASSIC_PIECES]
+    first = TilingTable.load(build_pieces(CLASSIC_PIECES))
+    second = TilingTable.load(build_pieces(renamed))
+    assert second.shapes is first.shapes
+    assert second.class_limits == first.class_limits
+    assert all(second.class_of[nom.upper()] == k for nom, k in first.class_of.items())